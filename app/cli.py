@@ -0,0 +1,53 @@
+"""Maintenance commands: `python -m app.cli <command>`."""
+import argparse
+
+from sqlmodel import Session
+
+import app.main  # noqa: F401  registers every model on the metadata
+from app.core.blobs import prune
+from app.core.counters import repair_counters
+from app.core.permissions import rebuild_effective_permissions
+from app.db.session import engine
+
+
+def repair_counters_command(args: argparse.Namespace) -> None:
+    with Session(engine) as session:
+        fixed = repair_counters(session)
+    print(f"Repaired version_count on {fixed['documents']} documents, "
+          f"status counts on {fixed['projects']} projects")
+
+
+def rebuild_permissions_command(args: argparse.Namespace) -> None:
+    with Session(engine) as session:
+        rows = rebuild_effective_permissions(session)
+        session.commit()
+    print(f"Rebuilt {rows} effective permissions")
+
+
+def prune_attachments_command(args: argparse.Namespace) -> None:
+    with Session(engine) as session:
+        removed = prune(session, args.grace_hours * 3600)
+    print(f"Removed {removed} unreferenced attachment blobs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    repair = commands.add_parser("repair-counters", help="Recompute denormalized document and project counters")
+    repair.set_defaults(handler=repair_counters_command)
+
+    rebuild = commands.add_parser("rebuild-permissions", help="Recompute the effective permission table from all grants")
+    rebuild.set_defaults(handler=rebuild_permissions_command)
+
+    prune_blobs = commands.add_parser("prune-attachments", help="Delete attachment blobs no attachment refers to")
+    prune_blobs.add_argument("--grace-hours", type=float, default=24,
+                             help="Keep blobs modified more recently than this, they may belong to uploads in flight")
+    prune_blobs.set_defaults(handler=prune_attachments_command)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Admission control: per route class concurrency limits with a bounded wait queue.
+
+Every request is sorted into a class (`auth`, `write`, `read`, `export`,
+`files`); each class admits a fixed number of concurrent requests and lets
+a bounded number more wait for a slot. A request that finds the queue
+full, or waits longer than `ADMISSION_QUEUE_TIMEOUT_SECONDS`, gets an
+immediate 503 with `Retry-After` instead of piling up in front of the
+threadpool, so a burst of bcrypt logins or large writes cannot starve
+cheap reads.
+
+Limits are per worker process. The sum of the class concurrencies must
+stay below `SERVER_THREADPOOL_SIZE`, so admitted sync routes never queue
+for a thread behind each other; `app.main` refuses to start otherwise.
+"""
+import asyncio
+import threading
+from typing import Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+READ_METHODS = {"GET", "HEAD"}
+
+# never limited: probes, docs, and SSE streams that stay open for hours
+EXEMPT_PATHS = {"/", "/health", "/docs", "/redoc", "/openapi.json"}
+
+
+def route_class(scope: Scope) -> Optional[str]:
+    """Admission class of a request, or None when it bypasses admission control."""
+    path = scope["path"]
+    method = scope["method"]
+    if method == "OPTIONS" or path in EXEMPT_PATHS or path.endswith("/events"):
+        return None
+    if path.startswith("/auth/"):
+        return "auth"
+    if path.endswith("/export") or path == "/sync":
+        return "export"
+    # uploads and downloads hold their slot for the whole transfer
+    if "/attachments" in path:
+        return "files"
+    if method not in READ_METHODS:
+        return "write"
+    return "read"
+
+
+class RouteLimiter:
+    def __init__(self, concurrency: int, queue_size: int):
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # one semaphore per event loop; tests start a new loop per TestClient
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def acquire(self, timeout: float) -> bool:
+        semaphore = self._get_semaphore()
+        if semaphore.locked() or self.waiting:
+            if self.waiting >= self.queue_size:
+                self._count("rejected")
+                return False
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout)
+            except asyncio.TimeoutError:
+                self._count("rejected")
+                return False
+            finally:
+                self.waiting -= 1
+        else:
+            await semaphore.acquire()
+
+        self.in_flight += 1
+        self._count("admitted")
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class AdmissionMiddleware:
+    def __init__(self, app: ASGIApp, limits: dict[str, tuple[int, int]],
+                 queue_timeout: float, retry_after: int):
+        self.app = app
+        self.limiters = {name: RouteLimiter(*limit) for name, limit in limits.items()}
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        limiters.update(self.limiters)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # sequential POST /batch sub-requests run one at a time inside the slot
+        # their batch already holds; parallel ones each take a thread, so each
+        # is admitted in its own class
+        if scope["type"] != "http" or scope.get("batch") == "sequential":
+            await self.app(scope, receive, send)
+            return
+
+        name = route_class(scope)
+        limiter = self.limiters.get(name)
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire(self.queue_timeout):
+            response = JSONResponse(
+                {"detail": "Server is busy, retry later"},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+
+limiters: dict[str, RouteLimiter] = {}
+
+
+def get_admission_stats() -> list[dict]:
+    return [
+        {
+            "route_class": name,
+            "concurrency": limiter.concurrency,
+            "queue_size": limiter.queue_size,
+            "in_flight": limiter.in_flight,
+            "waiting": limiter.waiting,
+            "admitted": limiter.admitted,
+            "rejected": limiter.rejected,
+        }
+        for name, limiter in limiters.items()
+    ]
@@ -0,0 +1,167 @@
+"""Content-addressed file store behind document attachments.
+
+Bytes live on disk under `ATTACHMENT_DIR` at `ab/cd/<sha256>`; the database
+keeps only metadata. An upload is streamed chunk by chunk into a temporary
+file while it is hashed, then renamed to its digest, so identical files are
+stored once and a half-written upload never appears under a digest name.
+Neither direction ever holds a whole file in memory.
+
+Deleting an attachment row leaves its blob behind: another row may share
+it, or an upload of the same bytes may be between its rename and its
+INSERT. `prune()` removes blobs no row refers to once they are older than
+a grace period, and storing an existing blob refreshes its mtime.
+"""
+import hashlib
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import quote
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models.attachment import Attachment
+
+
+# bytes gathered before one write, so a thread hop covers many network chunks
+WRITE_BUFFER = 1024 * 1024
+
+# octet-stream body for `openapi_extra`
+UPLOAD_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/octet-stream": {"schema": {"type": "string", "format": "binary"}}},
+    }
+}
+
+
+class StoredBlob(NamedTuple):
+    sha256: str
+    size: int
+
+
+def _root() -> Path:
+    return Path(settings.ATTACHMENT_DIR)
+
+
+def _relative_path(sha256: str) -> str:
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def blob_path(sha256: str) -> Path:
+    return _root() / _relative_path(sha256)
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Attachments are limited to {settings.ATTACHMENT_MAX_BYTES} bytes"
+    )
+
+
+def _commit_blob(temp_path: Path, sha256: str) -> None:
+    path = blob_path(sha256)
+    if path.exists():
+        temp_path.unlink()
+        os.utime(path)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(temp_path, path)
+
+
+async def store_upload(request: Request) -> StoredBlob:
+    """Stream the request body into the store; returns its digest and size."""
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > settings.ATTACHMENT_MAX_BYTES:
+        raise _too_large()
+
+    temp_dir = _root() / "tmp"
+    await run_in_threadpool(temp_dir.mkdir, parents=True, exist_ok=True)
+    temp_path = temp_dir / uuid.uuid4().hex
+    digest = hashlib.sha256()
+    size = 0
+    buffer = bytearray()
+    file = await run_in_threadpool(open, temp_path, "wb")
+    try:
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > settings.ATTACHMENT_MAX_BYTES:
+                raise _too_large()
+            digest.update(chunk)
+            buffer += chunk
+            if len(buffer) >= WRITE_BUFFER:
+                await run_in_threadpool(file.write, bytes(buffer))
+                buffer.clear()
+        if buffer:
+            await run_in_threadpool(file.write, bytes(buffer))
+        await run_in_threadpool(file.flush)
+        await run_in_threadpool(os.fsync, file.fileno())
+    except BaseException:
+        file.close()
+        temp_path.unlink(missing_ok=True)
+        raise
+    file.close()
+
+    if size == 0:
+        temp_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Empty upload"
+        )
+
+    sha256 = digest.hexdigest()
+    await run_in_threadpool(_commit_blob, temp_path, sha256)
+    return StoredBlob(sha256, size)
+
+
+def file_response(request: Request, attachment: Attachment) -> Response:
+    """Download response for an attachment, with Range support and no copy through Python when possible.
+
+    `FileResponse` answers `Range` / `If-Range` itself and hands the whole
+    file to servers that support `http.response.pathsend`. With
+    `ATTACHMENT_ACCEL_REDIRECT` set, the reverse proxy sends the file
+    instead, with sendfile, ranges included.
+    """
+    etag = f'"{attachment.sha256}"'
+    # no-transform: the compression middleware must not re-encode file bytes
+    headers = {"ETag": etag, "Cache-Control": "private, no-transform"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    path = blob_path(attachment.sha256)
+    if not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Attachment content not found"
+        )
+
+    if settings.ATTACHMENT_ACCEL_REDIRECT:
+        headers["X-Accel-Redirect"] = settings.ATTACHMENT_ACCEL_REDIRECT.rstrip("/") + "/" + _relative_path(attachment.sha256)
+        headers["Content-Disposition"] = f"attachment; filename*=utf-8''{quote(attachment.filename)}"
+        return Response(media_type=attachment.content_type, headers=headers)
+
+    return FileResponse(path, media_type=attachment.content_type, filename=attachment.filename, headers=headers)
+
+
+def prune(session: Session, grace_seconds: float) -> int:
+    """Delete blobs that no attachment refers to and that are older than `grace_seconds`."""
+    root = _root()
+    if not root.is_dir():
+        return 0
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    for path in root.glob("??/??/*"):
+        if path.stat().st_mtime > cutoff:
+            continue
+        if session.exec(select(Attachment.id).where(Attachment.sha256 == path.name).limit(1)).first() is None:
+            path.unlink(missing_ok=True)
+            removed += 1
+    for path in (root / "tmp").glob("*"):
+        if path.stat().st_mtime <= cutoff:
+            path.unlink(missing_ok=True)
+    return removed
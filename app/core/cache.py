@@ -0,0 +1,298 @@
+"""Server-side cache for GET responses with tag-based invalidation.
+
+Every entry is stored under a key built from the route, its query string,
+the caller's permission class and the current generation of each tag the
+entry depends on (`project:1`, `document:5`, `access:1`). Service mutation
+methods call `invalidate()` after they commit, which bumps the generation of
+the touched tags: later lookups build different keys and never see the old
+entry, which simply ages out of the backend.
+
+The in-process LRU backend keeps tag generations in memory, so it is only
+correct for a single worker process. Use `CACHE_BACKEND=sqlite` to share
+entries and generations between workers on one host.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, NamedTuple, Optional, Protocol
+
+import orjson
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+
+class CacheScope(NamedTuple):
+    """Who may see a cached entry and which writes make it stale."""
+    permission: str
+    tags: tuple[str, ...]
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes) -> None: ...
+
+    def generations(self, tags: tuple[str, ...]) -> list[int]: ...
+
+    def bump(self, tags: tuple[str, ...]) -> None: ...
+
+
+class LRUBackend:
+    """Entries and tag generations in process memory, both bounded LRU maps.
+
+    Generations come from one counter that only grows. A tag that was never
+    bumped, or whose generation was evicted, reads as `_floor`, the counter
+    value at the last eviction. Every generation an evicted tag ever had is
+    at most that value, and any later bump is above it, so an eviction can
+    only turn entries into misses, never revive a stale one.
+    """
+    def __init__(self, max_entries: int, ttl: float, max_tags: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_tags = max_tags
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._generations: OrderedDict[str, int] = OrderedDict()
+        self._counter = 0
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generations(self, tags: tuple[str, ...]) -> list[int]:
+        with self._lock:
+            result = []
+            for tag in tags:
+                generation = self._generations.get(tag)
+                if generation is None:
+                    result.append(self._floor)
+                else:
+                    self._generations.move_to_end(tag)
+                    result.append(generation)
+            return result
+
+    def bump(self, tags: tuple[str, ...]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._counter += 1
+                self._generations[tag] = self._counter
+                self._generations.move_to_end(tag)
+            while len(self._generations) > self.max_tags:
+                self._generations.popitem(last=False)
+                self._floor = self._counter
+
+
+class SQLiteBackend:
+    """Cache file shared by every worker on the host; one connection per thread."""
+
+    PRUNE_EVERY = 256
+
+    def __init__(self, path: str, max_entries: int, ttl: float):
+        self.path = os.path.abspath(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local = threading.local()
+        self._writes = 0
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tags (tag TEXT PRIMARY KEY, generation INTEGER NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+                                         isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._connection().execute(
+            "SELECT value FROM entries WHERE key = ? AND expires >= ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes) -> None:
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)",
+            (key, value, time.time() + self.ttl)
+        )
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            connection.execute("DELETE FROM entries WHERE expires < ?", (time.time(),))
+            connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY expires DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def generations(self, tags: tuple[str, ...]) -> list[int]:
+        placeholders = ",".join("?" * len(tags))
+        rows = dict(self._connection().execute(
+            f"SELECT tag, generation FROM tags WHERE tag IN ({placeholders})", tags
+        ).fetchall())
+        return [rows.get(tag, 0) for tag in tags]
+
+    def bump(self, tags: tuple[str, ...]) -> None:
+        self._connection().executemany(
+            "INSERT INTO tags (tag, generation) VALUES (?, 1) "
+            "ON CONFLICT(tag) DO UPDATE SET generation = generation + 1",
+            [(tag,) for tag in tags]
+        )
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+def create_backend() -> Optional[CacheBackend]:
+    if settings.CACHE_BACKEND == "memory":
+        return LRUBackend(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS, settings.CACHE_MAX_TAGS)
+    if settings.CACHE_BACKEND == "sqlite":
+        return SQLiteBackend(settings.CACHE_SQLITE_PATH, settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+    return None
+
+
+backend: Optional[CacheBackend] = create_backend()
+stats = CacheStats()
+
+
+def invalidate(*tags: str) -> None:
+    """Make every entry depending on `tags` stale; call after the write commits."""
+    if backend is None or not tags:
+        return
+    backend.bump(tags)
+    stats.count("invalidations")
+
+
+def get_cache_stats() -> dict:
+    return {
+        "backend": settings.CACHE_BACKEND,
+        "hits": stats.hits,
+        "misses": stats.misses,
+        "not_modified": stats.not_modified,
+        "invalidations": stats.invalidations,
+    }
+
+
+def _entry_key(namespace: str, parts: tuple, scope: CacheScope) -> str:
+    generations = backend.generations(scope.tags)
+    raw = repr((namespace, parts, scope.permission, scope.tags, generations))
+    return f"{namespace}:" + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def memoize(name: str, parts: tuple, tags: tuple[str, ...], load: Callable[[], Any]) -> Any:
+    """Cache a small JSON-able value such as a permission lookup; None is never stored."""
+    if backend is None:
+        return load()
+
+    key = _entry_key(name, parts, CacheScope("", tags))
+    cached = backend.get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    value = load()
+    if value is not None:
+        backend.set(key, orjson.dumps(value))
+    return value
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def encode(value: Any, response_model: Any) -> bytes:
+    """Body bytes for `value`, exactly as the route would have rendered it."""
+    if isinstance(value, Response):
+        return value.body
+    adapter = _adapter(response_model)
+    return adapter.dump_json(adapter.validate_python(value))
+
+
+def _response(request: Request, key: str, body: Optional[bytes], hit: bool) -> Response:
+    etag = f'"{key.rsplit(":", 1)[1]}"'
+    headers = {"ETag": etag, "X-Cache": "HIT" if hit else "MISS", "Vary": "Authorization"}
+    if request.headers.get("if-none-match") == etag:
+        stats.count("not_modified")
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _request_parts(request: Request) -> tuple:
+    return (request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+
+def cached_response(request: Request, scope: Optional[CacheScope],
+                    build: Callable[[], Any], response_model: Any) -> Any:
+    """Serve `build()` for this request from the cache when `scope` allows it.
+
+    A `None` scope (entity missing, caller without access) bypasses the cache
+    so `build()` raises the usual 404/403.
+    """
+    if backend is None or scope is None:
+        return build()
+
+    key = _entry_key("response", _request_parts(request), scope)
+    body = backend.get(key)
+    if body is not None:
+        stats.count("hits")
+        return _response(request, key, body, hit=True)
+
+    stats.count("misses")
+    body = encode(build(), response_model)
+    backend.set(key, body)
+    return _response(request, key, body, hit=False)
+
+
+async def cached_response_async(request: Request, scope: Optional[CacheScope],
+                                build: Callable[[], Awaitable[Any]], response_model: Any) -> Any:
+    if backend is None or scope is None:
+        return await build()
+
+    key = _entry_key("response", _request_parts(request), scope)
+    body = backend.get(key)
+    if body is not None:
+        stats.count("hits")
+        return _response(request, key, body, hit=True)
+
+    stats.count("misses")
+    body = encode(await build(), response_model)
+    backend.set(key, body)
+    return _response(request, key, body, hit=False)
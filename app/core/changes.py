@@ -0,0 +1,135 @@
+"""Change log behind GET /sync.
+
+Write paths call `record_change` inside their own transaction, so the log
+entry commits or rolls back together with the change it describes. Each
+entity keeps only its latest row, which is all a syncing client needs: the
+log never grows past the number of entities ever created, and a sync reads
+only the rows after the client's `since` through the `seq` indexes.
+
+A client resumes after the highest `seq` it has seen, which is only safe if
+no smaller `seq` can still commit afterwards. SQLite has a single writer, so
+that holds there; on PostgreSQL a sequence value is drawn at INSERT but
+shows at COMMIT, so every writer of the log first takes a transaction-level
+advisory lock and writers commit in the order they drew their `seq`.
+"""
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+from sqlalchemy import delete, exists, func, insert, literal, null, tuple_
+from sqlmodel import Session, select
+
+from app.models.audit_log import EntityType
+from app.models.change_log import ChangeLog, ChangeOp
+from app.models.document import Document
+from app.models.project import Project
+from app.models.project_access import ProjectAccess
+
+
+# pairs per DELETE ... WHERE (entity_id, project_id) IN (...), under SQLite's bind limit
+_DELETE_CHUNK = 500
+
+# pg_advisory_xact_lock key shared by every writer of the change log
+_WRITE_LOCK_KEY = 7039
+
+
+def _lock_log(session: Session) -> None:
+    """Hold the change log's write lock until the caller's transaction ends."""
+    if session.get_bind().dialect.name == "postgresql":
+        session.exec(select(func.pg_advisory_xact_lock(_WRITE_LOCK_KEY)))
+
+
+def record_change(session: Session, entity_type: EntityType, entity_id: int, project_id: int,
+                  op: ChangeOp = ChangeOp.upsert, user_id: Optional[int] = None) -> None:
+    """Log a change in the caller's transaction; `user_id` is the grantee of access changes."""
+    _lock_log(session)
+    session.exec(
+        delete(ChangeLog).where(
+            ChangeLog.entity_type == entity_type,
+            ChangeLog.entity_id == entity_id
+        )
+    )
+    session.add(ChangeLog(
+        entity_type=entity_type,
+        entity_id=entity_id,
+        project_id=project_id,
+        user_id=user_id,
+        op=op
+    ))
+
+
+def record_changes(session: Session, entity_type: EntityType,
+                   entries: list[tuple[int, int, Optional[int]]], op: ChangeOp = ChangeOp.upsert) -> None:
+    """Set-based `record_change` for many `(entity_id, project_id, user_id)` entries of one type."""
+    if not entries:
+        return
+    _lock_log(session)
+    session.exec(
+        delete(ChangeLog).where(
+            ChangeLog.entity_type == entity_type,
+            ChangeLog.entity_id.in_([entity_id for entity_id, _, _ in entries])
+        )
+    )
+    now = datetime.now(timezone.utc)
+    session.exec(insert(ChangeLog), params=[
+        {"entity_type": entity_type, "entity_id": entity_id, "project_id": project_id,
+         "user_id": user_id, "op": op, "created_at": now}
+        for entity_id, project_id, user_id in entries
+    ])
+
+
+def record_membership_changes(session: Session, appeared: Iterable[tuple[int, int]],
+                              revoked: Iterable[tuple[int, int]]) -> None:
+    """Log `(user_id, project_id)` pairs whose effective access appeared or went.
+
+    Whether the access comes from ownership, a grant or a group, the user's
+    own sync learns from these rows that a project entered or left its view.
+    """
+    revoked = set(revoked)
+    pairs = sorted(set(appeared) | revoked)
+    if not pairs:
+        return
+    _lock_log(session)
+    for start in range(0, len(pairs), _DELETE_CHUNK):
+        session.exec(delete(ChangeLog).where(
+            ChangeLog.entity_type == EntityType.membership,
+            tuple_(ChangeLog.entity_id, ChangeLog.project_id).in_(pairs[start:start + _DELETE_CHUNK])
+        ))
+    now = datetime.now(timezone.utc)
+    session.exec(insert(ChangeLog), params=[
+        {"entity_type": EntityType.membership, "entity_id": user_id, "project_id": project_id,
+         "user_id": user_id, "op": ChangeOp.delete if (user_id, project_id) in revoked else ChangeOp.upsert,
+         "created_at": now}
+        for user_id, project_id in pairs
+    ])
+
+
+def backfill_changes(session: Session) -> int:
+    """Log an upsert for every entity without a change row, e.g. rows older than the log."""
+    _lock_log(session)
+    table = ChangeLog.__table__
+    now = datetime.now(timezone.utc)
+    sources = [
+        (EntityType.project, Project.id, Project.id, None),
+        (EntityType.document, Document.id, Document.project_id, None),
+        (EntityType.access, ProjectAccess.id, ProjectAccess.project_id, ProjectAccess.user_id),
+    ]
+
+    added = 0
+    for entity_type, id_column, project_column, user_column in sources:
+        logged = select(ChangeLog.seq).where(
+            ChangeLog.entity_type == entity_type,
+            ChangeLog.entity_id == id_column
+        )
+        rows = select(
+            literal(entity_type, table.c.entity_type.type),
+            id_column,
+            project_column,
+            user_column if user_column is not None else null(),
+            literal(ChangeOp.upsert, table.c.op.type),
+            literal(now, table.c.created_at.type),
+        ).where(~exists(logged)).order_by(id_column)
+        added += session.exec(
+            insert(ChangeLog).from_select(
+                ["entity_type", "entity_id", "project_id", "user_id", "op", "created_at"], rows
+            )
+        ).rowcount
+    return added
@@ -0,0 +1,276 @@
+"""Response compression negotiated through `Accept-Encoding`.
+
+gzip is always available. brotli (`pip install brotli`) compresses text
+denser and zstd (stdlib `compression.zstd` on 3.14, or `pip install
+zstandard`) compresses faster; both are used only when importable. Bodies
+sent in several chunks (StreamingResponse, NDJSON exports, SSE) are
+compressed chunk by chunk with a sync flush, so clients still receive each
+chunk as soon as the app sends it.
+"""
+import logging
+import threading
+import time
+import zlib
+from typing import Callable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+
+
+class GzipCompressor:
+    def __init__(self):
+        self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self):
+        if zstd is not None:
+            self._compressor = zstd.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL)
+            self._flush_block = zstd.ZstdCompressor.FLUSH_BLOCK
+            self._flush_frame = zstd.ZstdCompressor.FLUSH_FRAME
+        else:
+            self._compressor = zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compressobj()
+            self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            self._flush_frame = zstandard.COMPRESSOBJ_FLUSH_FINISH
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(self._flush_frame)
+
+
+CODECS: dict[str, Callable] = {"gzip": GzipCompressor}
+if brotli is not None:
+    CODECS["br"] = BrotliCompressor
+if zstd is not None or zstandard is not None:
+    CODECS["zstd"] = ZstdCompressor
+
+
+class CompressionStats:
+    """Per-codec byte counts and compression CPU time, plus skip reasons."""
+
+    def __init__(self):
+        self.codecs: dict[str, dict] = {}
+        self.skipped: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, codec: str, bytes_in: int, bytes_out: int, cpu_seconds: float, finished: bool) -> None:
+        with self._lock:
+            entry = self.codecs.setdefault(
+                codec, {"responses": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0}
+            )
+            entry["responses"] += int(finished)
+            entry["bytes_in"] += bytes_in
+            entry["bytes_out"] += bytes_out
+            entry["cpu_seconds"] += cpu_seconds
+
+    def record_skip(self, reason: str) -> None:
+        with self._lock:
+            self.skipped[reason] = self.skipped.get(reason, 0) + 1
+
+
+stats = CompressionStats()
+
+
+def get_compression_stats() -> dict:
+    with stats._lock:
+        codecs = [
+            {
+                "codec": codec,
+                "responses": entry["responses"],
+                "bytes_in": entry["bytes_in"],
+                "bytes_out": entry["bytes_out"],
+                "ratio": round(entry["bytes_in"] / entry["bytes_out"], 3) if entry["bytes_out"] else 0.0,
+                "cpu_ms": round(entry["cpu_seconds"] * 1000, 3),
+            }
+            for codec, entry in stats.codecs.items()
+        ]
+        return {"codecs": codecs, "skipped": dict(stats.skipped)}
+
+
+def negotiate(accept_encoding: str, available: list[str]) -> Optional[str]:
+    """Pick the codec with the highest client q-value; server order breaks ties."""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                continue
+        weights[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for codec in available:
+        q = weights.get(codec, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = codec, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.split(";", 1)[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or content_type.endswith(COMPRESSIBLE_SUFFIXES)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, codecs: list[str], minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.codecs = [codec for codec in codecs if codec in CODECS]
+        for codec in codecs:
+            if codec not in CODECS:
+                logger.info("Compression codec %s is not installed, skipping", codec)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        codec = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.codecs)
+        if codec is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressingResponder(send, codec, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressingResponder:
+    """Holds back `http.response.start` until the first body chunk decides the encoding."""
+
+    def __init__(self, send: Send, codec: str, minimum_size: int):
+        self._send = send
+        self.codec = codec
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+
+    def skip_reason(self, body: bytes, more_body: bool) -> Optional[str]:
+        status_code = self.start_message["status"]
+        headers = Headers(raw=self.start_message.get("headers", []))
+        if status_code < 200 or status_code in (204, 206, 304):
+            return "status"
+        if "content-encoding" in headers:
+            return "encoded"
+        if "no-transform" in headers.get("cache-control", ""):
+            return "no_transform"
+        if not is_compressible(headers.get("content-type", "")):
+            return "content_type"
+        size = len(body) if not more_body else int(headers.get("content-length", self.minimum_size))
+        if size < self.minimum_size:
+            return "small"
+        return None
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        started = time.thread_time()
+        data = self.compressor.compress(body)
+        data += self.compressor.flush() if more_body else self.compressor.finish()
+        stats.record(self.codec, len(body), len(data), time.thread_time() - started, finished=not more_body)
+        return data
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        if message["type"] == "http.response.pathsend" and not self.passthrough:
+            # the server sends the file itself; there is no body to compress
+            stats.record_skip("pathsend")
+            self.passthrough = True
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            reason = self.skip_reason(body, more_body)
+            if reason is not None:
+                stats.record_skip(reason)
+                self.passthrough = True
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+
+            self.compressor = CODECS[self.codec]()
+            data = self.compress(body, more_body)
+            headers = MutableHeaders(raw=list(self.start_message.get("headers", [])))
+            headers["Content-Encoding"] = self.codec
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(data))
+            self.start_message["headers"] = headers.raw
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        await self._send({"type": "http.response.body", "body": self.compress(body, more_body), "more_body": more_body})
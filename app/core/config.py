@@ -1,3 +1,4 @@
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings
 from functools import lru_cache 
 
@@ -10,12 +11,104 @@ class Settings(BaseSettings):
 
     #DataBase
     DATABASE_URL: str = "sqlite:///.app.db"
+    DATABASE_ASYNC: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+    DATABASE_REPLICA_URLS: list[str] = []
+    DATABASE_REPLICA_RETRY_SECONDS: int = 30
+    DATABASE_INIT_ON_STARTUP: bool = True
+
+    #Connection pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_SLOW_WAIT_MS: int = 100
+
+    #SQLite
+    SQLITE_WAL: bool = True
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE: int = -16000
+    SQLITE_READ_POOL_SIZE: int = 40
+
+    #Compression
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_CODECS: list[str] = ["zstd", "br", "gzip"]
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    #Response cache
+    CACHE_BACKEND: Literal["none", "memory", "sqlite"] = "memory"
+    CACHE_MAX_ENTRIES: int = 2048
+    CACHE_MAX_TAGS: int = 65536
+    CACHE_TTL_SECONDS: float = 300
+    CACHE_SQLITE_PATH: str = ".cache.db"
+
+    #Batch
+    BATCH_MAX_REQUESTS: int = 25
+    BATCH_MAX_PARALLEL: int = 4
+
+    #Server-Sent Events
+    SSE_QUEUE_SIZE: int = 100
+    SSE_HEARTBEAT_SECONDS: float = 15
+    SSE_RETRY_MS: int = 3000
+
+    #Server (python -m app.server)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 1
+    SERVER_LOOP: Literal["auto", "asyncio", "uvloop"] = "auto"
+    SERVER_HTTP: Literal["auto", "h11", "httptools"] = "auto"
+    SERVER_THREADPOOL_SIZE: int = 40
+    SERVER_PRELOAD: bool = True
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30
+
+    #Admission control
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_AUTH_CONCURRENCY: int = 4
+    ADMISSION_AUTH_QUEUE: int = 16
+    ADMISSION_WRITE_CONCURRENCY: int = 8
+    ADMISSION_WRITE_QUEUE: int = 32
+    ADMISSION_READ_CONCURRENCY: int = 18
+    ADMISSION_READ_QUEUE: int = 128
+    ADMISSION_EXPORT_CONCURRENCY: int = 2
+    ADMISSION_EXPORT_QUEUE: int = 4
+    ADMISSION_FILES_CONCURRENCY: int = 6
+    ADMISSION_FILES_QUEUE: int = 16
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
 
     #JWT Settings 
     JWT_SECRET: str = "your-super-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    #Password hashing
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE: int = 32
+
+    #Bulk provisioning
+    BULK_MAX_ROWS: int = 5000
+    BULK_INSERT_BATCH: int = 500
+    BULK_HASH_PROCESSES: int = 0
+
+    #Project deletion
+    DELETION_CHUNK_SIZE: int = 500
+    DELETION_PAUSE_MS: int = 20
+    DELETION_HEARTBEAT_TIMEOUT_SECONDS: int = 120
+
+    #Attachments
+    ATTACHMENT_DIR: str = "attachments"
+    ATTACHMENT_MAX_BYTES: int = 100 * 1024 * 1024
+    ATTACHMENT_ACCEL_REDIRECT: str = ""
+
     class Config:
         env_file = ".env"
         env_file_encoding = "UTF-8"
@@ -0,0 +1,66 @@
+from typing import Optional
+from sqlalchemy import or_, update
+from sqlmodel import Session, func, select
+
+from app.models.document import Document, DocumentStatus
+from app.models.document_version import DocumentVersion
+from app.models.project import Project
+
+
+STATUS_COUNT_COLUMNS = {
+    DocumentStatus.draft: Project.draft_count,
+    DocumentStatus.published: Project.published_count,
+    DocumentStatus.archived: Project.archived_count,
+}
+
+
+def shift_status_counts(session: Session, project_id: int,
+                        added: Optional[DocumentStatus] = None,
+                        removed: Optional[DocumentStatus] = None) -> None:
+    """Move one document between the per-status counters of a project.
+
+    Runs as an atomic `UPDATE ... SET n = n + 1` inside the caller's
+    transaction, so concurrent writers never lose an increment.
+    """
+    if added == removed:
+        return
+
+    values = {}
+    if added is not None:
+        column = STATUS_COUNT_COLUMNS[added]
+        values[column.key] = column + 1
+    if removed is not None:
+        column = STATUS_COUNT_COLUMNS[removed]
+        values[column.key] = column - 1
+
+    session.exec(update(Project).where(Project.id == project_id).values(**values))
+
+
+def repair_counters(session: Session) -> dict[str, int]:
+    """Recompute every counter from the source tables; returns rows fixed per table."""
+    actual_versions = select(func.count(DocumentVersion.id)).where(
+        DocumentVersion.document_id == Document.id
+    ).scalar_subquery()
+    documents_fixed = session.exec(
+        update(Document)
+        .where(Document.version_count != actual_versions)
+        .values(version_count=actual_versions)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+    actual_counts = {
+        column.key: select(func.count(Document.id)).where(
+            Document.project_id == Project.id,
+            Document.status == status
+        ).scalar_subquery()
+        for status, column in STATUS_COUNT_COLUMNS.items()
+    }
+    projects_fixed = session.exec(
+        update(Project)
+        .where(or_(*(column != actual_counts[column.key] for column in STATUS_COUNT_COLUMNS.values())))
+        .values(**actual_counts)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+    session.commit()
+    return {"documents": documents_fixed, "projects": projects_fixed}
@@ -0,0 +1,189 @@
+"""Background deletion of projects.
+
+DELETE /projects/{id} only flags the project `deleting`, which hides it from
+every reader at once, and queues a `ProjectDeletion` job. A worker thread
+then removes the rows under the project bottom-up: versions, attachments,
+documents, grants, change-log entries and finally the project itself.
+Attachment blobs stay on disk until `app.core.blobs.prune`. Each step runs
+in chunks of `DELETION_CHUNK_SIZE`, one short DELETE and commit per chunk,
+with `DELETION_PAUSE_MS` between chunks. Request writers therefore never
+wait behind the SQLite writer lock for more than one chunk.
+
+Every app process runs its own worker, so a job is claimed with a single
+conditional UPDATE before it runs, and only the claiming worker writes to
+it afterwards. Progress counters and a heartbeat are written to the job row
+with every chunk. A running job whose heartbeat is older than
+`DELETION_HEARTBEAT_TIMEOUT_SECONDS` belongs to a worker that died, and
+any worker may claim it again; every step is idempotent, so it simply runs
+again from the start.
+"""
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import and_, delete, func, or_, update
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.db.session import engine
+from app.models.attachment import Attachment
+from app.models.audit_log import EntityType
+from app.models.change_log import ChangeLog
+from app.models.document import Document
+from app.models.document_version import DocumentVersion
+from app.models.group import GroupAccess
+from app.models.project import Project
+from app.models.project_access import ProjectAccess
+from app.models.project_deletion import DeletionStatus, ProjectDeletion
+
+
+logger = logging.getLogger(__name__)
+
+
+def _steps(project_id: int) -> list[tuple[Optional[str], Any, Any]]:
+    """(job counter, primary key column, condition) per table, children first."""
+    document_ids = select(Document.id).where(Document.project_id == project_id)
+    return [
+        ("versions_deleted", DocumentVersion.id, DocumentVersion.document_id.in_(document_ids)),
+        ("attachments_deleted", Attachment.id, Attachment.document_id.in_(document_ids)),
+        ("documents_deleted", Document.id, Document.project_id == project_id),
+        ("grants_deleted", ProjectAccess.id, ProjectAccess.project_id == project_id),
+        ("grants_deleted", GroupAccess.id, GroupAccess.project_id == project_id),
+        # the project's own tombstone and its members' access tombstones stay for GET /sync
+        (None, ChangeLog.seq, (ChangeLog.project_id == project_id) & ChangeLog.entity_type.notin_([EntityType.project, EntityType.membership])),
+    ]
+
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _claimable():
+    """Jobs nobody runs: pending ones, and running ones whose worker stopped beating."""
+    stale = datetime.now(timezone.utc) - timedelta(seconds=settings.DELETION_HEARTBEAT_TIMEOUT_SECONDS)
+    return or_(
+        ProjectDeletion.status == DeletionStatus.pending,
+        and_(
+            ProjectDeletion.status == DeletionStatus.running,
+            or_(ProjectDeletion.heartbeat_at.is_(None), ProjectDeletion.heartbeat_at < stale)
+        )
+    )
+
+
+def _claim(session: Session, job_id: int) -> bool:
+    now = datetime.now(timezone.utc)
+    claimed = session.exec(
+        update(ProjectDeletion)
+        .where(ProjectDeletion.id == job_id, _claimable())
+        .values(status=DeletionStatus.running, claimed_by=WORKER_ID, heartbeat_at=now,
+                started_at=func.coalesce(ProjectDeletion.started_at, now), error=None)
+    ).rowcount
+    session.commit()
+    return claimed == 1
+
+
+def _owned(job_id: int):
+    return (ProjectDeletion.id == job_id) & (ProjectDeletion.claimed_by == WORKER_ID) & (
+        ProjectDeletion.status == DeletionStatus.running)
+
+
+def _update_job(session: Session, job_id: int, **values) -> bool:
+    """Write to the job if this worker still holds it; False once another worker took over."""
+    values["heartbeat_at"] = datetime.now(timezone.utc)
+    if session.exec(update(ProjectDeletion).where(_owned(job_id)).values(**values)).rowcount == 0:
+        session.rollback()
+        logger.warning("Project deletion job %s was taken over by another worker", job_id)
+        return False
+    return True
+
+
+def run_deletion(job_id: int) -> None:
+    chunk_size = settings.DELETION_CHUNK_SIZE
+    with Session(engine) as session:
+        if not _claim(session, job_id):
+            return
+        project_id = session.exec(select(ProjectDeletion.project_id).where(ProjectDeletion.id == job_id)).one()
+
+        for counter, key, condition in _steps(project_id):
+            while True:
+                chunk = select(key).where(condition).limit(chunk_size)
+                deleted = session.exec(
+                    delete(key.class_).where(key.in_(chunk)).execution_options(synchronize_session=False)
+                ).rowcount
+                progress = {counter: getattr(ProjectDeletion, counter) + deleted} if counter is not None else {}
+                if not _update_job(session, job_id, **progress):
+                    return
+                session.commit()
+                if deleted < chunk_size:
+                    break
+                time.sleep(settings.DELETION_PAUSE_MS / 1000)
+
+        session.exec(delete(Project).where(Project.id == project_id))
+        if _update_job(session, job_id, status=DeletionStatus.done, finished_at=datetime.now(timezone.utc)):
+            session.commit()
+
+
+def _mark_failed(job_id: int, error: str) -> None:
+    with Session(engine) as session:
+        session.exec(
+            update(ProjectDeletion).where(_owned(job_id))
+            .values(status=DeletionStatus.failed, error=error[:500], finished_at=datetime.now(timezone.utc))
+        )
+        session.commit()
+
+
+class DeletionWorker:
+    """One daemon thread running queued deletion jobs in order."""
+
+    def __init__(self):
+        self._queue: queue.Queue[int] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, job_id: int) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="project-deletion", daemon=True)
+                self._thread.start()
+        self._queue.put(job_id)
+
+    def resume(self) -> None:
+        """Queue the jobs no live worker runs, e.g. those a stopped process left unfinished."""
+        with Session(engine) as session:
+            job_ids = session.exec(
+                select(ProjectDeletion.id)
+                .where(ProjectDeletion.status.in_([DeletionStatus.pending, DeletionStatus.running]))
+                .order_by(ProjectDeletion.id)
+            ).all()
+        for job_id in job_ids:
+            self.submit(job_id)
+
+    def join(self) -> None:
+        """Block until every queued job has finished."""
+        self._queue.join()
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                job_id = self._queue.get(timeout=settings.DELETION_HEARTBEAT_TIMEOUT_SECONDS)
+            except queue.Empty:
+                # a job claimed by a worker that has since died becomes claimable again
+                try:
+                    self.resume()
+                except Exception:
+                    logger.exception("Looking for unfinished project deletion jobs failed")
+                continue
+            try:
+                run_deletion(job_id)
+            except Exception as exc:
+                logger.exception("Project deletion job %s failed", job_id)
+                _mark_failed(job_id, f"{type(exc).__name__}: {exc}")
+            finally:
+                self._queue.task_done()
+
+
+worker = DeletionWorker()
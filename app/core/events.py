@@ -0,0 +1,144 @@
+"""In-process broker for project change events, streamed as Server-Sent Events.
+
+Service mutation methods call `publish()` after they commit, next to their
+cache `invalidate()` calls. Publishing may happen on a threadpool thread
+(sync routes) or on the event loop (async routes), so every event is handed
+to its subscriber's loop with `call_soon_threadsafe`. Each subscriber owns a
+bounded queue: a client that falls `SSE_QUEUE_SIZE` events behind is
+disconnected instead of growing memory, and reconnects to resync.
+
+Subscribers only see events published by the same worker process; with
+several workers behind a balancer, run a single worker for SSE clients or
+have them fall back to polling.
+"""
+import asyncio
+import itertools
+import threading
+from datetime import datetime, timezone
+from typing import AsyncIterator
+
+import orjson
+
+from app.core.config import settings
+from app.core.serialization import ORJSON_OPTIONS
+
+
+class ChangeEvent:
+    __slots__ = ("id", "event", "data")
+
+    def __init__(self, id: int, event: str, data: dict):
+        self.id = id
+        self.event = event
+        self.data = data
+
+    def encode(self) -> bytes:
+        return b"id: %d\nevent: %s\ndata: %s\n\n" % (
+            self.id, self.event.encode(), orjson.dumps(self.data, option=ORJSON_OPTIONS)
+        )
+
+
+class Subscription:
+    def __init__(self, project_id: int, user_id: int, queue_size: int):
+        self.project_id = project_id
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[ChangeEvent] = asyncio.Queue(queue_size)
+        self.overflowed = False
+
+    def offer(self, event: ChangeEvent) -> None:
+        """Runs on the subscriber's loop; a full queue marks the client as too slow."""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            broker.count("dropped")
+
+
+class EventBroker:
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self.published = 0
+        self.dropped = 0
+        self._ids = itertools.count(1)
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def subscribe(self, project_id: int, user_id: int) -> Subscription:
+        subscription = Subscription(project_id, user_id, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.project_id]
+
+    def publish(self, project_id: int, event: str, data: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(project_id, ()))
+            event = ChangeEvent(next(self._ids), event, data)
+            self.published += 1
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # the subscriber's loop is already closed
+                self.unsubscribe(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+broker = EventBroker(settings.SSE_QUEUE_SIZE)
+
+
+def publish(project_id: int, event: str, **data) -> None:
+    """Push a change event to the project's subscribers; call after the write commits."""
+    data.update(project_id=project_id, at=datetime.now(timezone.utc))
+    broker.publish(project_id, event, data)
+
+
+def get_event_stats() -> dict:
+    return {
+        "subscribers": broker.subscriber_count(),
+        "published": broker.published,
+        "dropped": broker.dropped,
+    }
+
+
+async def event_stream(project_id: int, user_id: int) -> AsyncIterator[bytes]:
+    """SSE body for one subscriber, with comment heartbeats to keep proxies open.
+
+    Ends when the client is too slow to keep up or when it loses access to
+    the project, whether through a direct grant or a group.
+    """
+    subscription = broker.subscribe(project_id, user_id)
+    try:
+        yield b"retry: %d\n\n" % (settings.SSE_RETRY_MS,)
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), settings.SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+
+            if subscription.overflowed:
+                # events were lost; make the client reconnect and refetch
+                yield b"event: overflow\ndata: {}\n\n"
+                return
+            yield event.encode()
+            if event.event == "permission.revoked" and event.data.get("user_id") == user_id:
+                return
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,136 @@
+"""Bounded worker pool for bcrypt.
+
+A bcrypt check costs tens to hundreds of milliseconds of CPU by design.
+Run inline, a login storm occupies every threadpool thread (sync routes) or
+the event loop itself (async routes, which run services through
+`run_sync`). Here hashing runs on `PASSWORD_HASH_WORKERS` dedicated
+threads; bcrypt releases the GIL while it works, so threads are enough. At
+most `PASSWORD_HASH_QUEUE` more calls may wait; past that, callers get an
+immediate 503 instead of queueing without bound.
+
+Bulk provisioning hashes hundreds of passwords at once. It uses
+`hash_many`, which spreads the batch over a separate process pool, so it
+never competes with logins for the request-path threads.
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Optional
+
+import bcrypt
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+
+def bcrypt_hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+class PasswordHashPool:
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.hash_seconds = 0.0
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent password checks, retry later",
+                headers={"Retry-After": "1"}
+            )
+
+        with self._lock:
+            self.pending += 1
+        submitted = time.perf_counter()
+
+        def task() -> Any:
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self._record(started - submitted, time.perf_counter() - started)
+
+        future = self._executor.submit(task)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Blocking call for sync code; the caller's thread only waits, it does not hash."""
+        return self.submit(fn, *args).result()
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def _record(self, wait: float, duration: float) -> None:
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+            self.wait_seconds += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+            self.hash_seconds += duration
+
+
+pool = PasswordHashPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE)
+
+BULK_HASH_PROCESSES = settings.BULK_HASH_PROCESSES or os.cpu_count() or 1
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            _process_pool = ProcessPoolExecutor(
+                max_workers=BULK_HASH_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+
+def hash_many(passwords: list[str]) -> list[str]:
+    """Hash a batch of passwords across the bulk process pool, in input order."""
+    if not passwords:
+        return []
+    executor = _get_process_pool()
+    chunksize = max(1, len(passwords) // (BULK_HASH_PROCESSES * 4))
+    return list(executor.map(
+        bcrypt_hash, passwords, repeat(settings.PASSWORD_BCRYPT_ROUNDS), chunksize=chunksize
+    ))
+
+
+async def hash_many_async(passwords: list[str]) -> list[str]:
+    return await asyncio.to_thread(hash_many, passwords)
+
+
+def get_hashing_stats() -> dict:
+    with pool._lock:
+        completed = pool.completed or 1
+        return {
+            "workers": pool.workers,
+            "queue_size": pool.queue_size,
+            "pending": pool.pending,
+            "completed": pool.completed,
+            "rejected": pool.rejected,
+            "wait_avg_ms": round(pool.wait_seconds / completed * 1000, 3),
+            "wait_max_ms": round(pool.max_wait_seconds * 1000, 3),
+            "hash_avg_ms": round(pool.hash_seconds / completed * 1000, 3),
+        }
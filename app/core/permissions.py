@@ -1,28 +1,205 @@
-from typing import Optional
+from typing import Iterable, NamedTuple, Optional
+from sqlalchemy import case, delete, func, insert, literal, null, true, tuple_, union_all
 from sqlmodel import Session, select
 
+from app.core.cache import memoize
+from app.core.changes import record_membership_changes
+from app.core.events import publish
+from app.db import statements
+from app.models.effective_permission import EffectivePermission
+from app.models.group import GroupAccess, GroupMember
 from app.models.project import Project
 from app.models.project_access import Permission, ProjectAccess
 from app.models.user import User, UserRole
 
+
+# rows per DELETE ... WHERE (user_id, project_id) IN (...), under SQLite's bind limit
+_DELETE_CHUNK = 500
+
+
+class PermissionChanges(NamedTuple):
+    """Effective permissions a refresh added or changed, and the pairs it removed."""
+    granted: dict[tuple[int, int], Permission]
+    revoked: set[tuple[int, int]]
+
+    @property
+    def project_ids(self) -> set[int]:
+        return {project_id for _, project_id in self.granted.keys() | self.revoked}
+
+
+def _rank(permission) -> case:
+    return case((permission == Permission.editor, 2), else_=1)
+
+
+def _effective_select(user_ids: Optional[Iterable[int]], project_ids: Optional[Iterable[int]]):
+    """(user_id, project_id, rank) of the strongest grant from ownership, direct and group access.
+
+    Projects flagged `deleting` grant nothing, so flagging one revokes all access at once.
+    """
+    sources = [
+        (select(Project.owner_id.label("user_id"), Project.id.label("project_id"), literal(2).label("rank"))
+         .where(~Project.deleting),
+         Project.owner_id, Project.id),
+        (select(ProjectAccess.user_id, ProjectAccess.project_id, _rank(ProjectAccess.permission))
+         .join(Project, Project.id == ProjectAccess.project_id).where(~Project.deleting),
+         ProjectAccess.user_id, ProjectAccess.project_id),
+        (select(GroupMember.user_id, GroupAccess.project_id, _rank(GroupAccess.permission))
+         .join(Project, Project.id == GroupAccess.project_id)
+         .where(GroupAccess.group_id == GroupMember.group_id, ~Project.deleting),
+         GroupMember.user_id, GroupAccess.project_id),
+    ]
+    parts = []
+    for statement, user_column, project_column in sources:
+        if user_ids is not None:
+            statement = statement.where(user_column.in_(user_ids))
+        if project_ids is not None:
+            statement = statement.where(project_column.in_(project_ids))
+        parts.append(statement)
+    grants = union_all(*parts).subquery()
+    return select(grants.c.user_id, grants.c.project_id, func.max(grants.c.rank).label("rank")).group_by(
+        grants.c.user_id, grants.c.project_id
+    )
+
+
+def access_report_select(user_id: Optional[int] = None, project_id: Optional[int] = None):
+    """Every (user_id, project_id) with access, with each source's contribution, in one query.
+
+    Unlike `effective_permissions` this reads the sources themselves, admin
+    override included, so a report shows why a user has access as well as
+    which permission wins. Columns: user_id, project_id, rank, owner,
+    direct, group_rank, admin; `direct` and `group_rank` are permission
+    ranks, NULL when that source grants nothing.
+    """
+    none = null()
+    sources = [
+        (select(Project.owner_id.label("user_id"), Project.id.label("project_id"), literal(2).label("rank"),
+                literal(1).label("owner"), none.label("direct"), none.label("group_rank"), none.label("admin"))
+         .where(~Project.deleting),
+         Project.owner_id, Project.id),
+        (select(ProjectAccess.user_id, ProjectAccess.project_id, _rank(ProjectAccess.permission),
+                none, _rank(ProjectAccess.permission), none, none)
+         .join(Project, Project.id == ProjectAccess.project_id).where(~Project.deleting),
+         ProjectAccess.user_id, ProjectAccess.project_id),
+        (select(GroupMember.user_id, GroupAccess.project_id, _rank(GroupAccess.permission),
+                none, none, _rank(GroupAccess.permission), none)
+         .join(Project, Project.id == GroupAccess.project_id)
+         .where(GroupAccess.group_id == GroupMember.group_id, ~Project.deleting),
+         GroupMember.user_id, GroupAccess.project_id),
+        # admin override: every admin reaches every project
+        (select(User.id, Project.id, literal(2), none, none, none, literal(1))
+         .join(Project, true()).where(User.role == UserRole.admin, ~Project.deleting),
+         User.id, Project.id),
+    ]
+    parts = []
+    for statement, user_column, project_column in sources:
+        if user_id is not None:
+            statement = statement.where(user_column == user_id)
+        if project_id is not None:
+            statement = statement.where(project_column == project_id)
+        parts.append(statement)
+    grants = union_all(*parts).subquery()
+    return select(
+        grants.c.user_id,
+        grants.c.project_id,
+        func.max(grants.c.rank).label("rank"),
+        func.max(grants.c.owner).label("owner"),
+        func.max(grants.c.direct).label("direct"),
+        func.max(grants.c.group_rank).label("group_rank"),
+        func.max(grants.c.admin).label("admin"),
+    ).group_by(grants.c.user_id, grants.c.project_id)
+
+
+def permission_for_rank(rank: Optional[int]) -> Optional[Permission]:
+    if rank is None:
+        return None
+    return Permission.editor if rank == 2 else Permission.viewer
+
+
+def refresh_effective_permissions(session: Session, user_ids: Optional[Iterable[int]] = None,
+                                  project_ids: Optional[Iterable[int]] = None) -> PermissionChanges:
+    """Recompute the effective permissions of `user_ids` x `project_ids` (None = all).
+
+    Runs in the caller's transaction, before its commit, and only rewrites
+    the rows that differ. Callers pass the smallest scope their change can
+    affect, e.g. a group's members x the group's projects. Pairs that gain or
+    lose access are logged for GET /sync in the same transaction.
+    """
+    user_ids = None if user_ids is None else sorted(set(user_ids))
+    project_ids = None if project_ids is None else sorted(set(project_ids))
+    if user_ids == [] or project_ids == []:
+        return PermissionChanges({}, set())
+
+    wanted = {
+        (user_id, project_id): permission_for_rank(rank)
+        for user_id, project_id, rank in session.exec(_effective_select(user_ids, project_ids)).all()
+    }
+    current_statement = select(EffectivePermission.user_id, EffectivePermission.project_id, EffectivePermission.permission)
+    if user_ids is not None:
+        current_statement = current_statement.where(EffectivePermission.user_id.in_(user_ids))
+    if project_ids is not None:
+        current_statement = current_statement.where(EffectivePermission.project_id.in_(project_ids))
+    current = {(user_id, project_id): permission for user_id, project_id, permission in session.exec(current_statement).all()}
+
+    revoked = current.keys() - wanted.keys()
+    granted = {pair: permission for pair, permission in wanted.items() if current.get(pair) != permission}
+    stale = sorted(revoked | (granted.keys() & current.keys()))
+    for start in range(0, len(stale), _DELETE_CHUNK):
+        session.exec(delete(EffectivePermission).where(
+            tuple_(EffectivePermission.user_id, EffectivePermission.project_id).in_(stale[start:start + _DELETE_CHUNK])
+        ))
+    if granted:
+        session.exec(insert(EffectivePermission), params=[
+            {"user_id": user_id, "project_id": project_id, "permission": permission}
+            for (user_id, project_id), permission in granted.items()
+        ])
+    record_membership_changes(session, granted.keys() - current.keys(), revoked)
+    return PermissionChanges(granted, revoked)
+
+
+def rebuild_effective_permissions(session: Session) -> int:
+    """Rewrite the whole table from the sources in one INSERT ... SELECT; returns the row count."""
+    session.exec(delete(EffectivePermission))
+    rows = _effective_select(None, None).subquery()
+    return session.exec(
+        insert(EffectivePermission).from_select(
+            ["user_id", "project_id", "permission"],
+            select(rows.c.user_id, rows.c.project_id,
+                   case((rows.c.rank == 2, literal(Permission.editor.value)), else_=literal(Permission.viewer.value)))
+        )
+    ).rowcount
+
+
+def publish_permission_changes(changes: PermissionChanges, actor_id: int) -> None:
+    """Tell project subscribers whose effective access changed; call after the commit."""
+    for (user_id, project_id), permission in changes.granted.items():
+        publish(project_id, "permission.granted", user_id=user_id, permission=permission, actor_id=actor_id)
+    for user_id, project_id in sorted(changes.revoked):
+        publish(project_id, "permission.revoked", user_id=user_id, actor_id=actor_id)
+
+
 def get_user_project_permission(session: Session, user: User, project_id: int) -> Optional[Permission]:
     if user.role == UserRole.admin:
         return Permission.editor
-    
-    project = session.get(Project, project_id)
-    if project and project.owner_id == user.id:
-        return Permission.editor
-    
-    statement = select(ProjectAccess).where(
-        ProjectAccess.project_id == project_id,
-        ProjectAccess.user_id == user.id
+
+    return session.exec(
+        statements.effective_permission,
+        params={"project_id": project_id, "user_id": user.id}
+    ).first()
+
+
+def get_permission_class(session: Session, user: User, project_id: int) -> Optional[str]:
+    """Permission class used in response cache keys; None means no access."""
+    if user.role == UserRole.admin:
+        return "admin"
+
+    def load() -> Optional[str]:
+        permission = get_user_project_permission(session, user, project_id)
+        return permission.value if permission else None
+
+    return memoize(
+        "permission", (user.id, user.role.value, project_id),
+        (f"access:{project_id}", f"project:{project_id}"), load
     )
-    access = session.exec(statement).first()
-    
-    if access:
-        return access.permission
-    
-    return None
 
 
 def can_view_project(session: Session, user: User, project_id: int) -> bool:
@@ -2,29 +2,48 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import bcrypt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core import hashing
 from app.core.config import settings
-from app.db.session import get_session
+from app.db.session import get_async_session, read_engine
 
 
 bearer_scheme = HTTPBearer()
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _check_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
         plain_password.encode("utf-8"),
         hashed_password.encode("utf-8")
     )
 
 
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return hashing.pool.run(_check_password, plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-    return hashed 
+    return hashing.pool.run(hashing.bcrypt_hash, password, settings.PASSWORD_BCRYPT_ROUNDS)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await hashing.pool.run_async(_check_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await hashing.pool.run_async(hashing.bcrypt_hash, password, settings.PASSWORD_BCRYPT_ROUNDS)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when the hash was made with another cost factor than PASSWORD_BCRYPT_ROUNDS."""
+    # bcrypt hashes look like $2b$12$<salt+hash>
+    parts = hashed_password.split("$")
+    return len(parts) < 4 or not parts[2].isdigit() or int(parts[2]) != settings.PASSWORD_BCRYPT_ROUNDS
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -58,42 +77,84 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
-):
-    from app.models.user import User
-
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _get_token_user_id(credentials: HTTPAuthorizationCredentials) -> int:
     token = credentials.credentials 
     payload = decode_access_token(token)
 
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
     user_id: int = payload.get("user_id")
 
     if user_id is None:
-        raise credentials_exception
-    
-    session = next(get_session())
-    user = session.get(User, user_id)
+        raise _credentials_exception()
+
+    return user_id
 
+
+def _check_user_active(user) -> None:
     if user is None:
-            raise credentials_exception
+        raise _credentials_exception()
     
     if not user.is_active:
         raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User is deactivated"
         )
+
+
+def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
+):
+    from app.models.user import User
+
+    # sub-requests of POST /batch reuse the user the batch authenticated
+    batch_user = getattr(request.state, "batch_user", None)
+    if batch_user is not None:
+        return batch_user
+
+    user_id = _get_token_user_id(credentials)
+    
+    # short-lived session: the connection goes back to the pool before the
+    # route handler waits for its own threadpool slot. Never a replica: one
+    # that lags would still let a just-deactivated user in. read_engine is
+    # the primary, or for SQLite a read-only connection to the same file
+    with Session(read_engine) as session:
+        user = session.get(User, user_id)
+        if user is not None:
+            session.expunge(user)
+    _check_user_active(user)
     
     return user 
 
+
+async def get_current_user_async(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    session: AsyncSession = Depends(get_async_session)
+):
+    from app.models.user import User
+
+    batch_user = getattr(request.state, "batch_user", None)
+    if batch_user is not None:
+        return batch_user
+
+    user_id = _get_token_user_id(credentials)
+
+    user = await session.get(User, user_id)
+    _check_user_active(user)
+
+    return user
+
 def require_roles(*allowed_roles: str):
     def role_checker(current_user = Depends(get_current_user)):
         if current_user.role not in allowed_roles:
@@ -109,6 +170,19 @@ def require_admin(current_user = Depends(get_current_user)):
         return False
     return True
 
+def require_roles_async(*allowed_roles: str):
+    async def role_checker(current_user = Depends(get_current_user_async)):
+        if current_user.role not in allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Access denied. Required roles: {', '.join(allowed_roles)}"
+            )
+        return current_user
+    return role_checker
+
+async def require_admin_async(current_user = Depends(get_current_user_async)):
+    return current_user.role == "admin"
+
 
 
 
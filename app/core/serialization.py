@@ -0,0 +1,68 @@
+"""orjson responses and a row-tuple fast path for list endpoints.
+
+List endpoints otherwise load full ORM objects, validate each one against
+the `response_model` and only then encode. Selecting the `schema_columns`
+of the read schema and collecting them with `fetch_rows` gives plain dicts
+that `ORJSONResponse` encodes directly; the column types already are what
+the schema would have produced, so the second validation pass buys nothing
+on this path. `?fields=` narrows the same column map, so a sparse view also
+selects fewer columns.
+"""
+from typing import Any, Iterable, Optional
+
+import orjson
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlmodel import Session, SQLModel, select
+
+
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson; naive datetimes are treated as UTC."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def schema_columns(model: type[SQLModel], schema: type[BaseModel], **derived: Any) -> dict[str, Any]:
+    """Column to select for every field of `schema`, in field order.
+
+    Fields that do not live on `model` (e.g. `creator_email`) are passed as
+    `derived` expressions from a joined table and labelled with the field name.
+    """
+    return {
+        name: derived[name].label(name) if name in derived else getattr(model, name)
+        for name in schema.model_fields
+    }
+
+
+def parse_fields(fields: Optional[str], columns: dict[str, Any]) -> tuple[str, ...]:
+    """Validate a `?fields=a,b` value; no value selects every column."""
+    if fields is None:
+        return tuple(columns)
+
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in columns]
+    if not names or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown) or '(empty)'}. Allowed: {', '.join(columns)}"
+        )
+    return names
+
+
+def select_fields(columns: dict[str, Any], names: Iterable[str]) -> Select:
+    return select(*(columns[name] for name in names))
+
+
+def fetch_rows(session: Session, statement: Select) -> list[dict[str, Any]]:
+    """Run a column select and return its rows as dicts keyed by column name."""
+    keys = tuple(column.key for column in statement.selected_columns)
+    if len(keys) == 1:
+        # a single-column select yields scalars rather than rows
+        return [{keys[0]: value} for value in session.exec(statement)]
+    return [dict(zip(keys, row)) for row in session.exec(statement)]
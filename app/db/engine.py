@@ -0,0 +1,97 @@
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlmodel import create_engine
+
+from app.core.config import settings
+from app.db.pool_metrics import InstrumentedQueuePool
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def is_sqlite_file(url: str) -> bool:
+    database = make_url(url).database
+    return is_sqlite(url) and bool(database) and database != ":memory:"
+
+
+def _sqlite_read_only_url(url: str) -> str:
+    parsed = make_url(url)
+    path = os.path.abspath(parsed.database)
+    return str(parsed.set(database=f"file:{path}", query={"mode": "ro", "uri": "true"}))
+
+
+def apply_sqlite_pragmas(engine: Engine, read_only: bool = False) -> None:
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # journal_mode is persistent in the file and needs write access,
+        # so only the writer switches it; readers inherit WAL from the file
+        if settings.SQLITE_WAL and not read_only:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+        cursor.close()
+
+
+def pool_options(name: str) -> dict:
+    return {
+        "pool_logging_name": name,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def create_db_engine(url: str, read_only: bool = False) -> Engine:
+    """Build an engine for DATABASE_URL.
+
+    For file-backed SQLite the writer gets exactly one connection, so writes
+    queue in the pool instead of failing with `database is locked`, while
+    `read_only=True` returns a pool of `mode=ro` connections that read the
+    WAL concurrently with the writer. Other backends get a pool sized by
+    the DB_POOL_* settings.
+    """
+    name = "read" if read_only else "primary"
+
+    if not is_sqlite(url):
+        return create_engine(
+            url,
+            echo=settings.DEBUG,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            **pool_options(name)
+        )
+
+    connect_args = {"check_same_thread": False}
+    if not is_sqlite_file(url):
+        return create_engine(url, echo=settings.DEBUG, connect_args=connect_args)
+
+    if read_only:
+        engine = create_engine(
+            _sqlite_read_only_url(url),
+            echo=settings.DEBUG,
+            connect_args=connect_args,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.SQLITE_READ_POOL_SIZE,
+            max_overflow=0,
+            **pool_options(name)
+        )
+    else:
+        engine = create_engine(
+            url,
+            echo=settings.DEBUG,
+            connect_args=connect_args,
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            **pool_options(name)
+        )
+
+    apply_sqlite_pragmas(engine, read_only=read_only)
+    return engine
@@ -0,0 +1,105 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """Counters for one engine's pool; survive `engine.dispose()`."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._lock = threading.Lock()
+
+    def record_wait(self, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout, counts pool timeouts and logs slow waits."""
+
+    stats: PoolStats
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record_wait(time.perf_counter() - started)
+            self.stats.record_timeout()
+            logger.warning("Pool %s timed out: %s", self._orig_logging_name, self.status())
+            raise
+
+        waited = time.perf_counter() - started
+        self.stats.record_wait(waited)
+        if waited * 1000 >= settings.DB_POOL_SLOW_WAIT_MS:
+            logger.warning(
+                "Pool %s checkout waited %.1f ms: %s",
+                self._orig_logging_name, waited * 1000, self.status()
+            )
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+_engines: dict[str, Engine] = {}
+
+
+def register_engine(name: str, engine: Engine) -> None:
+    if engine not in _engines.values():
+        _engines[name] = engine
+
+
+def get_pool_stats() -> list[dict]:
+    result = []
+    for name, engine in _engines.items():
+        pool = engine.pool
+        stats: Optional[PoolStats] = getattr(pool, "stats", None)
+        is_queue = isinstance(pool, QueuePool)
+        result.append({
+            "name": name,
+            "pool_class": type(pool).__name__,
+            "size": pool.size() if is_queue else 0,
+            "checked_out": pool.checkedout() if is_queue else 0,
+            "checked_in": pool.checkedin() if is_queue else 0,
+            "overflow": max(pool.overflow(), 0) if is_queue else 0,
+            "checkouts": stats.checkouts if stats else 0,
+            "timeouts": stats.timeouts if stats else 0,
+            "wait_avg_ms": round(stats.wait_total / stats.checkouts * 1000, 3) if stats and stats.checkouts else 0.0,
+            "wait_max_ms": round(stats.wait_max * 1000, 3) if stats else 0.0,
+        })
+    return result
@@ -0,0 +1,90 @@
+import itertools
+import logging
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import Session
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """Round-robin pool of read engines that sidelines replicas failing to connect."""
+
+    def __init__(self, engines: list[Engine], retry_seconds: Optional[float] = None):
+        self.engines = engines
+        self.retry_seconds = settings.DATABASE_REPLICA_RETRY_SECONDS if retry_seconds is None else retry_seconds
+        self._unhealthy_until: dict[Engine, float] = {}
+        self._cycle = itertools.cycle(engines)
+        self._lock = threading.Lock()
+
+        for engine in engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def _on_error(self, context) -> None:
+        # connection is None when the error happened while connecting
+        if context.connection is None or context.is_disconnect:
+            self.mark_unhealthy(context.engine)
+
+    def mark_unhealthy(self, engine: Engine) -> None:
+        with self._lock:
+            self._unhealthy_until[engine] = time.monotonic() + self.retry_seconds
+        logger.warning("Read replica %s marked unhealthy for %ss", engine.url, self.retry_seconds)
+
+    def is_healthy(self, engine: Engine) -> bool:
+        return self._unhealthy_until.get(engine, 0) <= time.monotonic()
+
+    def next_healthy(self) -> Optional[Engine]:
+        with self._lock:
+            for _ in range(len(self.engines)):
+                engine = next(self._cycle)
+                if self.is_healthy(engine):
+                    return engine
+        return None
+
+    def checkout(self) -> Optional[Engine]:
+        """Next healthy replica that accepts a connection, None if all are down."""
+        for _ in range(len(self.engines)):
+            engine = self.next_healthy()
+            if engine is None:
+                return None
+            try:
+                # a pooled checkout, so this costs nothing once the replica is warm
+                engine.connect().close()
+                return engine
+            except DBAPIError:
+                continue
+        return None
+
+
+class RoutingSession(Session):
+    """Session that reads from a replica until the first write, then sticks to the primary.
+
+    One replica is picked per session, so all reads of a request see the same
+    snapshot; once anything is flushed or a DML statement runs, every later
+    statement goes to the primary (read-your-writes).
+    """
+
+    def __init__(self, primary: Engine, replicas: ReplicaSet, **kwargs):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replicas = replicas
+        self.replica: Optional[Engine] = None
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.wrote or self._flushing or clause is None or not getattr(clause, "is_select", False):
+            self.wrote = True
+            return self.primary
+
+        if self.replica is None or not self.replicas.is_healthy(self.replica):
+            self.replica = self.replicas.checkout()
+
+        return self.replica or self.primary
@@ -1,20 +1,164 @@
-from sqlmodel import SQLModel, Session, create_engine
-from typing import Generator
+from fastapi import Request
+from sqlmodel import SQLModel, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import delete, func, inspect, literal, select
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from typing import AsyncGenerator, Generator, Optional
 
+from app.core.changes import backfill_changes
 from app.core.config import settings
+from app.core.counters import repair_counters
+from app.core.permissions import rebuild_effective_permissions
+from app.db.engine import apply_sqlite_pragmas, create_db_engine, is_sqlite, is_sqlite_file, pool_options
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, register_engine
+from app.db.routing import ReplicaSet, RoutingSession
+from app.models.document import Document
+from app.models.effective_permission import EffectivePermission
+from app.models.project import Project
+from app.models.project_access import ProjectAccess
+from app.models.project_deletion import ProjectDeletion
 
 
+READ_METHODS = {"GET", "HEAD"}
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG, 
-    connect_args={"check_same_thread": False}
-)
+engine = create_db_engine(settings.DATABASE_URL)
+
+# read-only connection pool for SQLite files, the primary engine otherwise
+read_engine = create_db_engine(settings.DATABASE_URL, read_only=True) if is_sqlite_file(settings.DATABASE_URL) else engine
+
+# GET requests read from the configured replicas, or from read_engine when there are none
+replicas = ReplicaSet([
+    create_db_engine(url, read_only=True) for url in settings.DATABASE_REPLICA_URLS
+] or ([read_engine] if read_engine is not engine else []))
+
+register_engine("primary", engine)
+register_engine("read", read_engine)
+for index, replica in enumerate(replicas.engines):
+    register_engine(f"replica-{index}", replica)
+
+
+def get_async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto its async driver (aiosqlite / asyncpg)."""
+    scheme, rest = url.split(":", 1)
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite:{rest}"
+    if scheme.startswith("postgres"):
+        return f"postgresql+asyncpg:{rest}"
+    return url
+
+
+async_engine: Optional[AsyncEngine] = None
+
+if settings.DATABASE_ASYNC:
+    if is_sqlite(settings.DATABASE_URL) and not is_sqlite_file(settings.DATABASE_URL):
+        async_engine = create_async_engine(get_async_database_url(settings.DATABASE_URL), echo=settings.DEBUG)
+    else:
+        async_engine = create_async_engine(
+            settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL),
+            echo=settings.DEBUG,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            **pool_options("async")
+        )
+    if is_sqlite_file(settings.DATABASE_URL):
+        apply_sqlite_pragmas(async_engine.sync_engine)
+    register_engine("async", async_engine.sync_engine)
+
+
+def ensure_unique_access(connection) -> None:
+    """Add the unique (project_id, user_id) index to a table created without it.
+
+    Older databases may hold several grants for one pair; only the newest
+    is kept.
+    """
+    table = ProjectAccess.__table__
+    index_name = "ux_project_accesses_project_user"
+    if any(index["name"] == index_name for index in inspect(connection).get_indexes(table.name)):
+        return
+    newest = select(func.max(table.c.id)).group_by(table.c.project_id, table.c.user_id)
+    connection.execute(delete(table).where(table.c.id.not_in(newest)))
+    next(index for index in table.indexes if index.name == index_name).create(connection)
+
+
+def add_missing_columns(connection, table, names: list[str]) -> list[str]:
+    """ALTER TABLE ... ADD COLUMN for the model columns a table created earlier lacks.
+
+    `create_all` never changes an existing table. Rows already there get the
+    column's model default; returns the names that were added.
+    """
+    existing = {column["name"] for column in inspect(connection).get_columns(table.name)}
+    added = []
+    for name in names:
+        if name in existing:
+            continue
+        column = table.c[name]
+        definition = str(CreateColumn(column).compile(dialect=connection.dialect))
+        if column.default is not None and column.default.is_scalar:
+            default = literal(column.default.arg, column.type).compile(
+                dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+            )
+            definition += f" DEFAULT {default}"
+        table_name = connection.dialect.identifier_preparer.format_table(table)
+        connection.exec_driver_sql(f"ALTER TABLE {table_name} ADD COLUMN {definition}")
+        added.append(name)
+    return added
 
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
-
-def get_session() -> Generator[Session, None, None]:
+    with engine.begin() as connection:
+        ensure_unique_access(connection)
+        counters_added = (
+            add_missing_columns(connection, Document.__table__, ["version_count"])
+            + add_missing_columns(connection, Project.__table__, ["draft_count", "published_count", "archived_count"])
+        )
+        add_missing_columns(connection, Project.__table__, ["deleting"])
+        add_missing_columns(connection, Document.__table__, ["source_document_id"])
+        add_missing_columns(connection, ProjectDeletion.__table__, ["claimed_by", "heartbeat_at"])
     with Session(engine) as session:
-        yield session
\ No newline at end of file
+        if counters_added:
+            repair_counters(session)
+        backfill_changes(session)
+        # databases created before the table existed
+        if session.exec(select(EffectivePermission.user_id).limit(1)).first() is None:
+            rebuild_effective_permissions(session)
+        session.commit()
+
+def get_session(request: Request = None) -> Generator[Session, None, None]:
+    # sequential POST /batch sub-requests share the batch's session, which
+    # the batch request closes itself; a failed item rolls back so that the
+    # next one starts from a clean session
+    batch_session = getattr(request.state, "batch_session", None) if request is not None else None
+    if batch_session is not None:
+        try:
+            yield batch_session
+        except Exception:
+            batch_session.rollback()
+            raise
+        return
+
+    # GET/HEAD requests only read, so they never queue behind the writer
+    if request is not None and request.method in READ_METHODS:
+        session = RoutingSession(primary=engine, replicas=replicas)
+    else:
+        session = Session(engine)
+
+    with session:
+        yield session
+
+async def get_async_session(request: Request = None) -> AsyncGenerator[AsyncSession, None]:
+    batch_session = getattr(request.state, "batch_async_session", None) if request is not None else None
+    if batch_session is not None:
+        try:
+            yield batch_session
+        except Exception:
+            await batch_session.rollback()
+            raise
+        return
+
+    # expire_on_commit=False: services commit several times per call and the
+    # returned ORM objects are serialized after the greenlet is gone
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
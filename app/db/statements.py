@@ -0,0 +1,41 @@
+"""Pre-built statements for the queries that run on almost every request.
+
+Building a select() and generating its cache key on every call costs about
+as much as running the query itself (see benchmarks/bench_statements.py).
+These constructs are built once at import, keep their memoized cache key and
+take values through bind parameters, so each call only binds and executes:
+
+    session.exec(statements.user_by_email, params={"email": email})
+"""
+from sqlalchemy import bindparam
+from sqlmodel import func, select
+
+from app.models.document import Document
+from app.models.document_version import DocumentVersion
+from app.models.effective_permission import EffectivePermission
+from app.models.project_access import ProjectAccess
+from app.models.user import User
+
+
+project_access_for_user = select(ProjectAccess).where(
+    ProjectAccess.project_id == bindparam("project_id"),
+    ProjectAccess.user_id == bindparam("user_id")
+)
+
+effective_permission = select(EffectivePermission.permission).where(
+    EffectivePermission.user_id == bindparam("user_id"),
+    EffectivePermission.project_id == bindparam("project_id")
+)
+
+user_by_email = select(User).where(User.email == bindparam("email"))
+
+max_document_version = select(func.max(DocumentVersion.version)).where(
+    DocumentVersion.document_id == bindparam("document_id")
+)
+
+document_version = select(DocumentVersion).where(
+    DocumentVersion.document_id == bindparam("document_id"),
+    DocumentVersion.version == bindparam("version")
+)
+
+document_project_id = select(Document.project_id).where(Document.id == bindparam("document_id"))
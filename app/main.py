@@ -1,18 +1,29 @@
 from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.admission import AdmissionMiddleware
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.db.session import create_db_and_tables
+from app.core.deletion import worker as deletion_worker
+from app.db.session import async_engine, create_db_and_tables
 
-from app.routers import documents, projects, users, auth, access, auditlog
+from app.routers import documents, attachments, projects, users, auth, access, groups, auditlog, internal, batch, sync
+from app.routers import async_documents, async_attachments, async_projects, async_users, async_auth, async_access, async_groups, async_sync
 
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    create_db_and_tables()
+    # sync `def` routes and dependencies run on this limiter's threads
+    to_thread.current_default_thread_limiter().total_tokens = settings.SERVER_THREADPOOL_SIZE
+    if settings.DATABASE_INIT_ON_STARTUP:
+        create_db_and_tables()
+    deletion_worker.resume()
     yield
+    if async_engine is not None:
+        await async_engine.dispose()
 
 app = FastAPI(
         title=settings.APP_NAME,
@@ -50,6 +61,35 @@ def setup_cors_middleware():
         allow_headers=["*"]
     )
 
+def setup_admission_middleware():
+    limits = {
+        "auth": (settings.ADMISSION_AUTH_CONCURRENCY, settings.ADMISSION_AUTH_QUEUE),
+        "write": (settings.ADMISSION_WRITE_CONCURRENCY, settings.ADMISSION_WRITE_QUEUE),
+        "read": (settings.ADMISSION_READ_CONCURRENCY, settings.ADMISSION_READ_QUEUE),
+        "export": (settings.ADMISSION_EXPORT_CONCURRENCY, settings.ADMISSION_EXPORT_QUEUE),
+        "files": (settings.ADMISSION_FILES_CONCURRENCY, settings.ADMISSION_FILES_QUEUE),
+    }
+    # the threadpool also runs sync dependencies, so admitted routes must not fill it
+    concurrency = sum(limit for limit, _ in limits.values())
+    if concurrency >= settings.SERVER_THREADPOOL_SIZE:
+        raise RuntimeError(
+            f"Admission concurrencies add up to {concurrency}; "
+            f"keep them below SERVER_THREADPOOL_SIZE ({settings.SERVER_THREADPOOL_SIZE})"
+        )
+    app.add_middleware(
+        AdmissionMiddleware,
+        limits=limits,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS
+    )
+
+def setup_compression_middleware():
+    app.add_middleware(
+        CompressionMiddleware,
+        codecs=settings.COMPRESSION_CODECS,
+        minimum_size=settings.COMPRESSION_MIN_SIZE
+    )
+
 @app.get("/", tags=["Root"])
 def root():
     return {
@@ -64,15 +104,40 @@ def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
+def include_async_routers():
+    # Registered before the sync routers so that the `async def` variants win
+    # route matching; endpoints without an async twin fall through to the sync ones.
+    app.include_router(async_users.router, include_in_schema=False)
+    app.include_router(async_auth.router, include_in_schema=False)
+    app.include_router(async_projects.router, include_in_schema=False)
+    app.include_router(async_access.router, include_in_schema=False)
+    app.include_router(async_groups.router, include_in_schema=False)
+    app.include_router(async_documents.router, include_in_schema=False)
+    app.include_router(async_attachments.router, include_in_schema=False)
+    app.include_router(async_sync.router, include_in_schema=False)
+
 def main():
+    # innermost, so 503s from admission control still get CORS headers
+    if settings.ADMISSION_ENABLED:
+        setup_admission_middleware()
     setup_cors_middleware()
+    if settings.COMPRESSION_ENABLED:
+        setup_compression_middleware()
+
+    if settings.DATABASE_ASYNC:
+        include_async_routers()
 
     app.include_router(users.router)
     app.include_router(auth.router)
     app.include_router(projects.router)
     app.include_router(access.router)
+    app.include_router(groups.router)
     app.include_router(documents.router)
+    app.include_router(attachments.router)
     app.include_router(auditlog.router)
+    app.include_router(internal.router)
+    app.include_router(batch.router)
+    app.include_router(sync.router)
 
 
 main()
@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlmodel import SQLModel, Field
+
+
+class Attachment(SQLModel, table=True):
+    """A file attached to a document; the bytes live in the blob store under `sha256`."""
+    __tablename__ = "attachments"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    document_id: int = Field(foreign_key="documents.id", index=True)
+    filename: str = Field(max_length=255)
+    content_type: str = Field(max_length=255)
+    size: int
+    sha256: str = Field(max_length=64, index=True)
+    uploaded_by: int = Field(foreign_key="users.id")
+    created_at: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
@@ -9,6 +9,8 @@ class EntityType(str, Enum):
     project = "project"
     document = "document"
     access = "access"
+    group = "group"
+    membership = "membership"
 
 class AuditLog(SQLModel, table=True):
     __tablename__ = "audit_logs"
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from typing import Optional
+from enum import Enum
+
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field
+
+from app.models.audit_log import EntityType
+
+
+class ChangeOp(str, Enum):
+    upsert = "upsert"
+    delete = "delete"
+
+
+class ChangeLog(SQLModel, table=True):
+    """Latest change of every project, document and access grant, for GET /sync.
+
+    `seq` only ever grows (AUTOINCREMENT never reuses a value), and each entity
+    keeps a single row: recording a change deletes the entity's previous one.
+    `membership` rows track a user's effective access to a project instead of
+    one entity: `entity_id` and `user_id` are the user, one row per pair.
+    """
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_entity", "entity_type", "entity_id"),
+        Index("ix_change_log_project_seq", "project_id", "seq"),
+        {"sqlite_autoincrement": True},
+    )
+
+    seq: Optional[int] = Field(default=None, primary_key=True)
+    entity_type: EntityType
+    entity_id: int
+    # no foreign keys: tombstones outlive the rows they describe
+    project_id: int
+    user_id: Optional[int] = Field(default=None, index=True)
+    op: ChangeOp = Field(default=ChangeOp.upsert)
+    created_at: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
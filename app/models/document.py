@@ -23,6 +23,9 @@ class Document(SQLModel, table=True):
     updated_by: Optional[int] = Field(default=None, foreign_key="users.id")
     created_at: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
+    version_count: int = Field(default=0)
+    # the document this one was cloned from; no foreign key, the source may be deleted later
+    source_document_id: Optional[int] = Field(default=None)
 
 
     project: "Project" = Relationship(back_populates="documents")
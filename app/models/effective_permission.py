@@ -0,0 +1,19 @@
+from sqlmodel import SQLModel, Field
+
+from app.models.project_access import Permission
+
+
+class EffectivePermission(SQLModel, table=True):
+    """Strongest permission each user holds on each project, from every source.
+
+    Derived from project ownership, direct `ProjectAccess` grants and
+    `GroupAccess` grants of the user's groups, and kept current by
+    `refresh_effective_permissions`. Permission checks read one row by
+    primary key. Admin checks never read it: the role grants everything.
+    """
+    __tablename__ = "effective_permissions"
+
+    # no foreign keys: derived rows are rewritten from the sources, never edited
+    user_id: int = Field(primary_key=True)
+    project_id: int = Field(primary_key=True, index=True)
+    permission: Permission
@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field
+
+from app.models.project_access import Permission
+
+
+class Group(SQLModel, table=True):
+    """A named set of users that can be granted project access as a whole."""
+    __tablename__ = "groups"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(unique=True, index=True, max_length=120)
+    description: Optional[str] = Field(default=None)
+    created_by: int = Field(foreign_key="users.id")
+    created_at: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
+
+
+class GroupMember(SQLModel, table=True):
+    __tablename__ = "group_members"
+
+    group_id: int = Field(foreign_key="groups.id", primary_key=True)
+    user_id: int = Field(foreign_key="users.id", primary_key=True, index=True)
+    added_by: int = Field(foreign_key="users.id")
+    created_at: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
+
+
+class GroupAccess(SQLModel, table=True):
+    __tablename__ = "group_accesses"
+    __table_args__ = (
+        Index("ux_group_accesses_project_group", "project_id", "group_id", unique=True),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    project_id: int = Field(foreign_key="projects.id")
+    group_id: int = Field(foreign_key="groups.id", index=True)
+    permission: Permission = Field(default=Permission.viewer)
+    granted_by: int = Field(foreign_key="users.id")
+    created_at: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
@@ -13,6 +13,15 @@ class Project(SQLModel, table=True):
     owner_id: int = Field(foreign_key="users.id")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+    # denormalized document counts per DocumentStatus, kept by DocumentService
+    draft_count: int = Field(default=0)
+    published_count: int = Field(default=0)
+    archived_count: int = Field(default=0)
+
+    # set by DELETE /projects/{id}; the project is gone for every reader while
+    # the deletion worker removes its rows (see app/core/deletion.py)
+    deleting: bool = Field(default=False)
+
     owner: "User" = Relationship(back_populates="owner_projects")
 
     accesses: list["ProjectAccess"] = Relationship(back_populates="project")
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from typing import Optional, TYPE_CHECKING
 from enum import Enum
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 
 class Permission(str, Enum):
@@ -11,6 +12,10 @@ class Permission(str, Enum):
 
 class ProjectAccess(SQLModel, table=True):
     __tablename__ = "project_accesses"
+    __table_args__ = (
+        # one grant per user and project; the target of the bulk upsert's ON CONFLICT
+        Index("ux_project_accesses_project_user", "project_id", "user_id", unique=True),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="projects.id", index=True)
@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+from typing import Optional
+from enum import Enum
+
+from sqlmodel import SQLModel, Field
+
+
+class DeletionStatus(str, Enum):
+    pending = "pending"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+
+class ProjectDeletion(SQLModel, table=True):
+    """Background deletion of one project and everything under it, with progress counters."""
+    __tablename__ = "project_deletions"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # no foreign key: the job outlives the project it deletes
+    project_id: int = Field(index=True)
+    project_title: str = Field(max_length=120)
+    requested_by: int = Field(foreign_key="users.id")
+    status: DeletionStatus = Field(default=DeletionStatus.pending, index=True)
+    documents_total: int = Field(default=0)
+    documents_deleted: int = Field(default=0)
+    versions_deleted: int = Field(default=0)
+    attachments_deleted: int = Field(default=0)
+    grants_deleted: int = Field(default=0)
+    error: Optional[str] = Field(default=None)
+    # "host:pid" of the worker running the job, refreshed with every chunk
+    claimed_by: Optional[str] = Field(default=None, max_length=120)
+    heartbeat_at: Optional[datetime] = Field(default=None)
+    created_at: datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
+    started_at: Optional[datetime] = Field(default=None)
+    finished_at: Optional[datetime] = Field(default=None)
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends, status
+from typing import Iterator
+
+import orjson
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from app.core.security import get_current_user
+from app.core.serialization import ORJSON_OPTIONS, ORJSONResponse
 from app.db.session import get_session
 from app.models.user import User
-from app.schemas.project_access import ProjectAccessCreate, ProjectAccessReadWithUser
+from app.schemas.access_report import AccessReportPage
+from app.schemas.project_access import AccessMatrixUpdate, ProjectAccessBulkResult, ProjectAccessBulkUpdate, ProjectAccessCreate, ProjectAccessReadWithUser
+from app.services.access_report_service import AccessReportService
 from app.services.access_service import AccessService
 
 router = APIRouter(tags=["Access"])
@@ -44,4 +51,88 @@ def list_project_access(
     current_user: User = Depends(get_current_user)
 ):
     service = AccessService(session)
-    return service.list_project_access(project_id, current_user)
\ No newline at end of file
+    return service.list_project_access(project_id, current_user)
+
+
+@router.post("/projects/{project_id}/access/bulk", response_model=ProjectAccessBulkResult)
+def bulk_update_project_access(
+    project_id: int,
+    changes: ProjectAccessBulkUpdate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    service = AccessService(session)
+    return service.bulk_update_access([project_id], changes, current_user)[0]
+
+
+@router.post("/access/bulk", response_model=list[ProjectAccessBulkResult])
+def bulk_update_access_matrix(
+    changes: AccessMatrixUpdate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    service = AccessService(session)
+    return service.bulk_update_access(changes.project_ids, changes, current_user)
+
+
+def ndjson_lines(rows: Iterator[dict]) -> Iterator[bytes]:
+    for row in rows:
+        yield orjson.dumps(row, option=ORJSON_OPTIONS) + b"\n"
+
+
+def ndjson_export(rows: Iterator[dict], filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        ndjson_lines(rows),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/access/report/users/{user_id}", response_model=AccessReportPage)
+def user_access_report(
+    user_id: int,
+    after: int = Query(default=0, ge=0, description="`next` of the previous page; 0 starts at the beginning"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Every project the user can reach, with owner, direct, group and admin sources."""
+    service = AccessReportService(session)
+    return ORJSONResponse(service.user_report(user_id, current_user, after, limit))
+
+
+@router.get("/access/report/users/{user_id}/export", response_class=StreamingResponse)
+def export_user_access_report(
+    user_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """The whole user report as NDJSON, one `AccessReportRow` per line."""
+    service = AccessReportService(session)
+    service.check_user_report(user_id, current_user)
+    return ndjson_export(service.export_user_report(user_id), f"access-user-{user_id}.ndjson")
+
+
+@router.get("/access/report/projects/{project_id}", response_model=AccessReportPage)
+def project_access_report(
+    project_id: int,
+    after: int = Query(default=0, ge=0, description="`next` of the previous page; 0 starts at the beginning"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Every user who can reach the project, with owner, direct, group and admin sources."""
+    service = AccessReportService(session)
+    return ORJSONResponse(service.project_report(project_id, current_user, after, limit))
+
+
+@router.get("/access/report/projects/{project_id}/export", response_class=StreamingResponse)
+def export_project_access_report(
+    project_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """The whole project report as NDJSON, one `AccessReportRow` per line."""
+    service = AccessReportService(session)
+    service.check_project_report(project_id, current_user)
+    return ndjson_export(service.export_project_report(project_id), f"access-project-{project_id}.ndjson")
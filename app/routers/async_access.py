@@ -0,0 +1,95 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.security import get_current_user_async
+from app.core.serialization import ORJSONResponse
+from app.db.session import get_async_session
+from app.models.user import User
+from app.schemas.access_report import AccessReportPage
+from app.schemas.project_access import AccessMatrixUpdate, ProjectAccessBulkResult, ProjectAccessBulkUpdate, ProjectAccessCreate, ProjectAccessReadWithUser
+from app.services.async_services import AsyncAccessReportService, AsyncAccessService
+
+router = APIRouter(tags=["Access"])
+
+@router.post(
+    "/projects/{project_id}/access/grant", 
+    response_model=ProjectAccessReadWithUser,
+    status_code=status.HTTP_201_CREATED
+)
+async def grant_access(
+    project_id: int,
+    access_data: ProjectAccessCreate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncAccessService(session)
+    return await service.grant_access(project_id, access_data, current_user)
+
+
+@router.delete("/projects/{project_id}/access/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_access(
+    project_id: int,
+    user_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncAccessService(session)
+    await service.revoke_access(project_id, user_id, current_user)
+
+
+@router.get("/projects/{project_id}/access", response_model=list[ProjectAccessReadWithUser])
+async def list_project_access(
+    project_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncAccessService(session)
+    return await service.list_project_access(project_id, current_user)
+
+
+@router.post("/projects/{project_id}/access/bulk", response_model=ProjectAccessBulkResult)
+async def bulk_update_project_access(
+    project_id: int,
+    changes: ProjectAccessBulkUpdate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncAccessService(session)
+    return (await service.bulk_update_access([project_id], changes, current_user))[0]
+
+
+@router.post("/access/bulk", response_model=list[ProjectAccessBulkResult])
+async def bulk_update_access_matrix(
+    changes: AccessMatrixUpdate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncAccessService(session)
+    return await service.bulk_update_access(changes.project_ids, changes, current_user)
+
+
+# the NDJSON exports have no async twin: they stream from a sync generator
+# and fall through to the sync router
+
+@router.get("/access/report/users/{user_id}", response_model=AccessReportPage)
+async def user_access_report(
+    user_id: int,
+    after: int = Query(default=0, ge=0, description="`next` of the previous page; 0 starts at the beginning"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncAccessReportService(session)
+    return ORJSONResponse(await service.user_report(user_id, current_user, after, limit))
+
+
+@router.get("/access/report/projects/{project_id}", response_model=AccessReportPage)
+async def project_access_report(
+    project_id: int,
+    after: int = Query(default=0, ge=0, description="`next` of the previous page; 0 starts at the beginning"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncAccessReportService(session)
+    return ORJSONResponse(await service.project_report(project_id, current_user, after, limit))
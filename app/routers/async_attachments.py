@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.blobs import UPLOAD_REQUEST_BODY, file_response, store_upload
+from app.core.security import get_current_user_async
+from app.db.session import get_async_session
+from app.models.user import User
+from app.schemas.attachment import AttachmentRead
+from app.services.async_services import AsyncAttachmentService
+from app.services.attachment_service import DEFAULT_CONTENT_TYPE
+
+
+router = APIRouter(tags=["Attachments"])
+
+
+@router.post("/documents/{doc_id}/attachments", response_model=AttachmentRead,
+             status_code=status.HTTP_201_CREATED, openapi_extra=UPLOAD_REQUEST_BODY)
+async def upload_attachment(
+    request: Request,
+    doc_id: int,
+    filename: str = Query(..., min_length=1, max_length=255),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncAttachmentService(session)
+    await service.check_upload(doc_id, current_user)
+    # end the check's transaction so no connection is held while the body
+    # streams; create_attachment checks again
+    await session.rollback()
+    blob = await store_upload(request)
+    content_type = request.headers.get("content-type", DEFAULT_CONTENT_TYPE)
+    return await service.create_attachment(doc_id, filename, content_type, blob, current_user)
+
+
+@router.get("/documents/{doc_id}/attachments", response_model=list[AttachmentRead])
+async def list_attachments(
+    doc_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    return await AsyncAttachmentService(session).list_attachments(doc_id, current_user)
+
+
+@router.get("/documents/{doc_id}/attachments/{attachment_id}", response_model=AttachmentRead)
+async def get_attachment(
+    doc_id: int,
+    attachment_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    return await AsyncAttachmentService(session).get_attachment(doc_id, attachment_id, current_user)
+
+
+@router.get("/documents/{doc_id}/attachments/{attachment_id}/content")
+async def download_attachment(
+    request: Request,
+    doc_id: int,
+    attachment_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    attachment = await AsyncAttachmentService(session).get_attachment(doc_id, attachment_id, current_user)
+    return file_response(request, attachment)
+
+
+@router.delete("/documents/{doc_id}/attachments/{attachment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_attachment(
+    doc_id: int,
+    attachment_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    await AsyncAttachmentService(session).delete_attachment(doc_id, attachment_id, current_user)
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, status, HTTPException
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.schemas.token import Token
+
+
+from app.core.security import get_current_user_async, require_admin_async
+from app.db.session import get_async_session
+from app.models.user import User
+from app.schemas.user import UserCreate, UserLogin, UserRead
+from app.services.async_services import AsyncUserService
+
+router = APIRouter(prefix="/auth", tags=["Authentication"])
+
+@router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
+async def register_user(
+    user_data: UserCreate,
+    session: AsyncSession = Depends(get_async_session),
+    is_admin: bool = Depends(require_admin_async),
+    current_user: User = Depends(get_current_user_async)
+):
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    service = AsyncUserService(session)
+    return await service.create_user(user_data, current_user)
+
+
+@router.post("/login", response_model=Token)
+async def login(
+    credentials: UserLogin,
+    session: AsyncSession = Depends(get_async_session)
+):
+    service = AsyncUserService(session)
+    return await service.authenticate(credentials)
+
+
+@router.get("/me", response_model=UserRead)
+async def get_me(current_user: User = Depends(get_current_user_async)):
+    return current_user
@@ -0,0 +1,146 @@
+from fastapi import APIRouter, Depends, Request, status, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Union, Optional
+
+from app.core.cache import cached_response_async
+from app.core.security import get_current_user_async
+from app.core.serialization import ORJSONResponse
+from app.db.session import get_async_session
+from app.models.document import DocumentStatus
+from app.models.user import User
+from app.schemas.document import DocumentCreate, DocumentRead, DocumentReadWithDetails, DocumentUpdate
+from app.schemas.document_version import DocumentVersionRead, DocumentVersionReadWithCreator
+from app.services.async_services import AsyncDocumentService
+
+
+router = APIRouter(tags=["Documents"])
+
+@router.post("/projects/{project_id}/documents",  response_model=DocumentRead,  status_code=status.HTTP_201_CREATED)
+async def create_document(project_id: int, doc_data: DocumentCreate, session: AsyncSession = Depends(get_async_session), current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncDocumentService(session)
+    return await service.create_document(project_id, doc_data, current_user)
+
+
+@router.get("/projects/{project_id}/documents", response_model=Union[list[DocumentRead], list[DocumentReadWithDetails]])
+async def list_documents(
+    project_id: int,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=100),
+    details: bool = Query(default=False, description="Include creator/updater emails and version count"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncDocumentService(session)
+    documents = await service.list_documents(project_id, current_user, skip, limit, details, fields)
+    if details:
+        return documents
+    return ORJSONResponse(documents)
+
+
+@router.get("/documents/{doc_id}", response_model=Union[DocumentRead, DocumentReadWithDetails])
+async def get_document(
+    request: Request,
+    doc_id: int,
+    details: bool = Query(default=False, description="Include creator/updater emails and version count"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncDocumentService(session)
+
+    async def build():
+        document = await service.get_document(doc_id, current_user, details, fields)
+        if fields is not None:
+            return ORJSONResponse(document)
+        return document
+
+    return await cached_response_async(
+        request, await service.cache_scope(doc_id, current_user), build,
+        Union[DocumentRead, DocumentReadWithDetails]
+    )
+
+
+
+@router.patch("/documents/{doc_id}", response_model=DocumentRead)
+async def update_document(
+    doc_id: int,
+    doc_data: DocumentUpdate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncDocumentService(session)
+    return await service.update_document(doc_id, doc_data, current_user)
+
+
+@router.post("/documents/{doc_id}/publish", response_model=DocumentRead)
+async def publish_document(
+    doc_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncDocumentService(session)
+    return await service.change_status(doc_id, DocumentStatus.published, current_user)
+
+
+@router.post("/documents/{doc_id}/archive", response_model=DocumentRead)
+async def archive_document(
+    doc_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncDocumentService(session)
+    return await service.change_status(doc_id, DocumentStatus.archived, current_user)
+
+
+@router.get("/documents/{doc_id}/versions", response_model=List[DocumentVersionReadWithCreator])
+async def list_document_versions(
+    request: Request,
+    doc_id: int,
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncDocumentService(session)
+
+    async def build():
+        return ORJSONResponse(await service.list_versions(doc_id, current_user, fields))
+
+    return await cached_response_async(
+        request, await service.cache_scope(doc_id, current_user), build,
+        List[DocumentVersionReadWithCreator]
+    )
+
+
+@router.get("/documents/{doc_id}/versions/{version}", response_model=DocumentVersionRead)
+async def get_document_version(
+    request: Request,
+    doc_id: int,
+    version: int,
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncDocumentService(session)
+
+    async def build():
+        document_version = await service.get_version(doc_id, version, current_user, fields)
+        if fields is not None:
+            return ORJSONResponse(document_version)
+        return document_version
+
+    return await cached_response_async(
+        request, await service.cache_scope(doc_id, current_user), build, DocumentVersionRead
+    )
+
+
+@router.post("/documents/{doc_id}/versions/{version}/restore", response_model=DocumentRead)
+async def restore_document_version(
+    doc_id: int,
+    version: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncDocumentService(session)
+    return await service.restore_version(doc_id, version, current_user)
@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.security import get_current_user_async, require_admin_async
+from app.db.session import get_async_session
+from app.models.user import User
+from app.schemas.group import GroupAccessCreate, GroupAccessRead, GroupCreate, GroupMembersAdd, GroupRead, GroupReadWithMembers
+from app.services.async_services import AsyncGroupService
+
+router = APIRouter(tags=["Groups"])
+
+
+def check_admin(is_admin: bool) -> None:
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+
+@router.post("/groups", response_model=GroupRead, status_code=status.HTTP_201_CREATED)
+async def create_group(
+    group_data: GroupCreate,
+    session: AsyncSession = Depends(get_async_session),
+    is_admin: bool = Depends(require_admin_async),
+    current_user: User = Depends(get_current_user_async)
+):
+    check_admin(is_admin)
+    return await AsyncGroupService(session).create_group(group_data, current_user)
+
+
+@router.get("/groups", response_model=list[GroupRead])
+async def list_groups(
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=500),
+    session: AsyncSession = Depends(get_async_session),
+    is_admin: bool = Depends(require_admin_async)
+):
+    check_admin(is_admin)
+    return await AsyncGroupService(session).list_groups(skip=skip, limit=limit)
+
+
+@router.get("/groups/{group_id}", response_model=GroupReadWithMembers)
+async def get_group(
+    group_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    is_admin: bool = Depends(require_admin_async)
+):
+    check_admin(is_admin)
+    return await AsyncGroupService(session).get_group(group_id)
+
+
+@router.delete("/groups/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_group(
+    group_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    is_admin: bool = Depends(require_admin_async),
+    current_user: User = Depends(get_current_user_async)
+):
+    check_admin(is_admin)
+    await AsyncGroupService(session).delete_group(group_id, current_user)
+
+
+@router.post("/groups/{group_id}/members", response_model=GroupReadWithMembers)
+async def add_group_members(
+    group_id: int,
+    members: GroupMembersAdd,
+    session: AsyncSession = Depends(get_async_session),
+    is_admin: bool = Depends(require_admin_async),
+    current_user: User = Depends(get_current_user_async)
+):
+    check_admin(is_admin)
+    return await AsyncGroupService(session).add_members(group_id, members.user_ids, current_user)
+
+
+@router.delete("/groups/{group_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_group_member(
+    group_id: int,
+    user_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    is_admin: bool = Depends(require_admin_async),
+    current_user: User = Depends(get_current_user_async)
+):
+    check_admin(is_admin)
+    await AsyncGroupService(session).remove_member(group_id, user_id, current_user)
+
+
+@router.post(
+    "/projects/{project_id}/access/groups",
+    response_model=GroupAccessRead,
+    status_code=status.HTTP_201_CREATED
+)
+async def grant_group_access(
+    project_id: int,
+    access_data: GroupAccessCreate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    return await AsyncGroupService(session).grant_group_access(project_id, access_data, current_user)
+
+
+@router.delete("/projects/{project_id}/access/groups/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_group_access(
+    project_id: int,
+    group_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    await AsyncGroupService(session).revoke_group_access(project_id, group_id, current_user)
+
+
+@router.get("/projects/{project_id}/access/groups", response_model=list[GroupAccessRead])
+async def list_group_access(
+    project_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    return await AsyncGroupService(session).list_group_access(project_id, current_user)
@@ -0,0 +1,132 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import cached_response_async
+from app.core.events import event_stream
+from app.core.security import get_current_user_async, require_roles_async
+from app.core.serialization import ORJSONResponse
+from app.db.session import get_async_session
+from app.models.user import User
+from app.schemas.project import ProjectClone, ProjectCreate, ProjectRead, ProjectReadWithCounts, ProjectSummary, ProjectUpdate
+from app.schemas.project_deletion import ProjectDeletionRead
+from app.services.async_services import AsyncProjectService
+
+
+router = APIRouter(prefix="/projects", tags=["Projects"])
+
+@router.post("", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
+async def create_project(project_data: ProjectCreate, session: AsyncSession = Depends(get_async_session), current_user: User = Depends(require_roles_async("admin", "manager"))):
+    service = AsyncProjectService(session)
+    return await service.create_project(project_data, current_user)
+
+
+@router.post("/{project_id}/clone", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
+async def clone_project(
+    project_id: int,
+    clone_data: ProjectClone,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(require_roles_async("admin", "manager"))
+):
+    """New project with copies of the source's documents, optionally its grants and version history."""
+    service = AsyncProjectService(session)
+    return await service.clone_project(project_id, clone_data, current_user)
+
+
+
+@router.get("/", response_model=List[ProjectRead])
+async def list_projects( skip: int = Query(default=0, ge=0), limit: int = Query(default=20, ge=1, le=100),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)):
+
+    service = AsyncProjectService(session)
+    return ORJSONResponse(await service.list_projects(current_user, skip, limit, fields))
+
+
+@router.get("/{project_id}", response_model=ProjectReadWithCounts)
+async def get_project(
+    request: Request,
+    project_id: int,
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    
+    service = AsyncProjectService(session)
+
+    async def build():
+        project = await service.get_project(project_id, current_user, fields)
+        if fields is not None:
+            return ORJSONResponse(project)
+        return project
+
+    return await cached_response_async(
+        request, await service.cache_scope(project_id, current_user), build, ProjectReadWithCounts
+    )
+
+
+@router.get("/{project_id}/summary", response_model=ProjectSummary)
+async def get_project_summary(
+    project_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Document counts per status, members, last activity and top editors, in one request."""
+    service = AsyncProjectService(session)
+    return await service.get_summary(project_id, current_user)
+
+
+@router.get("/{project_id}/events", response_class=StreamingResponse)
+async def project_events(
+    project_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncProjectService(session)
+    await service.get_project(project_id, current_user, fields="id")
+    # the stream can stay open for hours; don't keep a pooled connection checked out
+    await session.close()
+
+    return StreamingResponse(
+        event_stream(project_id, current_user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+
+@router.patch("/{project_id}", response_model=ProjectRead)
+async def update_project(
+    project_id: int,
+    project_data: ProjectUpdate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncProjectService(session)
+    return await service.update_project(project_id, project_data, current_user)
+
+
+@router.delete("/{project_id}", response_model=ProjectDeletionRead, status_code=status.HTTP_202_ACCEPTED)
+async def delete_project(
+    project_id: int,
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    """Hide the project now and delete its documents and grants in the background."""
+    service = AsyncProjectService(session)
+    job = await service.delete_project(project_id, current_user)
+    response.headers["Location"] = f"/projects/{project_id}/deletion"
+    return job
+
+
+@router.get("/{project_id}/deletion", response_model=ProjectDeletionRead)
+async def get_project_deletion(
+    project_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
+):
+    service = AsyncProjectService(session)
+    return await service.get_deletion(project_id, current_user)
@@ -0,0 +1,50 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.ingest import BULK_REQUEST_BODY, read_records
+from app.core.security import get_current_user_async, require_admin_async
+from app.core.serialization import ORJSONResponse
+from app.db.session import get_async_session
+from app.models.user import User
+from app.schemas.user import BulkUserReport, UserRead
+from app.services.async_services import AsyncUserService
+
+router = APIRouter(prefix="/users", tags=["Users"])
+
+async def get_user_service(session: AsyncSession = Depends(get_async_session)) -> AsyncUserService:
+    return AsyncUserService(session)
+
+@router.get("/", response_model=list[UserRead])
+async def list_users(
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=500),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
+    is_admin: bool = Depends(require_admin_async),
+    service: AsyncUserService = Depends(get_user_service)
+):
+    if not is_admin: 
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return ORJSONResponse(await service.list_users(skip=skip, limit=limit, fields=fields))
+
+
+@router.post("/bulk", response_model=BulkUserReport, openapi_extra=BULK_REQUEST_BODY)
+async def bulk_create_users(
+    request: Request,
+    is_admin: bool = Depends(require_admin_async),
+    current_user: User = Depends(get_current_user_async),
+    service: AsyncUserService = Depends(get_user_service)
+):
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    rows = await read_records(request, settings.BULK_MAX_ROWS)
+    return await service.bulk_create(rows, current_user)
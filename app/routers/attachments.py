@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+
+from app.core.blobs import UPLOAD_REQUEST_BODY, file_response, store_upload
+from app.core.security import get_current_user
+from app.db.session import get_session
+from app.models.user import User
+from app.schemas.attachment import AttachmentRead
+from app.services.attachment_service import DEFAULT_CONTENT_TYPE, AttachmentService
+
+
+router = APIRouter(tags=["Attachments"])
+
+
+@router.post("/documents/{doc_id}/attachments", response_model=AttachmentRead,
+             status_code=status.HTTP_201_CREATED, openapi_extra=UPLOAD_REQUEST_BODY)
+async def upload_attachment(
+    request: Request,
+    doc_id: int,
+    filename: str = Query(..., min_length=1, max_length=255),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream the raw request body into the attachment store; `filename` names the file."""
+    service = AttachmentService(session)
+    await run_in_threadpool(service.check_upload, doc_id, current_user)
+    # end the check's transaction so the connection (with SQLite, the only
+    # writer) is not held while the body streams; create_attachment checks again
+    await run_in_threadpool(session.rollback)
+    blob = await store_upload(request)
+    content_type = request.headers.get("content-type", DEFAULT_CONTENT_TYPE)
+    return await run_in_threadpool(service.create_attachment, doc_id, filename, content_type, blob, current_user)
+
+
+@router.get("/documents/{doc_id}/attachments", response_model=list[AttachmentRead])
+def list_attachments(
+    doc_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    return AttachmentService(session).list_attachments(doc_id, current_user)
+
+
+@router.get("/documents/{doc_id}/attachments/{attachment_id}", response_model=AttachmentRead)
+def get_attachment(
+    doc_id: int,
+    attachment_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    return AttachmentService(session).get_attachment(doc_id, attachment_id, current_user)
+
+
+@router.get("/documents/{doc_id}/attachments/{attachment_id}/content")
+def download_attachment(
+    request: Request,
+    doc_id: int,
+    attachment_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """The file itself; honours `Range`, `If-Range` and `If-None-Match`."""
+    attachment = AttachmentService(session).get_attachment(doc_id, attachment_id, current_user)
+    return file_response(request, attachment)
+
+
+@router.delete("/documents/{doc_id}/attachments/{attachment_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_attachment(
+    doc_id: int,
+    attachment_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    AttachmentService(session).delete_attachment(doc_id, attachment_id, current_user)
@@ -1,17 +1,20 @@
 from datetime import datetime, date
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import Session
 
 from app.core.security import require_admin
+from app.core.serialization import ORJSONResponse, fetch_rows, parse_fields, schema_columns, select_fields
 from app.db.session import get_session
 from app.models.audit_log import AuditLog, EntityType
 from app.models.user import User
-from app.schemas.audit_log import AuditLogFilter, AuditLogReadWithUser
+from app.schemas.audit_log import AuditLogReadWithUser
 
 
 router = APIRouter(prefix="/audit", tags=["Audit"])
 
+AUDIT_COLUMNS = schema_columns(AuditLog, AuditLogReadWithUser, user_email=User.email)
+
 
 @router.get("", response_model=list[AuditLogReadWithUser])
 def list_audit_logs(
@@ -22,10 +25,20 @@ def list_audit_logs(
     entity_type: Optional[EntityType] = Query(default=None, description="Filter by entity type"),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,action"),
     session: Session = Depends(get_session),
-    current_user: User = Depends(require_admin)
+    is_admin: bool = Depends(require_admin)
 ):
-    statement = select(AuditLogFilter)
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    names = parse_fields(fields, AUDIT_COLUMNS)
+    statement = select_fields(AUDIT_COLUMNS, names).select_from(AuditLog)
+    if "user_email" in names:
+        statement = statement.outerjoin(User, User.id == AuditLog.user_id)
 
     if date_from:
         dt_from = datetime.combine(date_from, datetime.min.time())
@@ -48,22 +61,4 @@ def list_audit_logs(
     statement = statement.order_by(AuditLog.created_at.desc())
     statement = statement.offset(skip).limit(limit)
 
-    logs = session.exec(statement).all()
-
-
-    result = []
-    for log in logs:
-        user = session.get(User, log.user_id)
-        result.append(AuditLogReadWithUser(
-            id=log.id,
-            user_id=log.user_id,
-            action=log.action,
-            entity_type=log.entity_type,
-            entity_id=log.entity_id,
-            meta=log.meta,
-            created_at=log.created_at,
-            user_email=user.email if user else None
-        ))
-    
-    return result
-
+    return ORJSONResponse(fetch_rows(session, statement))
@@ -0,0 +1,150 @@
+import asyncio
+from typing import Optional
+from urllib.parse import unquote
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.security import get_current_user
+from app.db.routing import RoutingSession
+from app.db.session import async_engine, engine, replicas
+from app.models.user import User
+from app.schemas.batch import BatchItem, BatchItemResult, BatchRequest, BatchResponse
+
+
+router = APIRouter(tags=["Batch"])
+
+
+def _error(item: BatchItem, status_code: int, detail: str) -> BatchItemResult:
+    return BatchItemResult(id=item.id, status=status_code, body={"detail": detail})
+
+
+async def dispatch(request: Request, item: BatchItem, state: dict, parallel: bool = False) -> BatchItemResult:
+    """Run one sub-request through the whole ASGI app, in-process."""
+    path, _, query = item.path.partition("?")
+    if not path.startswith("/"):
+        return _error(item, status.HTTP_400_BAD_REQUEST, "Path must start with /")
+    if path.rstrip("/") == "/batch":
+        return _error(item, status.HTTP_400_BAD_REQUEST, "Batches cannot be nested")
+    if path.rstrip("/").endswith("/events"):
+        return _error(item, status.HTTP_400_BAD_REQUEST, "Event streams cannot be batched")
+
+    body = b"" if item.body is None else orjson.dumps(item.body)
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    authorization = request.headers.get("authorization")
+    if authorization:
+        headers.append((b"authorization", authorization.encode("latin-1")))
+
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": item.method,
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": unquote(path),
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+        "state": dict(state),
+        # lets middleware (e.g. admission control) tell sub-requests apart
+        "batch": "parallel" if parallel else "sequential",
+    }
+
+    response_status: Optional[int] = None
+    response_headers: list = []
+    chunks: list[bytes] = []
+    finished = asyncio.Event()
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal response_status, response_headers
+        if message["type"] == "http.response.start":
+            response_status = message["status"]
+            response_headers = message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # ServerErrorMiddleware has already sent its 500 before re-raising
+        if response_status is None:
+            return _error(item, status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal Server Error")
+    finally:
+        finished.set()
+
+    content = b"".join(chunks)
+    content_type = dict(response_headers).get(b"content-type", b"")
+    if not content:
+        result = None
+    elif content_type.startswith(b"application/json"):
+        result = orjson.loads(content)
+    else:
+        result = content.decode("utf-8", errors="replace")
+    return BatchItemResult(id=item.id, status=response_status, body=result)
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def run_batch(
+    batch: BatchRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    if len(batch.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BATCH_MAX_REQUESTS} requests per batch"
+        )
+
+    if batch.parallel:
+        if any(item.method != "GET" for item in batch.requests):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Parallel batches may only contain GET requests"
+            )
+
+        # each concurrent sub-request opens its own session: a Session is
+        # not safe to use from several threads at once. Each also takes an
+        # admission slot of its own class, as it holds a thread of its own
+        semaphore = asyncio.Semaphore(settings.BATCH_MAX_PARALLEL)
+
+        async def run(item: BatchItem) -> BatchItemResult:
+            async with semaphore:
+                return await dispatch(request, item, {"batch_user": current_user}, parallel=True)
+
+        results = await asyncio.gather(*(run(item) for item in batch.requests))
+        return BatchResponse(responses=list(results))
+
+    state = {
+        "batch_user": current_user,
+        "batch_session": RoutingSession(primary=engine, replicas=replicas),
+    }
+    if async_engine is not None:
+        state["batch_async_session"] = AsyncSession(async_engine, expire_on_commit=False)
+
+    try:
+        results = [await dispatch(request, item, state) for item in batch.requests]
+    finally:
+        state["batch_session"].close()
+        if "batch_async_session" in state:
+            await state["batch_async_session"].close()
+
+    return BatchResponse(responses=results)
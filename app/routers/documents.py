@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Request, status, Query
 from sqlmodel import Session
-from typing import List
+from typing import List, Union, Optional
 
+from app.core.cache import cached_response
 from app.core.security import get_current_user
+from app.core.serialization import ORJSONResponse
 from app.db.session import get_session
 from app.models.document import DocumentStatus
 from app.models.user import User
-from app.schemas.document import DocumentCreate, DocumentRead, DocumentUpdate
+from app.schemas.document import DocumentCreate, DocumentRead, DocumentReadWithDetails, DocumentUpdate
 from app.schemas.document_version import DocumentVersionRead, DocumentVersionReadWithCreator
 from app.services.document_service import DocumentService
 
@@ -20,26 +22,44 @@ def create_document(project_id: int, doc_data: DocumentCreate, session: Session
     return service.create_document(project_id, doc_data, current_user)
 
 
-@router.get("/projects/{project_id}/documents", response_model=list[DocumentRead])
+@router.get("/projects/{project_id}/documents", response_model=Union[list[DocumentRead], list[DocumentReadWithDetails]])
 def list_documents(
     project_id: int,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    details: bool = Query(default=False, description="Include creator/updater emails and version count"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     service = DocumentService(session)
-    return service.list_documents(project_id, current_user, skip, limit)
+    documents = service.list_documents(project_id, current_user, skip, limit, details, fields)
+    if details:
+        return documents
+    return ORJSONResponse(documents)
 
 
-@router.get("/documents/{doc_id}", response_model=DocumentRead)
+@router.get("/documents/{doc_id}", response_model=Union[DocumentRead, DocumentReadWithDetails])
 def get_document(
+    request: Request,
     doc_id: int,
+    details: bool = Query(default=False, description="Include creator/updater emails and version count"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     service = DocumentService(session)
-    return service.get_document(doc_id, current_user)
+
+    def build():
+        document = service.get_document(doc_id, current_user, details, fields)
+        if fields is not None:
+            return ORJSONResponse(document)
+        return document
+
+    return cached_response(
+        request, service.cache_scope(doc_id, current_user), build,
+        Union[DocumentRead, DocumentReadWithDetails]
+    )
 
 
 
@@ -76,23 +96,43 @@ def archive_document(
 
 @router.get("/documents/{doc_id}/versions", response_model=List[DocumentVersionReadWithCreator])
 def list_document_versions(
+    request: Request,
     doc_id: int,
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     service = DocumentService(session)
-    return service.list_versions(doc_id, current_user)
+
+    def build():
+        return ORJSONResponse(service.list_versions(doc_id, current_user, fields))
+
+    return cached_response(
+        request, service.cache_scope(doc_id, current_user), build,
+        List[DocumentVersionReadWithCreator]
+    )
 
 
 @router.get("/documents/{doc_id}/versions/{version}", response_model=DocumentVersionRead)
 def get_document_version(
+    request: Request,
     doc_id: int,
     version: int,
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     service = DocumentService(session)
-    return service.get_version(doc_id, version, current_user)
+
+    def build():
+        document_version = service.get_version(doc_id, version, current_user, fields)
+        if fields is not None:
+            return ORJSONResponse(document_version)
+        return document_version
+
+    return cached_response(
+        request, service.cache_scope(doc_id, current_user), build, DocumentVersionRead
+    )
 
 
 @router.post("/documents/{doc_id}/versions/{version}/restore", response_model=DocumentRead)
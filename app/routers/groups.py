@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import Session
+
+from app.core.security import get_current_user, require_admin
+from app.db.session import get_session
+from app.models.user import User
+from app.schemas.group import GroupAccessCreate, GroupAccessRead, GroupCreate, GroupMembersAdd, GroupRead, GroupReadWithMembers
+from app.services.group_service import GroupService
+
+router = APIRouter(tags=["Groups"])
+
+
+def check_admin(is_admin: bool) -> None:
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+
+@router.post("/groups", response_model=GroupRead, status_code=status.HTTP_201_CREATED)
+def create_group(
+    group_data: GroupCreate,
+    session: Session = Depends(get_session),
+    is_admin: bool = Depends(require_admin),
+    current_user: User = Depends(get_current_user)
+):
+    check_admin(is_admin)
+    return GroupService(session).create_group(group_data, current_user)
+
+
+@router.get("/groups", response_model=list[GroupRead])
+def list_groups(
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=500),
+    session: Session = Depends(get_session),
+    is_admin: bool = Depends(require_admin)
+):
+    check_admin(is_admin)
+    return GroupService(session).list_groups(skip=skip, limit=limit)
+
+
+@router.get("/groups/{group_id}", response_model=GroupReadWithMembers)
+def get_group(
+    group_id: int,
+    session: Session = Depends(get_session),
+    is_admin: bool = Depends(require_admin)
+):
+    check_admin(is_admin)
+    return GroupService(session).get_group(group_id)
+
+
+@router.delete("/groups/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_group(
+    group_id: int,
+    session: Session = Depends(get_session),
+    is_admin: bool = Depends(require_admin),
+    current_user: User = Depends(get_current_user)
+):
+    check_admin(is_admin)
+    GroupService(session).delete_group(group_id, current_user)
+
+
+@router.post("/groups/{group_id}/members", response_model=GroupReadWithMembers)
+def add_group_members(
+    group_id: int,
+    members: GroupMembersAdd,
+    session: Session = Depends(get_session),
+    is_admin: bool = Depends(require_admin),
+    current_user: User = Depends(get_current_user)
+):
+    check_admin(is_admin)
+    return GroupService(session).add_members(group_id, members.user_ids, current_user)
+
+
+@router.delete("/groups/{group_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+def remove_group_member(
+    group_id: int,
+    user_id: int,
+    session: Session = Depends(get_session),
+    is_admin: bool = Depends(require_admin),
+    current_user: User = Depends(get_current_user)
+):
+    check_admin(is_admin)
+    GroupService(session).remove_member(group_id, user_id, current_user)
+
+
+@router.post(
+    "/projects/{project_id}/access/groups",
+    response_model=GroupAccessRead,
+    status_code=status.HTTP_201_CREATED
+)
+def grant_group_access(
+    project_id: int,
+    access_data: GroupAccessCreate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    return GroupService(session).grant_group_access(project_id, access_data, current_user)
+
+
+@router.delete("/projects/{project_id}/access/groups/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
+def revoke_group_access(
+    project_id: int,
+    group_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    GroupService(session).revoke_group_access(project_id, group_id, current_user)
+
+
+@router.get("/projects/{project_id}/access/groups", response_model=list[GroupAccessRead])
+def list_group_access(
+    project_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    return GroupService(session).list_group_access(project_id, current_user)
@@ -0,0 +1,84 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.core.admission import get_admission_stats
+from app.core.cache import get_cache_stats
+from app.core.compression import get_compression_stats
+from app.core.events import get_event_stats
+from app.core.hashing import get_hashing_stats
+from app.core.security import require_admin
+from app.db.pool_metrics import get_pool_stats
+from app.schemas.admission import AdmissionStatsRead
+from app.schemas.cache import CacheStatsRead
+from app.schemas.compression import CompressionStatsRead
+from app.schemas.events import EventStatsRead
+from app.schemas.hashing import HashingStatsRead
+from app.schemas.pool import PoolStatsRead
+
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+@router.get("/pool", response_model=list[PoolStatsRead])
+def pool_stats(is_admin: bool = Depends(require_admin)):
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    return get_pool_stats()
+
+
+@router.get("/compression", response_model=CompressionStatsRead)
+def compression_stats(is_admin: bool = Depends(require_admin)):
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    return get_compression_stats()
+
+
+@router.get("/cache", response_model=CacheStatsRead)
+def cache_stats(is_admin: bool = Depends(require_admin)):
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    return get_cache_stats()
+
+
+@router.get("/events", response_model=EventStatsRead)
+def event_stats(is_admin: bool = Depends(require_admin)):
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    return get_event_stats()
+
+
+@router.get("/admission", response_model=list[AdmissionStatsRead])
+def admission_stats(is_admin: bool = Depends(require_admin)):
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    return get_admission_stats()
+
+
+@router.get("/hashing", response_model=HashingStatsRead)
+def hashing_stats(is_admin: bool = Depends(require_admin)):
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    return get_hashing_stats()
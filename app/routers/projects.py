@@ -1,11 +1,16 @@
-from typing import List
-from fastapi import APIRouter, Depends, status, Query
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
+from app.core.cache import cached_response
+from app.core.events import event_stream
 from app.core.security import get_current_user, require_roles
+from app.core.serialization import ORJSONResponse
 from app.db.session import get_session
 from app.models.user import User
-from app.schemas.project import ProjectCreate, ProjectRead, ProjectUpdate
+from app.schemas.project import ProjectClone, ProjectCreate, ProjectRead, ProjectReadWithCounts, ProjectSummary, ProjectUpdate
+from app.schemas.project_deletion import ProjectDeletionRead
 from app.services.project_service import ProjectService
 
 
@@ -17,25 +22,78 @@ def create_project(project_data: ProjectCreate, session: Session = Depends(get_s
     return service.create_project(project_data, current_user)
 
 
+@router.post("/{project_id}/clone", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
+def clone_project(
+    project_id: int,
+    clone_data: ProjectClone,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(require_roles("admin", "manager"))
+):
+    """New project with copies of the source's documents, optionally its grants and version history."""
+    service = ProjectService(session)
+    return service.clone_project(project_id, clone_data, current_user)
+
+
 
 @router.get("/", response_model=List[ProjectRead])
 def list_projects( skip: int = Query(default=0, ge=0), limit: int = Query(default=20, ge=1, le=100),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)):
 
     service = ProjectService(session)
-    return service.list_projects(current_user, skip, limit)
+    return ORJSONResponse(service.list_projects(current_user, skip, limit, fields))
 
 
-@router.get("/{project_id}", response_model=ProjectRead)
+@router.get("/{project_id}", response_model=ProjectReadWithCounts)
 def get_project(
+    request: Request,
     project_id: int,
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     
     service = ProjectService(session)
-    return service.get_project(project_id, current_user)
+
+    def build():
+        project = service.get_project(project_id, current_user, fields)
+        if fields is not None:
+            return ORJSONResponse(project)
+        return project
+
+    return cached_response(
+        request, service.cache_scope(project_id, current_user), build, ProjectReadWithCounts
+    )
+
+
+@router.get("/{project_id}/summary", response_model=ProjectSummary)
+def get_project_summary(
+    project_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Document counts per status, members, last activity and top editors, in one request."""
+    service = ProjectService(session)
+    return service.get_summary(project_id, current_user)
+
+
+@router.get("/{project_id}/events", response_class=StreamingResponse)
+def project_events(
+    project_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    service = ProjectService(session)
+    service.get_project(project_id, current_user, fields="id")
+    # the stream can stay open for hours; don't keep a pooled connection checked out
+    session.close()
+
+    return StreamingResponse(
+        event_stream(project_id, current_user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 
@@ -50,3 +108,25 @@ def update_project(
     return service.update_project(project_id, project_data, current_user)
 
 
+@router.delete("/{project_id}", response_model=ProjectDeletionRead, status_code=status.HTTP_202_ACCEPTED)
+def delete_project(
+    project_id: int,
+    response: Response,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Hide the project now and delete its documents and grants in the background."""
+    service = ProjectService(session)
+    job = service.delete_project(project_id, current_user)
+    response.headers["Location"] = f"/projects/{project_id}/deletion"
+    return job
+
+
+@router.get("/{project_id}/deletion", response_model=ProjectDeletionRead)
+def get_project_deletion(
+    project_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    service = ProjectService(session)
+    return service.get_deletion(project_id, current_user)
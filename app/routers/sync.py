@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+
+from app.core.security import get_current_user
+from app.core.serialization import ORJSONResponse
+from app.db.session import get_session
+from app.models.user import User
+from app.schemas.sync import SyncRead
+from app.services.sync_service import SyncService
+
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+@router.get("", response_model=SyncRead)
+def sync_changes(
+    since: int = Query(default=0, ge=0, description="`next` of the previous sync; 0 downloads everything"),
+    limit: int = Query(default=500, ge=1, le=1000, description="Changes per page"),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    service = SyncService(session)
+    return ORJSONResponse(service.changes_since(current_user, since, limit))
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session
 
-from app.core.security import require_admin
+from app.core.config import settings
+from app.core.ingest import BULK_REQUEST_BODY, read_records
+from app.core.security import get_current_user, require_admin
+from app.core.serialization import ORJSONResponse
 from app.db.session import get_session
-from app.schemas.user import UserRead
+from app.models.user import User
+from app.schemas.user import BulkUserReport, UserRead
 from app.services.user_service import UserService
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -15,6 +21,7 @@ def get_user_service(session: Session = Depends(get_session)) -> UserService:
 def list_users(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=500),
+    fields: Optional[str] = Query(default=None, description="Comma-separated subset of response fields, e.g. id,title"),
     is_admin: bool = Depends(require_admin),
     service: UserService = Depends(get_user_service)
 ):
@@ -24,4 +31,22 @@ def list_users(
             detail="Admin access required"
         )
     
-    return service.list_users(skip=skip, limit=limit)
\ No newline at end of file
+    return ORJSONResponse(service.list_users(skip=skip, limit=limit, fields=fields))
+
+
+@router.post("/bulk", response_model=BulkUserReport, openapi_extra=BULK_REQUEST_BODY)
+async def bulk_create_users(
+    request: Request,
+    is_admin: bool = Depends(require_admin),
+    current_user: User = Depends(get_current_user),
+    service: UserService = Depends(get_user_service)
+):
+    """Create users from a CSV (header `email,password,role`) or NDJSON body; reports every row."""
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    rows = await read_records(request, settings.BULK_MAX_ROWS)
+    return await run_in_threadpool(service.bulk_create, rows, current_user)
@@ -0,0 +1,28 @@
+from typing import Optional
+from pydantic import BaseModel
+
+from app.models.project_access import Permission
+from app.models.user import UserRole
+
+
+class AccessReportRow(BaseModel):
+    """One user's effective access to one project, and every source granting it."""
+    user_id: int
+    email: str
+    role: UserRole
+    is_active: bool
+    project_id: int
+    project_title: str
+    permission: Permission
+    owner: bool
+    admin: bool
+    direct_permission: Optional[Permission] = None
+    group_permission: Optional[Permission] = None
+
+
+class AccessReportPage(BaseModel):
+    """Rows after `after`; pass `next` as the following `after` while `has_more` is true."""
+    after: int
+    next: int
+    has_more: bool
+    items: list[AccessReportRow]
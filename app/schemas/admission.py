@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class AdmissionStatsRead(BaseModel):
+    route_class: str
+    concurrency: int
+    queue_size: int
+    in_flight: int
+    waiting: int
+    admitted: int
+    rejected: int
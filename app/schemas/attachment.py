@@ -0,0 +1,16 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class AttachmentRead(BaseModel):
+    id: int
+    document_id: int
+    filename: str
+    content_type: str
+    size: int
+    sha256: str
+    uploaded_by: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,24 @@
+from typing import Any, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class BatchItem(BaseModel):
+    id: Optional[str] = Field(None, description="Client reference echoed back in the response")
+    method: Literal["GET", "POST", "PATCH", "PUT", "DELETE"] = "GET"
+    path: str = Field(..., description="Route path with optional query string, e.g. /documents/5?details=true")
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    requests: list[BatchItem] = Field(..., min_length=1)
+    parallel: bool = Field(False, description="Run the sub-requests concurrently; GET only")
+
+
+class BatchItemResult(BaseModel):
+    id: Optional[str] = None
+    status: int
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    responses: list[BatchItemResult]
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class CacheStatsRead(BaseModel):
+    backend: str
+    hits: int
+    misses: int
+    not_modified: int
+    invalidations: int
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class CodecStatsRead(BaseModel):
+    codec: str
+    responses: int
+    bytes_in: int
+    bytes_out: int
+    ratio: float
+    cpu_ms: float
+
+
+class CompressionStatsRead(BaseModel):
+    codecs: list[CodecStatsRead]
+    skipped: dict[str, int]
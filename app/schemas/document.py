@@ -31,6 +31,6 @@ class DocumentRead(DocumentBase):
         from_attributes = True
 
 class DocumentReadWithDetails(DocumentRead):
-    creator_email: Optional[str] = None
-    updater_email: Optional[str] = None
-    version_count: int = 0
+    creator_email: Optional[str]
+    updater_email: Optional[str]
+    version_count: int
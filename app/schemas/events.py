@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class EventStatsRead(BaseModel):
+    subscribers: int
+    published: int
+    dropped: int
@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+from app.models.project_access import Permission
+
+
+class GroupCreate(BaseModel):
+    name: str = Field(..., min_length=3, max_length=120, description="Group name (3-120) chars")
+    description: Optional[str] = None
+
+
+class GroupRead(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    created_by: int
+    created_at: datetime
+    member_count: int = 0
+
+    class Config:
+        from_attributes = True
+
+
+class GroupMemberRead(BaseModel):
+    user_id: int
+    email: str
+    created_at: datetime
+
+
+class GroupReadWithMembers(GroupRead):
+    members: list[GroupMemberRead] = []
+
+
+class GroupMembersAdd(BaseModel):
+    user_ids: list[int] = Field(..., min_length=1)
+
+
+class GroupAccessCreate(BaseModel):
+    group_id: int
+    permission: Permission = Permission.viewer
+
+
+class GroupAccessRead(BaseModel):
+    id: int
+    project_id: int
+    group_id: int
+    group_name: Optional[str] = None
+    permission: Permission
+    granted_by: int
+    created_at: datetime
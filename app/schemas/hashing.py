@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class HashingStatsRead(BaseModel):
+    workers: int
+    queue_size: int
+    pending: int
+    completed: int
+    rejected: int
+    wait_avg_ms: float
+    wait_max_ms: float
+    hash_avg_ms: float
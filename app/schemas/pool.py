@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class PoolStatsRead(BaseModel):
+    name: str
+    pool_class: str
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_max_ms: float
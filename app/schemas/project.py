@@ -11,6 +11,12 @@ class ProjectCreate(ProjectBase):
     pass 
 
 
+class ProjectClone(ProjectBase):
+    """A new project copied from an existing one; `description` defaults to the source's."""
+    include_access: bool = Field(False, description="Copy the user and group grants; needs manage permission on the source")
+    include_history: bool = Field(False, description="Copy every document version instead of starting each document at version 1")
+
+
 class ProjectUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=3, max_length=120)
     description: Optional[str] = None
@@ -25,4 +31,29 @@ class ProjectRead(ProjectBase):
         from_attributes = True
 
 class ProjectReadWithOwner(ProjectRead):
-    owner_email: Optional[str] = None
\ No newline at end of file
+    owner_email: Optional[str] = None
+
+class ProjectReadWithCounts(ProjectRead):
+    draft_count: int = 0
+    published_count: int = 0
+    archived_count: int = 0
+
+
+class ProjectEditorStat(BaseModel):
+    user_id: int
+    email: str
+    versions: int
+    last_edit_at: datetime
+
+
+class ProjectSummary(BaseModel):
+    """Everything the project home page shows, from a handful of aggregate queries."""
+    project_id: int
+    title: str
+    documents: int
+    draft_count: int
+    published_count: int
+    archived_count: int
+    members: int
+    last_activity_at: datetime
+    top_editors: list[ProjectEditorStat]
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.models.project_access import Permission
 
@@ -26,4 +26,23 @@ class ProjectAccessRead(BaseModel):
 
 class ProjectAccessReadWithUser(ProjectAccessRead):
     user_email: Optional[str] = None
-    granter_email: Optional[str] = None
\ No newline at end of file
+    granter_email: Optional[str] = None
+
+
+class ProjectAccessBulkUpdate(BaseModel):
+    """Grants to add or change and users to revoke, applied in one transaction."""
+    grant: list[ProjectAccessCreate] = Field(default_factory=list)
+    revoke: list[int] = Field(default_factory=list)
+
+
+class AccessMatrixUpdate(ProjectAccessBulkUpdate):
+    """The same grants and revocations across several projects."""
+    project_ids: list[int] = Field(..., min_length=1)
+
+
+class ProjectAccessBulkResult(BaseModel):
+    project_id: int
+    granted: list[int] = []
+    updated: list[int] = []
+    unchanged: list[int] = []
+    revoked: list[int] = []
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+from app.models.project_deletion import DeletionStatus
+
+
+class ProjectDeletionRead(BaseModel):
+    id: int
+    project_id: int
+    project_title: str
+    requested_by: int
+    status: DeletionStatus
+    documents_total: int
+    documents_deleted: int
+    versions_deleted: int
+    attachments_deleted: int
+    grants_deleted: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
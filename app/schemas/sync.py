@@ -0,0 +1,28 @@
+from typing import Optional
+from pydantic import BaseModel
+
+from app.models.audit_log import EntityType
+from app.schemas.document import DocumentRead
+from app.schemas.project import ProjectRead
+from app.schemas.project_access import ProjectAccessRead
+
+
+class Tombstone(BaseModel):
+    entity_type: EntityType
+    id: int
+    project_id: Optional[int] = None
+
+
+class SyncRead(BaseModel):
+    """Changes after `since`; pass `next` as the following `since`.
+
+    A project tombstone also removes its documents and access grants on the
+    client. Keep calling while `has_more` is true.
+    """
+    since: int
+    next: int
+    has_more: bool
+    projects: list[ProjectRead]
+    documents: list[DocumentRead]
+    access: list[ProjectAccessRead]
+    deleted: list[Tombstone]
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone 
-from typing import Optional
+from typing import Literal, Optional
 import re 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
@@ -16,7 +16,7 @@ class UserCreate(UserBase):
     @field_validator('password')
     @classmethod 
     def validate(cls, value: str) -> str:
-        pattern = re.compile(r"(?.*[A-Za-z])(?=.*\d).{8, }")
+        pattern = re.compile(r"(?=.*[A-Za-z])(?=.*\d).{8,}")
         if not pattern.fullmatch(value):
             raise ValueError('Password must contain at least one letter and one digit')
         return value 
@@ -33,3 +33,16 @@ class UserRead(UserBase):
     created_at: datetime
     
 
+
+class BulkUserResult(BaseModel):
+    row: int
+    email: Optional[str] = None
+    status: Literal["created", "duplicate", "invalid"]
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkUserReport(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkUserResult]
@@ -0,0 +1,71 @@
+"""Production entry point: `python -m app.server`.
+
+Every option comes from `Settings` (`SERVER_*`, see .env.example). With
+`SERVER_WORKERS > 1` uvicorn starts that many worker processes sharing one
+listening socket, restarts any that die, and on SIGTERM/SIGINT stops
+accepting connections and lets each worker finish its in-flight requests
+for up to `SERVER_GRACEFUL_TIMEOUT_SECONDS`.
+
+Workers are started with the `spawn` method, so they do not share the
+supervisor's memory. `SERVER_PRELOAD` imports the app in the supervisor
+first, so a broken import fails once instead of in a restart loop of every
+worker. The one-time database setup (`create_db_and_tables`) also runs
+once in the supervisor, before any worker starts; the workers inherit
+`DATABASE_INIT_ON_STARTUP=false` and their lifespan only resumes deletion
+jobs, which workers claim one at a time.
+
+State that lives in a process does not cross workers: use
+`CACHE_BACKEND=sqlite` (or `none`) rather than `memory`, and expect SSE
+subscribers to see only the events published by their own worker.
+"""
+import importlib
+import logging
+import os
+
+import uvicorn
+
+from app.core.config import settings
+
+
+APP = "app.main:app"
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    logging.basicConfig(level=logging.DEBUG if settings.DEBUG else logging.INFO)
+
+    if settings.SERVER_PRELOAD:
+        importlib.import_module(APP.split(":")[0])
+
+    if settings.DATABASE_INIT_ON_STARTUP:
+        from app.db.session import create_db_and_tables
+        create_db_and_tables()
+        # spawned workers read their settings from this environment
+        os.environ["DATABASE_INIT_ON_STARTUP"] = "false"
+        settings.DATABASE_INIT_ON_STARTUP = False
+
+    if settings.SERVER_WORKERS > 1:
+        if settings.CACHE_BACKEND == "memory":
+            logger.warning(
+                "CACHE_BACKEND=memory with %d workers: invalidations only reach the worker "
+                "that made the change; set CACHE_BACKEND=sqlite", settings.SERVER_WORKERS
+            )
+        logger.info("SSE subscribers only receive events published by their own worker")
+
+    uvicorn.run(
+        APP,
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=settings.SERVER_WORKERS,
+        loop=settings.SERVER_LOOP,
+        http=settings.SERVER_HTTP,
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        log_level="debug" if settings.DEBUG else "info",
+    )
+
+
+if __name__ == "__main__":
+    main()
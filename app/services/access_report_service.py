@@ -0,0 +1,118 @@
+from typing import Iterator, Optional
+from sqlmodel import Session, select
+from fastapi import HTTPException, status
+
+from app.core.permissions import access_report_select, can_manage_project, permission_for_rank
+from app.db.session import read_engine
+from app.models.project import Project
+from app.models.user import User, UserRole
+
+
+# rows per query while streaming an export
+EXPORT_PAGE_SIZE = 1000
+
+
+class AccessReportService:
+    """Who can reach what: effective access per user or per project.
+
+    Both reports run `access_report_select` scoped to the one user or
+    project, joined to users and projects for display, and page by keyset
+    on the other side of the pair (project_id for a user, user_id for a
+    project).
+    """
+    def __init__(self, session: Session):
+        self.session = session
+
+    def check_user_report(self, user_id: int, viewer: User) -> None:
+        if viewer.role != UserRole.admin and viewer.id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Admin access required"
+            )
+        if not self.session.get(User, user_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+
+    def check_project_report(self, project_id: int, viewer: User) -> None:
+        project = self.session.get(Project, project_id)
+        if not project or project.deleting:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
+        if not can_manage_project(self.session, viewer, project_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only admin or project owner can view the access report"
+            )
+
+    def _rows(self, user_id: Optional[int], project_id: Optional[int], after: int, limit: int) -> list[dict]:
+        report = access_report_select(user_id=user_id, project_id=project_id).subquery()
+        key = report.c.project_id if user_id is not None else report.c.user_id
+        statement = (
+            select(report, User.email, User.role, User.is_active, Project.title)
+            .join(User, User.id == report.c.user_id)
+            .join(Project, Project.id == report.c.project_id)
+            .where(key > after)
+            .order_by(key)
+            .limit(limit)
+        )
+        return [
+            {
+                "user_id": row.user_id,
+                "email": row.email,
+                "role": row.role,
+                "is_active": row.is_active,
+                "project_id": row.project_id,
+                "project_title": row.title,
+                "permission": permission_for_rank(row.rank),
+                "owner": bool(row.owner),
+                "admin": bool(row.admin),
+                "direct_permission": permission_for_rank(row.direct),
+                "group_permission": permission_for_rank(row.group_rank),
+            }
+            for row in self.session.exec(statement).all()
+        ]
+
+    def _page(self, user_id: Optional[int], project_id: Optional[int], after: int, limit: int) -> dict:
+        rows = self._rows(user_id, project_id, after, limit + 1)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        key = "project_id" if user_id is not None else "user_id"
+        return {
+            "after": after,
+            "next": rows[-1][key] if rows else after,
+            "has_more": has_more,
+            "items": rows,
+        }
+
+    def _export(self, user_id: Optional[int], project_id: Optional[int]) -> Iterator[dict]:
+        """Reads through sessions of its own: the response streams after the request's session is gone."""
+        key = "project_id" if user_id is not None else "user_id"
+        after = 0
+        while True:
+            # one short session per page hands the connection back while the client sets the pace
+            with Session(read_engine) as session:
+                rows = AccessReportService(session)._rows(user_id, project_id, after, EXPORT_PAGE_SIZE)
+            yield from rows
+            if len(rows) < EXPORT_PAGE_SIZE:
+                return
+            after = rows[-1][key]
+
+    def user_report(self, user_id: int, viewer: User, after: int = 0, limit: int = 100) -> dict:
+        self.check_user_report(user_id, viewer)
+        return self._page(user_id, None, after, limit)
+
+    def project_report(self, project_id: int, viewer: User, after: int = 0, limit: int = 100) -> dict:
+        self.check_project_report(project_id, viewer)
+        return self._page(None, project_id, after, limit)
+
+    def export_user_report(self, user_id: int) -> Iterator[dict]:
+        """All rows of a user's report, page by page; call `check_user_report` first."""
+        return self._export(user_id, None)
+
+    def export_project_report(self, project_id: int) -> Iterator[dict]:
+        """All rows of a project's report, page by page; call `check_project_report` first."""
+        return self._export(None, project_id)
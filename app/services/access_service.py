@@ -1,14 +1,34 @@
+import json
+from datetime import datetime, timezone
 from typing import Optional
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Session, select
 from fastapi import HTTPException, status
 
 from app.core.audit import log_action
-from app.core.permissions import can_manage_project
-from app.models.audit_log import EntityType
+from app.core.cache import invalidate
+from app.core.changes import record_change, record_changes
+from app.core.config import settings
+from app.core.events import publish
+from app.core.permissions import can_manage_project, publish_permission_changes, refresh_effective_permissions
+from app.db import statements
+from app.models.audit_log import AuditLog, EntityType
+from app.models.change_log import ChangeOp
 from app.models.project import Project
 from app.models.project_access import ProjectAccess
-from app.models.user import User
-from app.schemas.project_access import ProjectAccessCreate, ProjectAccessReadWithUser
+from app.models.user import User, UserRole
+from app.schemas.project_access import ProjectAccessBulkResult, ProjectAccessBulkUpdate, ProjectAccessCreate, ProjectAccessReadWithUser
+
+
+def _upsert_access(dialect_name: str):
+    """INSERT ... ON CONFLICT (project_id, user_id) DO UPDATE, for SQLite and PostgreSQL."""
+    dialect = postgresql if dialect_name == "postgresql" else sqlite
+    statement = dialect.insert(ProjectAccess)
+    return statement.on_conflict_do_update(
+        index_elements=["project_id", "user_id"],
+        set_={"permission": statement.excluded.permission, "granted_by": statement.excluded.granted_by}
+    ).returning(ProjectAccess.id, ProjectAccess.project_id, ProjectAccess.user_id)
 
 class AccessService:
     def __init__(self, session: Session):
@@ -16,7 +36,7 @@ class AccessService:
     
     def _check_project_exists(self, project_id: int) -> Project:
         project = self.session.get(Project, project_id)
-        if not project:
+        if not project or project.deleting:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found"
@@ -41,11 +61,10 @@ class AccessService:
             )
         
     def get_access(self, project_id: int, user_id: int) -> Optional[ProjectAccess]:
-        statement = select(ProjectAccess).where(
-            ProjectAccess.project_id == project_id,
-            ProjectAccess.user_id == user_id
-        )
-        return self.session.exec(statement).first()
+        return self.session.exec(
+            statements.project_access_for_user,
+            params={"project_id": project_id, "user_id": user_id}
+        ).first()
         
     def grant_access(self, project_id: int, access_data: ProjectAccessCreate, granted_by: User) -> ProjectAccessReadWithUser:
         self._check_project_exists(project_id)
@@ -58,8 +77,15 @@ class AccessService:
             existing_access.permission = access_data.permission
             existing_access.granted_by = granted_by.id
             self.session.add(existing_access)
+            record_change(self.session, EntityType.access, existing_access.id, project_id,
+                          user_id=access_data.user_id)
+            permission_changes = refresh_effective_permissions(self.session, [access_data.user_id], [project_id])
             self.session.commit()
+            invalidate(f"access:{project_id}")
             self.session.refresh(existing_access)
+            publish(project_id, "access.updated", user_id=access_data.user_id,
+                    permission=access_data.permission, actor_id=granted_by.id)
+            publish_permission_changes(permission_changes, granted_by.id)
             access = existing_access
             action = "update_access"
 
@@ -72,8 +98,16 @@ class AccessService:
                 granted_by=granted_by.id
             )
             self.session.add(access)
+            self.session.flush()
+            record_change(self.session, EntityType.access, access.id, project_id,
+                          user_id=access_data.user_id)
+            permission_changes = refresh_effective_permissions(self.session, [access_data.user_id], [project_id])
             self.session.commit()
+            invalidate(f"access:{project_id}")
             self.session.refresh(access)
+            publish(project_id, "access.granted", user_id=access_data.user_id,
+                    permission=access_data.permission, actor_id=granted_by.id)
+            publish_permission_changes(permission_changes, granted_by.id)
             action = "grant_access"
 
         log_action(
@@ -114,7 +148,13 @@ class AccessService:
         
         access_id = access.id
         self.session.delete(access)
+        record_change(self.session, EntityType.access, access_id, project_id,
+                      op=ChangeOp.delete, user_id=user_id)
+        permission_changes = refresh_effective_permissions(self.session, [user_id], [project_id])
         self.session.commit()
+        invalidate(f"access:{project_id}")
+        publish(project_id, "access.revoked", user_id=user_id, actor_id=revoked_by.id)
+        publish_permission_changes(permission_changes, revoked_by.id)
 
         log_action(
             session=self.session,
@@ -128,6 +168,133 @@ class AccessService:
             }
         )
 
+    def bulk_update_access(self, project_ids: list[int], changes: ProjectAccessBulkUpdate,
+                           granted_by: User) -> list[ProjectAccessBulkResult]:
+        """Apply the same grants and revocations to every project in one transaction.
+
+        Projects and users are each checked with one query, grants go through
+        a single multi-row upsert and revocations through one DELETE. Grants
+        that already have the requested permission are left untouched.
+        """
+        project_ids = list(dict.fromkeys(project_ids))
+        grants = {grant.user_id: grant.permission for grant in changes.grant}
+        revoke = set(changes.revoke)
+        if len(grants) != len(changes.grant) or len(revoke) != len(changes.revoke) or revoke & grants.keys():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Each user may appear only once per request"
+            )
+        if len(project_ids) * (len(grants) + len(revoke)) > settings.BULK_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {settings.BULK_MAX_ROWS} grants and revocations per request"
+            )
+
+        self._check_projects_manageable(project_ids, granted_by)
+        user_ids = sorted(grants.keys() | revoke)
+        self._check_users_exist(user_ids)
+
+        existing = {
+            (access.project_id, access.user_id): access
+            for access in self.session.exec(
+                select(ProjectAccess.id, ProjectAccess.project_id, ProjectAccess.user_id, ProjectAccess.permission)
+                .where(ProjectAccess.project_id.in_(project_ids), ProjectAccess.user_id.in_(user_ids))
+            ).all()
+        }
+
+        results = {project_id: ProjectAccessBulkResult(project_id=project_id) for project_id in project_ids}
+        actions = {}
+        values = []
+        now = datetime.now(timezone.utc)
+        for project_id in project_ids:
+            result = results[project_id]
+            for user_id, permission in grants.items():
+                current = existing.get((project_id, user_id))
+                if current is not None and current.permission == permission:
+                    result.unchanged.append(user_id)
+                    continue
+                (result.updated if current is not None else result.granted).append(user_id)
+                actions[project_id, user_id] = "update_access" if current is not None else "grant_access"
+                values.append({"project_id": project_id, "user_id": user_id, "permission": permission,
+                               "granted_by": granted_by.id, "created_at": now})
+        revoked = [
+            existing[project_id, user_id]
+            for project_id in project_ids for user_id in sorted(revoke) if (project_id, user_id) in existing
+        ]
+        for access in revoked:
+            results[access.project_id].revoked.append(access.user_id)
+
+        upserted = []
+        if values:
+            upserted = self.session.exec(
+                _upsert_access(self.session.get_bind().dialect.name), params=values
+            ).all()
+        if revoked:
+            self.session.exec(delete(ProjectAccess).where(ProjectAccess.id.in_([access.id for access in revoked])))
+
+        record_changes(self.session, EntityType.access,
+                       [(access.id, access.project_id, access.user_id) for access in upserted])
+        record_changes(self.session, EntityType.access,
+                       [(access.id, access.project_id, access.user_id) for access in revoked], op=ChangeOp.delete)
+
+        audit_rows = [
+            {"user_id": granted_by.id, "action": actions[access.project_id, access.user_id],
+             "entity_type": EntityType.access, "entity_id": access.id, "created_at": now,
+             "meta": json.dumps({"project_id": access.project_id, "target_user_id": access.user_id,
+                                 "permission": grants[access.user_id].value, "bulk": True})}
+            for access in upserted
+        ] + [
+            {"user_id": granted_by.id, "action": "revoke_access", "entity_type": EntityType.access,
+             "entity_id": access.id, "created_at": now,
+             "meta": json.dumps({"project_id": access.project_id, "target_user_id": access.user_id, "bulk": True})}
+            for access in revoked
+        ]
+        if audit_rows:
+            self.session.exec(insert(AuditLog), params=audit_rows)
+        changed = {access.project_id for access in upserted} | {access.project_id for access in revoked}
+        permission_changes = refresh_effective_permissions(
+            self.session,
+            {access.user_id for access in upserted} | {access.user_id for access in revoked},
+            changed
+        )
+        self.session.commit()
+
+        invalidate(*(f"access:{project_id}" for project_id in sorted(changed)))
+        for access in upserted:
+            event = "access.updated" if actions[access.project_id, access.user_id] == "update_access" else "access.granted"
+            publish(access.project_id, event, user_id=access.user_id,
+                    permission=grants[access.user_id], actor_id=granted_by.id)
+        for access in revoked:
+            publish(access.project_id, "access.revoked", user_id=access.user_id, actor_id=granted_by.id)
+        publish_permission_changes(permission_changes, granted_by.id)
+
+        return list(results.values())
+
+    def _check_projects_manageable(self, project_ids: list[int], user: User) -> None:
+        owners = dict(self.session.exec(
+            select(Project.id, Project.owner_id).where(Project.id.in_(project_ids), ~Project.deleting)
+        ).all())
+        missing = [project_id for project_id in project_ids if project_id not in owners]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Projects not found: {missing}"
+            )
+        if user.role != UserRole.admin and any(owner_id != user.id for owner_id in owners.values()):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only admin or project owner can manage access"
+            )
+
+    def _check_users_exist(self, user_ids: list[int]) -> None:
+        found = set(self.session.exec(select(User.id).where(User.id.in_(user_ids))).all()) if user_ids else set()
+        missing = sorted(set(user_ids) - found)
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Target users not found: {missing}"
+            )
+
     def list_project_access(self, project_id: int, user: User) -> list[ProjectAccessReadWithUser]:
         self._check_project_exists(project_id)
         self._check_manage_permission(user, project_id)
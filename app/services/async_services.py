@@ -0,0 +1,248 @@
+from typing import Any, Callable, Optional, Union
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.blobs import StoredBlob
+from app.core.cache import CacheScope
+from app.core.hashing import hash_many_async
+from app.core.ingest import ParsedRow
+from app.core.security import get_password_hash_async, password_needs_rehash, verify_password_async
+from app.models.attachment import Attachment
+from app.models.document import Document, DocumentStatus
+from app.models.document_version import DocumentVersion
+from app.models.project import Project
+from app.models.project_deletion import ProjectDeletion
+from app.models.user import User, UserRole
+from app.schemas.document import DocumentCreate, DocumentReadWithDetails, DocumentUpdate
+from app.schemas.group import GroupAccessCreate, GroupAccessRead, GroupCreate, GroupRead, GroupReadWithMembers
+from app.schemas.project import ProjectClone, ProjectCreate, ProjectUpdate
+from app.schemas.project_access import ProjectAccessBulkResult, ProjectAccessBulkUpdate, ProjectAccessCreate, ProjectAccessReadWithUser
+from app.schemas.token import Token
+from app.schemas.user import UserCreate, UserLogin
+from app.services.access_report_service import AccessReportService
+from app.services.access_service import AccessService
+from app.services.attachment_service import AttachmentService
+from app.services.document_service import DocumentService
+from app.services.group_service import GroupService
+from app.services.project_service import ProjectService
+from app.services.sync_service import SyncService
+from app.services.user_service import UserService, bulk_report
+
+
+class AsyncServiceBase:
+    """Runs the sync service logic on the async session's event loop.
+
+    AsyncSession.run_sync executes the service inside a greenlet, so every
+    query awaits the async driver (aiosqlite / asyncpg) instead of blocking
+    a threadpool worker, while the business rules stay in one place.
+    """
+    service_class: Callable[[Session], Any]
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _run(self, method: str, *args, **kwargs) -> Any:
+        def call(sync_session: Session) -> Any:
+            service = self.service_class(sync_session)
+            return getattr(service, method)(*args, **kwargs)
+
+        return await self.session.run_sync(call)
+
+
+class AsyncDocumentService(AsyncServiceBase):
+    service_class = DocumentService
+
+    async def get_by_id(self, doc_id: int) -> Optional[Document]:
+        return await self.session.get(Document, doc_id)
+
+    async def cache_scope(self, doc_id: int, user: User) -> Optional[CacheScope]:
+        return await self._run("cache_scope", doc_id, user)
+
+    async def create_document(self, project_id: int, doc_data: DocumentCreate, user: User) -> Document:
+        return await self._run("create_document", project_id, doc_data, user)
+
+    async def list_documents(self, project_id: int, user: User, skip: int = 0, limit: int = 20,
+                             details: bool = False, fields: Optional[str] = None) -> Union[list[dict], list[DocumentReadWithDetails]]:
+        return await self._run("list_documents", project_id, user, skip, limit, details, fields)
+
+    async def get_document(self, doc_id: int, user: User, details: bool = False,
+                           fields: Optional[str] = None) -> Union[Document, DocumentReadWithDetails, dict]:
+        return await self._run("get_document", doc_id, user, details, fields)
+
+    async def update_document(self, doc_id: int, doc_data: DocumentUpdate, user: User) -> Document:
+        return await self._run("update_document", doc_id, doc_data, user)
+
+    async def change_status(self, doc_id: int, new_status: DocumentStatus, user: User) -> Document:
+        return await self._run("change_status", doc_id, new_status, user)
+
+    async def list_versions(self, doc_id: int, user: User, fields: Optional[str] = None) -> list[dict]:
+        return await self._run("list_versions", doc_id, user, fields)
+
+    async def get_version(self, doc_id: int, version: int, user: User,
+                          fields: Optional[str] = None) -> Union[DocumentVersion, dict]:
+        return await self._run("get_version", doc_id, version, user, fields)
+
+    async def restore_version(self, doc_id: int, version: int, user: User) -> Document:
+        return await self._run("restore_version", doc_id, version, user)
+
+
+class AsyncAttachmentService(AsyncServiceBase):
+    service_class = AttachmentService
+
+    async def check_upload(self, doc_id: int, user: User) -> None:
+        return await self._run("check_upload", doc_id, user)
+
+    async def create_attachment(self, doc_id: int, filename: str, content_type: str, blob: StoredBlob,
+                                user: User) -> Attachment:
+        return await self._run("create_attachment", doc_id, filename, content_type, blob, user)
+
+    async def list_attachments(self, doc_id: int, user: User) -> list[Attachment]:
+        return await self._run("list_attachments", doc_id, user)
+
+    async def get_attachment(self, doc_id: int, attachment_id: int, user: User) -> Attachment:
+        return await self._run("get_attachment", doc_id, attachment_id, user)
+
+    async def delete_attachment(self, doc_id: int, attachment_id: int, user: User) -> None:
+        return await self._run("delete_attachment", doc_id, attachment_id, user)
+
+
+class AsyncProjectService(AsyncServiceBase):
+    service_class = ProjectService
+
+    async def get_by_id(self, project_id: int) -> Optional[Project]:
+        project = await self.session.get(Project, project_id)
+        if project is None or project.deleting:
+            return None
+        return project
+
+    async def cache_scope(self, project_id: int, user: User) -> Optional[CacheScope]:
+        return await self._run("cache_scope", project_id, user)
+
+    async def create_project(self, project_data: ProjectCreate, owner: User) -> Project:
+        return await self._run("create_project", project_data, owner)
+
+    async def clone_project(self, source_id: int, clone_data: ProjectClone, owner: User) -> Project:
+        return await self._run("clone_project", source_id, clone_data, owner)
+
+    async def list_projects(self, user: User, skip: int = 0, limit: int = 20,
+                            fields: Optional[str] = None) -> list[dict]:
+        return await self._run("list_projects", user, skip, limit, fields)
+
+    async def get_project(self, project_id: int, user: User, fields: Optional[str] = None) -> Union[Project, dict]:
+        return await self._run("get_project", project_id, user, fields)
+
+    async def get_summary(self, project_id: int, user: User) -> dict:
+        return await self._run("get_summary", project_id, user)
+
+    async def update_project(self, project_id: int, project_data: ProjectUpdate, user: User) -> Project:
+        return await self._run("update_project", project_id, project_data, user)
+
+    async def delete_project(self, project_id: int, user: User) -> ProjectDeletion:
+        return await self._run("delete_project", project_id, user)
+
+    async def get_deletion(self, project_id: int, user: User) -> ProjectDeletion:
+        return await self._run("get_deletion", project_id, user)
+
+
+class AsyncAccessService(AsyncServiceBase):
+    service_class = AccessService
+
+    async def grant_access(self, project_id: int, access_data: ProjectAccessCreate, granted_by: User) -> ProjectAccessReadWithUser:
+        return await self._run("grant_access", project_id, access_data, granted_by)
+
+    async def revoke_access(self, project_id: int, user_id: int, revoked_by: User) -> None:
+        return await self._run("revoke_access", project_id, user_id, revoked_by)
+
+    async def list_project_access(self, project_id: int, user: User) -> list[ProjectAccessReadWithUser]:
+        return await self._run("list_project_access", project_id, user)
+
+    async def bulk_update_access(self, project_ids: list[int], changes: ProjectAccessBulkUpdate,
+                                 granted_by: User) -> list[ProjectAccessBulkResult]:
+        return await self._run("bulk_update_access", project_ids, changes, granted_by)
+
+
+class AsyncAccessReportService(AsyncServiceBase):
+    service_class = AccessReportService
+
+    async def user_report(self, user_id: int, viewer: User, after: int = 0, limit: int = 100) -> dict:
+        return await self._run("user_report", user_id, viewer, after, limit)
+
+    async def project_report(self, project_id: int, viewer: User, after: int = 0, limit: int = 100) -> dict:
+        return await self._run("project_report", project_id, viewer, after, limit)
+
+
+class AsyncGroupService(AsyncServiceBase):
+    service_class = GroupService
+
+    async def create_group(self, group_data: GroupCreate, created_by: User) -> GroupRead:
+        return await self._run("create_group", group_data, created_by)
+
+    async def list_groups(self, skip: int = 0, limit: int = 20) -> list[GroupRead]:
+        return await self._run("list_groups", skip, limit)
+
+    async def get_group(self, group_id: int) -> GroupReadWithMembers:
+        return await self._run("get_group", group_id)
+
+    async def delete_group(self, group_id: int, deleted_by: User) -> None:
+        return await self._run("delete_group", group_id, deleted_by)
+
+    async def add_members(self, group_id: int, user_ids: list[int], added_by: User) -> GroupReadWithMembers:
+        return await self._run("add_members", group_id, user_ids, added_by)
+
+    async def remove_member(self, group_id: int, user_id: int, removed_by: User) -> None:
+        return await self._run("remove_member", group_id, user_id, removed_by)
+
+    async def grant_group_access(self, project_id: int, access_data: GroupAccessCreate, granted_by: User) -> GroupAccessRead:
+        return await self._run("grant_group_access", project_id, access_data, granted_by)
+
+    async def revoke_group_access(self, project_id: int, group_id: int, revoked_by: User) -> None:
+        return await self._run("revoke_group_access", project_id, group_id, revoked_by)
+
+    async def list_group_access(self, project_id: int, user: User) -> list[GroupAccessRead]:
+        return await self._run("list_group_access", project_id, user)
+
+
+class AsyncSyncService(AsyncServiceBase):
+    service_class = SyncService
+
+    async def changes_since(self, user: User, since: int = 0, limit: int = 500) -> dict:
+        return await self._run("changes_since", user, since, limit)
+
+
+class AsyncUserService(AsyncServiceBase):
+    service_class = UserService
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self._run("get_by_email", email)
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        return await self.session.get(User, user_id)
+
+    # bcrypt runs on the hashing pool and is awaited outside run_sync, so a
+    # login never blocks the event loop
+
+    async def create_user(self, user_data: UserCreate, created_by: User) -> User:
+        password_hash = await get_password_hash_async(user_data.password)
+        return await self._run("create_user", user_data, created_by, password_hash)
+
+    async def bulk_create(self, rows: list[ParsedRow], created_by: User) -> dict:
+        results, pending = await self._run("check_bulk_rows", rows)
+        await self.session.rollback()
+        password_hashes = await hash_many_async([user_data.password for _, user_data in pending])
+        results += await self._run("insert_bulk_users", pending, password_hashes, created_by)
+        return bulk_report(results)
+
+    async def authenticate(self, credentials: UserLogin) -> Token:
+        user = await self.get_by_email(credentials.email)
+        password_hash = user.password_hash if user else None
+        await self.session.rollback()
+
+        valid = password_hash is not None and await verify_password_async(credentials.password, password_hash)
+        new_hash = None
+        if valid and password_needs_rehash(password_hash):
+            new_hash = await get_password_hash_async(credentials.password)
+        return await self._run("complete_login", user, valid, new_hash)
+
+    async def list_users(self, skip: int = 0, limit: int = 20, role: Optional[UserRole] = None,
+                         fields: Optional[str] = None) -> list[dict]:
+        return await self._run("list_users", skip, limit, role, fields)
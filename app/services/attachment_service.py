@@ -0,0 +1,124 @@
+import posixpath
+from sqlmodel import Session, select
+from fastapi import HTTPException, status
+
+from app.core.audit import log_action
+from app.core.blobs import StoredBlob
+from app.core.events import publish
+from app.core.permissions import can_edit_project, can_view_project
+from app.models.attachment import Attachment
+from app.models.audit_log import EntityType
+from app.models.document import Document
+from app.models.project import Project
+from app.models.user import User
+
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+
+class AttachmentService:
+    """Attachment metadata; the bytes are stored and served by `app.core.blobs`."""
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _check_document(self, doc_id: int) -> Document:
+        document = self.session.get(Document, doc_id)
+        # an upload racing the deletion worker would be left behind, or break its DELETE
+        if not document or self.session.get(Project, document.project_id).deleting:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Document not found"
+            )
+        return document
+
+    def _get_attachment(self, doc_id: int, attachment_id: int) -> Attachment:
+        attachment = self.session.get(Attachment, attachment_id)
+        if not attachment or attachment.document_id != doc_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Attachment not found"
+            )
+        return attachment
+
+    def check_upload(self, doc_id: int, user: User) -> None:
+        """Run before the body is read, so a refused upload is never streamed to disk."""
+        document = self._check_document(doc_id)
+        if not can_edit_project(self.session, user, document.project_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Editor access required"
+            )
+
+    def check_view(self, doc_id: int, user: User) -> Document:
+        document = self._check_document(doc_id)
+        if not can_view_project(self.session, user, document.project_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied to this project"
+            )
+        return document
+
+    def create_attachment(self, doc_id: int, filename: str, content_type: str, blob: StoredBlob,
+                          user: User) -> Attachment:
+        self.check_upload(doc_id, user)
+        # keep the base name only; clients may send a full local path
+        filename = posixpath.basename(filename.replace("\\", "/")).strip()
+        if not filename:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Filename is required"
+            )
+
+        document = self.session.get(Document, doc_id)
+        attachment = Attachment(
+            document_id=doc_id,
+            filename=filename[:255],
+            content_type=content_type.split(";", 1)[0].strip()[:255] or DEFAULT_CONTENT_TYPE,
+            size=blob.size,
+            sha256=blob.sha256,
+            uploaded_by=user.id
+        )
+        self.session.add(attachment)
+        self.session.commit()
+        self.session.refresh(attachment)
+        publish(document.project_id, "attachment.added", document_id=doc_id, attachment_id=attachment.id,
+                filename=attachment.filename, size=attachment.size, actor_id=user.id)
+
+        log_action(
+            session=self.session,
+            user_id=user.id,
+            action="upload_attachment",
+            entity_type=EntityType.document,
+            entity_id=doc_id,
+            meta={"attachment_id": attachment.id, "filename": attachment.filename, "size": attachment.size}
+        )
+        return attachment
+
+    def list_attachments(self, doc_id: int, user: User) -> list[Attachment]:
+        self.check_view(doc_id, user)
+        return self.session.exec(
+            select(Attachment).where(Attachment.document_id == doc_id).order_by(Attachment.id)
+        ).all()
+
+    def get_attachment(self, doc_id: int, attachment_id: int, user: User) -> Attachment:
+        self.check_view(doc_id, user)
+        return self._get_attachment(doc_id, attachment_id)
+
+    def delete_attachment(self, doc_id: int, attachment_id: int, user: User) -> None:
+        """Drop the row; the blob stays until `prune` finds it unreferenced."""
+        self.check_upload(doc_id, user)
+        attachment = self._get_attachment(doc_id, attachment_id)
+        project_id = self.session.get(Document, doc_id).project_id
+        filename = attachment.filename
+        self.session.delete(attachment)
+        self.session.commit()
+        publish(project_id, "attachment.deleted", document_id=doc_id, attachment_id=attachment_id, actor_id=user.id)
+
+        log_action(
+            session=self.session,
+            user_id=user.id,
+            action="delete_attachment",
+            entity_type=EntityType.document,
+            entity_id=doc_id,
+            meta={"attachment_id": attachment_id, "filename": filename}
+        )
@@ -1,17 +1,34 @@
 from datetime import datetime, timezone
-from typing import Optional
-from sqlmodel import Session, select, func
+from typing import Optional, Union
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, select
 from fastapi import HTTPException, status
 
 from app.core.audit import log_action
-from app.core.permissions import can_edit_project, can_view_project
+from app.core.cache import CacheScope, invalidate, memoize
+from app.core.changes import record_change
+from app.core.counters import shift_status_counts
+from app.core.events import publish
+from app.core.permissions import can_edit_project, can_view_project, get_permission_class
+from app.core.serialization import fetch_rows, parse_fields, schema_columns, select_fields
+from app.db import statements
 from app.models.audit_log import EntityType
 from app.models.document import Document, DocumentStatus
 from app.models.document_version import DocumentVersion
 from app.models.project import Project
 from app.models.user import User
-from app.schemas.document import DocumentCreate, DocumentUpdate
-from app.schemas.document_version import DocumentVersionReadWithCreator
+from app.schemas.document import DocumentCreate, DocumentRead, DocumentReadWithDetails, DocumentUpdate
+from app.schemas.document_version import DocumentVersionRead, DocumentVersionReadWithCreator
+
+
+DOCUMENT_COLUMNS = schema_columns(Document, DocumentRead)
+VERSION_COLUMNS = schema_columns(DocumentVersion, DocumentVersionReadWithCreator, creator_email=User.email)
+VERSION_READ_COLUMNS = schema_columns(DocumentVersion, DocumentVersionRead)
+
+
+def _in_live_project():
+    """Documents whose project is not being deleted; few projects ever are at once."""
+    return Document.project_id.not_in(select(Project.id).where(Project.deleting))
 
 
 class DocumentService:
@@ -23,7 +40,7 @@ class DocumentService:
     
     def _check_project_exists(self, project_id: int) -> Project:
         project = self.session.get(Project, project_id)
-        if not project:
+        if not project or project.deleting:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found"
@@ -33,13 +50,28 @@ class DocumentService:
 
     def _check_document_exists(self, doc_id: int) -> Document:
         document = self.get_by_id(doc_id)
-        if not document:
+        # documents of a project being deleted go with it, whatever the reader's role
+        if not document or self.session.get(Project, document.project_id).deleting:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Document not found"
             )
         return document
     
+    def cache_scope(self, doc_id: int, user: User) -> Optional[CacheScope]:
+        """Response cache scope for reads of one document; None bypasses the cache."""
+        project_id = memoize(
+            "document_project", (doc_id,), (f"document:{doc_id}",),
+            lambda: self.session.exec(statements.document_project_id, params={"document_id": doc_id}).first()
+        )
+        if project_id is None:
+            return None
+
+        permission = get_permission_class(self.session, user, project_id)
+        if permission is None:
+            return None
+        return CacheScope(permission, (f"document:{doc_id}", f"project:{project_id}"))
+
     def _check_edit_permission(self, user: User, project_id: int) -> None:
         if not can_edit_project(self.session, user, project_id):
             raise HTTPException(
@@ -65,11 +97,11 @@ class DocumentService:
             content=doc_data.content or "",
             status=DocumentStatus.draft,
             created_by=user.id,
-            updated_by=user.id
+            updated_by=user.id,
+            version_count=1
         )
         self.session.add(document)
-        self.session.commit()
-        self.session.refresh(document)
+        self.session.flush()
 
         version = DocumentVersion(
             document_id=document.id,
@@ -78,7 +110,13 @@ class DocumentService:
             created_by=user.id
         )
         self.session.add(version)
+        shift_status_counts(self.session, project_id, added=DocumentStatus.draft)
+        record_change(self.session, EntityType.document, document.id, project_id)
         self.session.commit()
+        self.session.refresh(document)
+        invalidate(f"project:{project_id}", f"document:{document.id}")
+        publish(project_id, "document.created", document_id=document.id,
+                title=document.title, status=document.status, actor_id=user.id)
 
         log_action(
             session=self.session,
@@ -92,20 +130,93 @@ class DocumentService:
         return document
 
 
-    def list_documents(self, project_id: int, user: User, skip: int = 0, limit: int = 20) -> list[Document]:
+    def _select_with_people(self):
+        # creator and updater are many-to-one, so both ride along as LEFT JOINs
+        # in the same query instead of one lookup per document
+        return select(Document).options(
+            joinedload(Document.creator),
+            joinedload(Document.updater)
+        )
+
+    def _to_details(self, document: Document) -> DocumentReadWithDetails:
+        return DocumentReadWithDetails(
+            id=document.id,
+            project_id=document.project_id,
+            title=document.title,
+            content=document.content,
+            status=document.status,
+            created_by=document.created_by,
+            updated_by=document.updated_by,
+            created_at=document.created_at,
+            updated_at=document.updated_at,
+            creator_email=document.creator.email if document.creator else None,
+            updater_email=document.updater.email if document.updater else None,
+            version_count=document.version_count
+        )
+
+    def _check_fields_without_details(self, fields: Optional[str], details: bool) -> None:
+        if fields is not None and details:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="fields cannot be combined with details"
+            )
+
+    def list_documents(self, project_id: int, user: User, skip: int = 0, limit: int = 20,
+                       details: bool = False, fields: Optional[str] = None) -> Union[list[dict], list[DocumentReadWithDetails]]:
+        self._check_fields_without_details(fields, details)
+        names = parse_fields(fields, DOCUMENT_COLUMNS)
         self._check_project_exists(project_id)
         self._check_view_permission(user, project_id)
 
-        statement = select(Document).where(
+        if not details:
+            statement = select_fields(DOCUMENT_COLUMNS, names).where(
+                Document.project_id == project_id
+            ).offset(skip).limit(limit)
+            return fetch_rows(self.session, statement)
+
+        statement = self._select_with_people().where(
             Document.project_id == project_id
         ).offset(skip).limit(limit)
-        return list(self.session.exec(statement).all())
+        documents = self.session.exec(statement).all()
+        return [self._to_details(document) for document in documents]
     
 
-    def get_document(self, doc_id: int, user: User) -> Document:
-        document = self._check_document_exists(doc_id)
+    def get_document(self, doc_id: int, user: User, details: bool = False,
+                     fields: Optional[str] = None) -> Union[Document, DocumentReadWithDetails, dict]:
+        self._check_fields_without_details(fields, details)
+        if fields is not None:
+            return self._get_document_fields(doc_id, user, parse_fields(fields, DOCUMENT_COLUMNS))
+
+        if not details:
+            document = self._check_document_exists(doc_id)
+            self._check_view_permission(user, document.project_id)
+            return document
+
+        statement = self._select_with_people().where(Document.id == doc_id, _in_live_project())
+        document = self.session.exec(statement).first()
+        if not document:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Document not found"
+            )
         self._check_view_permission(user, document.project_id)
-        return document
+        return self._to_details(document)
+
+    def _get_document_fields(self, doc_id: int, user: User, names: tuple[str, ...]) -> dict:
+        # project_id rides along for the permission check and is dropped
+        # again unless the client asked for it
+        statement = select_fields(DOCUMENT_COLUMNS, names + ("project_id",)).where(
+            Document.id == doc_id, _in_live_project()
+        )
+        rows = fetch_rows(self.session, statement)
+        if not rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Document not found"
+            )
+        row = rows[0]
+        self._check_view_permission(user, row["project_id"])
+        return {name: row[name] for name in names}
     
     def update_document(self, doc_id: int, doc_data: DocumentUpdate, user: User) -> Document:
         document = self._check_document_exists(doc_id)
@@ -123,9 +234,6 @@ class DocumentService:
         document.updated_by = user.id
         document.updated_at = datetime.now(timezone.utc)
         
-        self.session.add(document)
-        self.session.commit()
-
         if content_changed:
             max_version = self._get_max_version(doc_id)
             version = DocumentVersion(
@@ -135,9 +243,15 @@ class DocumentService:
                 created_by=user.id
             )
             self.session.add(version)
-            self.session.commit()
-        
+            document.version_count = Document.version_count + 1
+
+        self.session.add(document)
+        record_change(self.session, EntityType.document, doc_id, document.project_id)
+        self.session.commit()
         self.session.refresh(document)
+        invalidate(f"document:{doc_id}", f"summary:{document.project_id}")
+        publish(document.project_id, "document.updated", document_id=doc_id,
+                fields=list(update_data), version_count=document.version_count, actor_id=user.id)
 
         log_action(
             session=self.session,
@@ -155,10 +269,7 @@ class DocumentService:
     
 
     def _get_max_version(self, doc_id: int) -> int:
-        statement = select(func.max(DocumentVersion.version)).where(
-            DocumentVersion.document_id == doc_id
-        )
-        return self.session.exec(statement).first() or 0
+        return self.session.exec(statements.max_document_version, params={"document_id": doc_id}).first() or 0
 
 
         #5 записей где среди внешний ключей
@@ -183,8 +294,13 @@ class DocumentService:
         document.updated_at = datetime.now(timezone.utc)
         
         self.session.add(document)
+        shift_status_counts(self.session, document.project_id, added=new_status, removed=old_status)
+        record_change(self.session, EntityType.document, doc_id, document.project_id)
         self.session.commit()
         self.session.refresh(document)
+        invalidate(f"document:{doc_id}", f"project:{document.project_id}")
+        publish(document.project_id, "document.status_changed", document_id=doc_id,
+                old_status=old_status, status=new_status, actor_id=user.id)
 
 
         action_name = f"{new_status.value}_document"
@@ -199,41 +315,38 @@ class DocumentService:
         
         return document
     
-    def list_versions(self, doc_id: int, user: User) -> list[DocumentVersionReadWithCreator]:
+    def list_versions(self, doc_id: int, user: User, fields: Optional[str] = None) -> list[dict]:
+        names = parse_fields(fields, VERSION_COLUMNS)
         document = self._check_document_exists(doc_id)
         self._check_view_permission(user, document.project_id)
         
-        statement = select(DocumentVersion).where(
+        statement = select_fields(VERSION_COLUMNS, names).select_from(DocumentVersion)
+        if "creator_email" in names:
+            statement = statement.outerjoin(User, User.id == DocumentVersion.created_by)
+        statement = statement.where(
             DocumentVersion.document_id == doc_id
         ).order_by(DocumentVersion.version.desc())
-        versions = self.session.exec(statement).all()
-
-
-        result = []
-        for ver in versions:
-            creator = self.session.get(User, ver.created_by)
-            result.append(DocumentVersionReadWithCreator(
-                id=ver.id,
-                document_id=ver.document_id,
-                version=ver.version,
-                content_snapshot=ver.content_snapshot,
-                created_by=ver.created_by,
-                created_at=ver.created_at,
-                creator_email=creator.email if creator else None
-            ))
-        
-        return result
+        return fetch_rows(self.session, statement)
     
 
-    def get_version(self, doc_id: int, version: int, user: User) -> DocumentVersion:
+    def get_version(self, doc_id: int, version: int, user: User,
+                    fields: Optional[str] = None) -> Union[DocumentVersion, dict]:
+        names = parse_fields(fields, VERSION_READ_COLUMNS) if fields is not None else None
         document = self._check_document_exists(doc_id)
         self._check_view_permission(user, document.project_id)
         
-        statement = select(DocumentVersion).where(
-            DocumentVersion.document_id == doc_id,
-            DocumentVersion.version == version
-        )
-        ver = self.session.exec(statement).first()
+        if names is not None:
+            statement = select_fields(VERSION_READ_COLUMNS, names).where(
+                DocumentVersion.document_id == doc_id,
+                DocumentVersion.version == version
+            )
+            rows = fetch_rows(self.session, statement)
+            ver = rows[0] if rows else None
+        else:
+            ver = self.session.exec(
+                statements.document_version,
+                params={"document_id": doc_id, "version": version}
+            ).first()
         
         if not ver:
             raise HTTPException(
@@ -247,11 +360,10 @@ class DocumentService:
         document = self._check_document_exists(doc_id)
         self._check_edit_permission(user, document.project_id)
 
-        statement = select(DocumentVersion).where(
-            DocumentVersion.document_id == doc_id,
-            DocumentVersion.version == version
-        )
-        ver = self.session.exec(statement).first()
+        ver = self.session.exec(
+            statements.document_version,
+            params={"document_id": doc_id, "version": version}
+        ).first()
         
         if not ver:
             raise HTTPException(
@@ -259,23 +371,27 @@ class DocumentService:
                 detail="Version not found"
             )
         
+        max_version = self._get_max_version(doc_id)
+
         document.content = ver.content_snapshot
         document.updated_by = user.id
         document.updated_at = datetime.now(timezone.utc)
+        document.version_count = Document.version_count + 1
         
-        self.session.add(document)
-        self.session.commit()
-
-        max_version = self._get_max_version(doc_id)
         new_version = DocumentVersion(
             document_id=doc_id,
             version=max_version + 1,
-            content_snapshot=document.content,
+            content_snapshot=ver.content_snapshot,
             created_by=user.id
         )
+        self.session.add(document)
         self.session.add(new_version)
+        record_change(self.session, EntityType.document, doc_id, document.project_id)
         self.session.commit()
         self.session.refresh(document)
+        invalidate(f"document:{doc_id}", f"summary:{document.project_id}")
+        publish(document.project_id, "document.restored", document_id=doc_id,
+                restored_version=version, version_count=document.version_count, actor_id=user.id)
 
         log_action(
             session=self.session,
@@ -0,0 +1,270 @@
+from datetime import datetime, timezone
+from sqlalchemy import delete, func, insert
+from sqlmodel import Session, select
+from fastapi import HTTPException, status
+
+from app.core.audit import log_action
+from app.core.cache import invalidate
+from app.core.events import publish
+from app.core.permissions import PermissionChanges, can_manage_project, publish_permission_changes, refresh_effective_permissions
+from app.models.audit_log import EntityType
+from app.models.group import Group, GroupAccess, GroupMember
+from app.models.project import Project
+from app.models.user import User
+from app.schemas.group import GroupAccessCreate, GroupAccessRead, GroupCreate, GroupRead, GroupReadWithMembers
+
+
+class GroupService:
+    """Groups, their members and their project grants.
+
+    Every change recomputes the effective permissions it can affect, the
+    group's members x the group's projects, in the same transaction.
+    """
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _get_group(self, group_id: int) -> Group:
+        group = self.session.get(Group, group_id)
+        if not group:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Group not found"
+            )
+        return group
+
+    def _check_manage_permission(self, user: User, project_id: int) -> None:
+        project = self.session.get(Project, project_id)
+        if not project or project.deleting:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
+        if not can_manage_project(self.session, user, project_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only admin or project owner can manage access"
+            )
+
+    def _member_ids(self, group_id: int) -> list[int]:
+        return self.session.exec(select(GroupMember.user_id).where(GroupMember.group_id == group_id)).all()
+
+    def _project_ids(self, group_id: int) -> list[int]:
+        return self.session.exec(select(GroupAccess.project_id).where(GroupAccess.group_id == group_id)).all()
+
+    def _access_read(self, access: GroupAccess, group_name: str) -> GroupAccessRead:
+        return GroupAccessRead(
+            id=access.id,
+            project_id=access.project_id,
+            group_id=access.group_id,
+            group_name=group_name,
+            permission=access.permission,
+            granted_by=access.granted_by,
+            created_at=access.created_at
+        )
+
+    def _commit(self, changes: PermissionChanges, project_ids: list[int], actor: User) -> None:
+        self.session.commit()
+        invalidate(*(f"access:{project_id}" for project_id in sorted(set(project_ids))))
+        publish_permission_changes(changes, actor.id)
+
+    def create_group(self, group_data: GroupCreate, created_by: User) -> GroupRead:
+        if self.session.exec(select(Group.id).where(Group.name == group_data.name)).first():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Group name already exists"
+            )
+
+        group = Group(name=group_data.name, description=group_data.description, created_by=created_by.id)
+        self.session.add(group)
+        self.session.commit()
+        self.session.refresh(group)
+
+        log_action(
+            session=self.session,
+            user_id=created_by.id,
+            action="create_group",
+            entity_type=EntityType.group,
+            entity_id=group.id,
+            meta={"name": group.name}
+        )
+        return GroupRead.model_validate(group)
+
+    def list_groups(self, skip: int = 0, limit: int = 20) -> list[GroupRead]:
+        member_count = func.count(GroupMember.user_id).label("member_count")
+        statement = (
+            select(Group, member_count)
+            .outerjoin(GroupMember, GroupMember.group_id == Group.id)
+            .group_by(Group.id)
+            .order_by(Group.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [
+            GroupRead.model_validate(group).model_copy(update={"member_count": count})
+            for group, count in self.session.exec(statement).all()
+        ]
+
+    def get_group(self, group_id: int) -> GroupReadWithMembers:
+        group = self._get_group(group_id)
+        members = self.session.exec(
+            select(GroupMember.user_id, User.email, GroupMember.created_at)
+            .join(User, User.id == GroupMember.user_id)
+            .where(GroupMember.group_id == group_id)
+            .order_by(GroupMember.user_id)
+        ).all()
+        return GroupReadWithMembers(
+            **GroupRead.model_validate(group).model_dump(exclude={"member_count"}),
+            member_count=len(members),
+            members=[{"user_id": user_id, "email": email, "created_at": created_at}
+                     for user_id, email, created_at in members]
+        )
+
+    def delete_group(self, group_id: int, deleted_by: User) -> None:
+        group = self._get_group(group_id)
+        group_name = group.name
+        member_ids = self._member_ids(group_id)
+        project_ids = self._project_ids(group_id)
+
+        self.session.exec(delete(GroupAccess).where(GroupAccess.group_id == group_id))
+        self.session.exec(delete(GroupMember).where(GroupMember.group_id == group_id))
+        self.session.delete(group)
+        changes = refresh_effective_permissions(self.session, member_ids, project_ids)
+        self._commit(changes, project_ids, deleted_by)
+
+        log_action(
+            session=self.session,
+            user_id=deleted_by.id,
+            action="delete_group",
+            entity_type=EntityType.group,
+            entity_id=group_id,
+            meta={"name": group_name, "members": len(member_ids), "projects": len(project_ids)}
+        )
+
+    def add_members(self, group_id: int, user_ids: list[int], added_by: User) -> GroupReadWithMembers:
+        """Add users to a group; users who are already members are skipped."""
+        self._get_group(group_id)
+        user_ids = sorted(set(user_ids))
+        found = set(self.session.exec(select(User.id).where(User.id.in_(user_ids))).all())
+        missing = [user_id for user_id in user_ids if user_id not in found]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Target users not found: {missing}"
+            )
+
+        existing = set(self._member_ids(group_id))
+        new_ids = [user_id for user_id in user_ids if user_id not in existing]
+        if new_ids:
+            now = datetime.now(timezone.utc)
+            self.session.exec(insert(GroupMember), params=[
+                {"group_id": group_id, "user_id": user_id, "added_by": added_by.id, "created_at": now}
+                for user_id in new_ids
+            ])
+            project_ids = self._project_ids(group_id)
+            changes = refresh_effective_permissions(self.session, new_ids, project_ids)
+            self._commit(changes, project_ids, added_by)
+
+            log_action(
+                session=self.session,
+                user_id=added_by.id,
+                action="add_group_members",
+                entity_type=EntityType.group,
+                entity_id=group_id,
+                meta={"user_ids": new_ids}
+            )
+        return self.get_group(group_id)
+
+    def remove_member(self, group_id: int, user_id: int, removed_by: User) -> None:
+        self._get_group(group_id)
+        member = self.session.get(GroupMember, (group_id, user_id))
+        if not member:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Member not found"
+            )
+
+        self.session.delete(member)
+        project_ids = self._project_ids(group_id)
+        changes = refresh_effective_permissions(self.session, [user_id], project_ids)
+        self._commit(changes, project_ids, removed_by)
+
+        log_action(
+            session=self.session,
+            user_id=removed_by.id,
+            action="remove_group_member",
+            entity_type=EntityType.group,
+            entity_id=group_id,
+            meta={"target_user_id": user_id}
+        )
+
+    def grant_group_access(self, project_id: int, access_data: GroupAccessCreate, granted_by: User) -> GroupAccessRead:
+        self._check_manage_permission(granted_by, project_id)
+        group = self._get_group(access_data.group_id)
+
+        access = self.session.exec(
+            select(GroupAccess).where(GroupAccess.project_id == project_id, GroupAccess.group_id == group.id)
+        ).first()
+        action = "update_group_access" if access else "grant_group_access"
+        if access:
+            access.permission = access_data.permission
+            access.granted_by = granted_by.id
+        else:
+            access = GroupAccess(
+                project_id=project_id,
+                group_id=group.id,
+                permission=access_data.permission,
+                granted_by=granted_by.id
+            )
+        self.session.add(access)
+        self.session.flush()
+        changes = refresh_effective_permissions(self.session, self._member_ids(group.id), [project_id])
+        self._commit(changes, [project_id], granted_by)
+        self.session.refresh(access)
+        publish(project_id, "group_access.updated" if action == "update_group_access" else "group_access.granted",
+                group_id=group.id,
+                permission=access.permission, actor_id=granted_by.id)
+
+        log_action(
+            session=self.session,
+            user_id=granted_by.id,
+            action=action,
+            entity_type=EntityType.group,
+            entity_id=group.id,
+            meta={"project_id": project_id, "permission": access.permission.value}
+        )
+        return self._access_read(access, group.name)
+
+    def revoke_group_access(self, project_id: int, group_id: int, revoked_by: User) -> None:
+        self._check_manage_permission(revoked_by, project_id)
+        access = self.session.exec(
+            select(GroupAccess).where(GroupAccess.project_id == project_id, GroupAccess.group_id == group_id)
+        ).first()
+        if not access:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Access not found"
+            )
+
+        self.session.delete(access)
+        changes = refresh_effective_permissions(self.session, self._member_ids(group_id), [project_id])
+        self._commit(changes, [project_id], revoked_by)
+        publish(project_id, "group_access.revoked", group_id=group_id, actor_id=revoked_by.id)
+
+        log_action(
+            session=self.session,
+            user_id=revoked_by.id,
+            action="revoke_group_access",
+            entity_type=EntityType.group,
+            entity_id=group_id,
+            meta={"project_id": project_id}
+        )
+
+    def list_group_access(self, project_id: int, user: User) -> list[GroupAccessRead]:
+        self._check_manage_permission(user, project_id)
+        rows = self.session.exec(
+            select(GroupAccess, Group.name)
+            .join(Group, Group.id == GroupAccess.group_id)
+            .where(GroupAccess.project_id == project_id)
+            .order_by(GroupAccess.id)
+        ).all()
+        return [self._access_read(access, name) for access, name in rows]
@@ -1,22 +1,52 @@
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Optional, Union
+from sqlalchemy import func, insert, literal
 from sqlmodel import Session, select
 from fastapi import HTTPException, status
 
 from app.core.audit import log_action
-from app.core.permissions import can_manage_project, can_view_project
+from app.core.cache import CacheScope, invalidate, memoize
+from app.core.changes import record_change, record_changes
+from app.core.deletion import worker
+from app.core.events import publish
+from app.core.permissions import can_manage_project, can_view_project, get_permission_class, publish_permission_changes, refresh_effective_permissions
+from app.core.serialization import fetch_rows, parse_fields, schema_columns, select_fields
 from app.models.audit_log import EntityType
+from app.models.change_log import ChangeLog, ChangeOp
+from app.models.attachment import Attachment
+from app.models.document import Document, DocumentStatus
+from app.models.document_version import DocumentVersion
 from app.models.project import Project
+from app.models.project_deletion import DeletionStatus, ProjectDeletion
+from app.models.effective_permission import EffectivePermission
+from app.models.group import GroupAccess
 from app.models.project_access import ProjectAccess
 from app.models.user import User, UserRole
-from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.project import ProjectClone, ProjectCreate, ProjectRead, ProjectReadWithCounts, ProjectSummary, ProjectUpdate
+
+
+PROJECT_COLUMNS = schema_columns(Project, ProjectRead)
+PROJECT_DETAIL_COLUMNS = schema_columns(Project, ProjectReadWithCounts)
+SUMMARY_TOP_EDITORS = 5
 
 class ProjectService:
     def __init__(self, session: Session):
         self.session = session
     
     def get_by_id(self, project_id: int) -> Optional[Project]:
-        return self.session.get(Project, project_id)
+        """The project, or None if it does not exist or is being deleted."""
+        project = self.session.get(Project, project_id)
+        if project is None or project.deleting:
+            return None
+        return project
     
+    def cache_scope(self, project_id: int, user: User) -> Optional[CacheScope]:
+        """Response cache scope for reads of one project; None bypasses the cache."""
+        permission = get_permission_class(self.session, user, project_id)
+        if permission is None:
+            return None
+        return CacheScope(permission, (f"project:{project_id}",))
+
     def create_project(self,  project_data: ProjectCreate, owner: User) -> Project:
         
         project = Project(
@@ -25,6 +55,9 @@ class ProjectService:
             owner_id=owner.id
         )
         self.session.add(project)
+        self.session.flush()
+        record_change(self.session, EntityType.project, project.id, project.id)
+        refresh_effective_permissions(self.session, [owner.id], [project.id])
         self.session.commit()
         self.session.refresh(project)
 
@@ -40,33 +73,153 @@ class ProjectService:
         return project
     
 
-    def list_projects(self, user: User, skip: int = 0, limit: int = 20) -> list[Project]:
-        if user.role == UserRole.admin:
-            statement = select(Project).offset(skip).limit(limit)
-            return list(self.session.exec(statement).all())
-        
-        owned_statement = select(Project).where(Project.owner_id == user.id)
-        owned_projects = self.session.exec(owned_statement).all()
-        owned_ids = {p.id for p in owned_projects}
+    def clone_project(self, source_id: int, clone_data: ProjectClone, owner: User) -> Project:
+        """Copy a project, its documents and their attachments in one transaction with INSERT ... SELECT.
+
+        Each statement copies a whole table's worth of rows inside the
+        database, so the cost barely depends on the number of documents.
+        Cloned documents remember their source in `source_document_id`,
+        which is also how their versions are matched up.
+        """
+        source = self.get_by_id(source_id)
+        if not source:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
+
+        if not can_view_project(self.session, owner, source_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied to this project"
+            )
 
+        if clone_data.include_access and not can_manage_project(self.session, owner, source_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only admin or project owner can copy access"
+            )
 
-        access_statement = select(ProjectAccess).where(ProjectAccess.user_id == user.id)
-        accesses = self.session.exec(access_statement).all()
-        access_project_ids = {a.project_id for a in accesses}
+        project = Project(
+            title=clone_data.title,
+            description=clone_data.description if "description" in clone_data.model_fields_set else source.description,
+            owner_id=owner.id
+        )
+        self.session.add(project)
+        self.session.flush()
 
+        now = datetime.now(timezone.utc)
+        created_at = Document.__table__.c.created_at.type
+        self.session.exec(insert(Document).from_select(
+            ["project_id", "title", "content", "status", "created_by", "updated_by",
+             "created_at", "updated_at", "version_count", "source_document_id"],
+            select(
+                literal(project.id), Document.title, func.coalesce(Document.content, ""), Document.status,
+                literal(owner.id), literal(owner.id), literal(now, created_at), literal(now, created_at),
+                Document.version_count if clone_data.include_history else literal(1), Document.id
+            ).where(Document.project_id == source_id).order_by(Document.id)
+        ))
 
-        all_project_ids = owned_ids | access_project_ids
-        
-        if not all_project_ids:
-            return []
+        if clone_data.include_history:
+            versions = select(
+                Document.id, DocumentVersion.version, DocumentVersion.content_snapshot,
+                DocumentVersion.created_by, DocumentVersion.created_at
+            ).join(DocumentVersion, DocumentVersion.document_id == Document.source_document_id)
+        else:
+            versions = select(
+                Document.id, literal(1), Document.content, literal(owner.id), literal(now, created_at)
+            )
+        versions_copied = self.session.exec(insert(DocumentVersion).from_select(
+            ["document_id", "version", "content_snapshot", "created_by", "created_at"],
+            versions.where(Document.project_id == project.id).order_by(Document.id)
+        )).rowcount
+
+        # rows only: the blob store is content-addressed, so both attachments share the bytes
+        attachments_copied = self.session.exec(insert(Attachment).from_select(
+            ["document_id", "filename", "content_type", "size", "sha256", "uploaded_by", "created_at"],
+            select(Document.id, Attachment.filename, Attachment.content_type, Attachment.size, Attachment.sha256,
+                   Attachment.uploaded_by, Attachment.created_at)
+            .join(Attachment, Attachment.document_id == Document.source_document_id)
+            .where(Document.project_id == project.id)
+            .order_by(Attachment.id)
+        )).rowcount
+
+        grants_copied = 0
+        if clone_data.include_access:
+            grants_copied += self.session.exec(insert(ProjectAccess).from_select(
+                ["project_id", "user_id", "permission", "granted_by", "created_at"],
+                select(literal(project.id), ProjectAccess.user_id, ProjectAccess.permission,
+                       literal(owner.id), literal(now, created_at))
+                .where(ProjectAccess.project_id == source_id, ProjectAccess.user_id != owner.id)
+                .order_by(ProjectAccess.id)
+            )).rowcount
+            grants_copied += self.session.exec(insert(GroupAccess).from_select(
+                ["project_id", "group_id", "permission", "granted_by", "created_at"],
+                select(literal(project.id), GroupAccess.group_id, GroupAccess.permission,
+                       literal(owner.id), literal(now, created_at))
+                .where(GroupAccess.project_id == source_id)
+                .order_by(GroupAccess.id)
+            )).rowcount
+
+        status_counts = dict(self.session.exec(
+            select(Document.status, func.count()).where(Document.project_id == project.id).group_by(Document.status)
+        ).all())
+        project.draft_count = status_counts.get(DocumentStatus.draft, 0)
+        project.published_count = status_counts.get(DocumentStatus.published, 0)
+        project.archived_count = status_counts.get(DocumentStatus.archived, 0)
+        self.session.add(project)
+
+        record_change(self.session, EntityType.project, project.id, project.id)
+        document_ids = self.session.exec(select(Document.id).where(Document.project_id == project.id)).all()
+        record_changes(self.session, EntityType.document,
+                       [(document_id, project.id, None) for document_id in document_ids])
+        if clone_data.include_access:
+            record_changes(self.session, EntityType.access, [
+                (access_id, project.id, user_id)
+                for access_id, user_id in self.session.exec(
+                    select(ProjectAccess.id, ProjectAccess.user_id).where(ProjectAccess.project_id == project.id)
+                ).all()
+            ])
+        permission_changes = refresh_effective_permissions(self.session, project_ids=[project.id])
+        self.session.commit()
+        self.session.refresh(project)
+        publish_permission_changes(permission_changes, owner.id)
+
+        log_action(
+            session=self.session,
+            user_id=owner.id,
+            action="clone_project",
+            entity_type=EntityType.project,
+            entity_id=project.id,
+            meta={"title": project.title, "source_project_id": source_id, "documents": len(document_ids),
+                  "versions": versions_copied, "attachments": attachments_copied, "grants": grants_copied}
+        )
+
+        return project
+
+    def list_projects(self, user: User, skip: int = 0, limit: int = 20, fields: Optional[str] = None) -> list[dict]:
+        names = parse_fields(fields, PROJECT_COLUMNS)
+        if user.role == UserRole.admin:
+            statement = select_fields(PROJECT_COLUMNS, names).where(~Project.deleting).offset(skip).limit(limit)
+            return fetch_rows(self.session, statement)
         
-        statement = select(Project).where(
-            Project.id.in_(all_project_ids)
+        # owned, directly granted and group-granted projects alike
+        visible = select(EffectivePermission.project_id).where(EffectivePermission.user_id == user.id)
+        statement = select_fields(PROJECT_COLUMNS, names).where(
+            Project.id.in_(visible)
         ).offset(skip).limit(limit)
-        return list(self.session.exec(statement).all())
+        return fetch_rows(self.session, statement)
     
-    def get_project(self, project_id: int, user: User) -> Project:
-        project = self.get_by_id(project_id)
+    def get_project(self, project_id: int, user: User, fields: Optional[str] = None) -> Union[Project, dict]:
+        if fields is not None:
+            statement = select_fields(
+                PROJECT_DETAIL_COLUMNS, parse_fields(fields, PROJECT_DETAIL_COLUMNS)
+            ).where(Project.id == project_id, ~Project.deleting)
+            rows = fetch_rows(self.session, statement)
+            project = rows[0] if rows else None
+        else:
+            project = self.get_by_id(project_id)
+
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -81,6 +234,53 @@ class ProjectService:
         
         return project
     
+    def get_summary(self, project_id: int, user: User) -> dict:
+        """Dashboard numbers for one project, cached per project.
+
+        Every viewer sees the same numbers, so one entry serves them all. It
+        goes stale on project, access and `summary:` writes; document
+        writes that leave the project counters alone bump `summary:`.
+        """
+        self.get_project(project_id, user, fields="id")
+        return memoize(
+            "project_summary", (project_id,),
+            (f"project:{project_id}", f"access:{project_id}", f"summary:{project_id}"),
+            lambda: self._build_summary(project_id)
+        )
+
+    def _build_summary(self, project_id: int) -> dict:
+        project = self.session.get(Project, project_id)
+        members = self.session.exec(
+            select(func.count()).select_from(EffectivePermission).where(EffectivePermission.project_id == project_id)
+        ).one()
+        last_activity = self.session.exec(
+            select(func.max(ChangeLog.created_at)).where(ChangeLog.project_id == project_id)
+        ).one()
+        versions = func.count(DocumentVersion.id).label("versions")
+        editors = self.session.exec(
+            select(DocumentVersion.created_by, User.email, versions, func.max(DocumentVersion.created_at))
+            .join(Document, Document.id == DocumentVersion.document_id)
+            .join(User, User.id == DocumentVersion.created_by)
+            .where(Document.project_id == project_id)
+            .group_by(DocumentVersion.created_by, User.email)
+            .order_by(versions.desc(), DocumentVersion.created_by)
+            .limit(SUMMARY_TOP_EDITORS)
+        ).all()
+        return ProjectSummary(
+            project_id=project_id,
+            title=project.title,
+            documents=project.draft_count + project.published_count + project.archived_count,
+            draft_count=project.draft_count,
+            published_count=project.published_count,
+            archived_count=project.archived_count,
+            members=members,
+            last_activity_at=last_activity or project.created_at,
+            top_editors=[
+                {"user_id": user_id, "email": email, "versions": count, "last_edit_at": last_edit_at}
+                for user_id, email, count, last_edit_at in editors
+            ]
+        ).model_dump(mode="json")
+
     def update_project(self, project_id: int, project_data: ProjectUpdate, user: User) -> Project:
         project = self.get_by_id(project_id)
         if not project:
@@ -100,8 +300,10 @@ class ProjectService:
             setattr(project, key, value)
         
         self.session.add(project)
+        record_change(self.session, EntityType.project, project_id, project_id)
         self.session.commit()
         self.session.refresh(project)
+        invalidate(f"project:{project_id}")
 
         log_action(
             session=self.session,
@@ -114,23 +316,53 @@ class ProjectService:
         
         return project
     
-    def delete_project(self, project_id: int, user: User) -> None:
-        project = self.get_by_id(project_id)
+    def delete_project(self, project_id: int, user: User) -> ProjectDeletion:
+        """Hide the project at once and queue the removal of its rows; returns the job.
+
+        Repeating the call for a project that is already being deleted returns
+        the same job, restarting it if it failed.
+        """
+        project = self.session.get(Project, project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found"
             )
-        
+
         if not can_manage_project(self.session, user, project_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only admin or project owner can delete"
             )
-        
-        project_title = project.title
-        self.session.delete(project)
+
+        if project.deleting:
+            job = self._latest_deletion(project_id)
+            if job is not None and job.status == DeletionStatus.failed:
+                job.status = DeletionStatus.pending
+                self.session.add(job)
+                self.session.commit()
+                self.session.refresh(job)
+                worker.submit(job.id)
+            return job
+
+        project.deleting = True
+        self.session.add(project)
+        record_change(self.session, EntityType.project, project_id, project_id, op=ChangeOp.delete)
+        permission_changes = refresh_effective_permissions(self.session, project_ids=[project_id])
+        job = ProjectDeletion(
+            project_id=project_id,
+            project_title=project.title,
+            requested_by=user.id,
+            documents_total=self.session.exec(
+                select(func.count()).select_from(Document).where(Document.project_id == project_id)
+            ).one()
+        )
+        self.session.add(job)
         self.session.commit()
+        self.session.refresh(job)
+        invalidate(f"project:{project_id}", f"access:{project_id}")
+        publish_permission_changes(permission_changes, user.id)
+        publish(project_id, "project.deleting", actor_id=user.id)
 
         log_action(
             session=self.session,
@@ -138,9 +370,23 @@ class ProjectService:
             action="delete_project",
             entity_type=EntityType.project,
             entity_id=project_id,
-            meta={"title": project_title}
+            meta={"title": job.project_title, "job_id": job.id, "documents": job.documents_total}
         )
+        self.session.refresh(job)
+        worker.submit(job.id)
+        return job
 
+    def _latest_deletion(self, project_id: int) -> Optional[ProjectDeletion]:
+        return self.session.exec(
+            select(ProjectDeletion).where(ProjectDeletion.project_id == project_id).order_by(ProjectDeletion.id.desc())
+        ).first()
 
-    
-        
+    def get_deletion(self, project_id: int, user: User) -> ProjectDeletion:
+        """Progress of the project's deletion, for admins and the user who requested it."""
+        job = self._latest_deletion(project_id)
+        if job is None or (user.role != UserRole.admin and job.requested_by != user.id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Deletion not found"
+            )
+        return job
@@ -0,0 +1,95 @@
+from sqlalchemy import and_, or_
+from sqlmodel import Session, select
+
+from app.core.serialization import fetch_rows, schema_columns, select_fields
+from app.models.audit_log import EntityType
+from app.models.change_log import ChangeLog, ChangeOp
+from app.models.document import Document
+from app.models.effective_permission import EffectivePermission
+from app.models.project import Project
+from app.models.project_access import ProjectAccess
+from app.models.user import User, UserRole
+from app.schemas.project_access import ProjectAccessRead
+from app.services.document_service import DOCUMENT_COLUMNS
+from app.services.project_service import PROJECT_COLUMNS
+
+
+ACCESS_COLUMNS = schema_columns(ProjectAccess, ProjectAccessRead)
+
+
+class SyncService:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _visible_projects(self, user: User) -> tuple[set[int], set[int]]:
+        """Projects the user can read, and the subset whose access grants they manage."""
+        owned = set(self.session.exec(
+            select(Project.id).where(Project.owner_id == user.id, ~Project.deleting)
+        ).all())
+        visible = set(self.session.exec(
+            select(EffectivePermission.project_id).where(EffectivePermission.user_id == user.id)
+        ).all())
+        return visible | owned, owned
+
+    def _rows(self, columns: dict, *where) -> list[dict]:
+        return fetch_rows(self.session, select_fields(columns, columns).where(*where))
+
+    def changes_since(self, user: User, since: int = 0, limit: int = 500) -> dict:
+        """Current state of everything the user can see that changed after `since`.
+
+        Costs one indexed range read of the change log plus one IN query per
+        entity type. A project the user was just given access to is sent in
+        full, since its documents changed before `since`. `next` is the last
+        `seq` returned, which `app.core.changes` keeps safe to resume from.
+        """
+        statement = select(ChangeLog).where(ChangeLog.seq > since)
+        visible = None
+        if user.role == UserRole.admin:
+            # admins see every project whatever their own access
+            statement = statement.where(ChangeLog.entity_type != EntityType.membership)
+        else:
+            visible, managed = self._visible_projects(user)
+            statement = statement.where(or_(
+                and_(ChangeLog.entity_type.notin_([EntityType.access, EntityType.membership]),
+                     ChangeLog.project_id.in_(visible)),
+                and_(ChangeLog.entity_type == EntityType.access, ChangeLog.project_id.in_(managed)),
+                # the user's own grants and memberships; the latter carry project tombstones
+                ChangeLog.user_id == user.id,
+            ))
+
+        changes = self.session.exec(statement.order_by(ChangeLog.seq).limit(limit + 1)).all()
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        upserts: dict[EntityType, list[int]] = {entity_type: [] for entity_type in EntityType}
+        joined: set[int] = set()
+        deleted = []
+        for change in changes:
+            if change.entity_type == EntityType.membership:
+                # the user's own access, direct or through a group, appeared or went
+                if change.op == ChangeOp.upsert and change.project_id in visible:
+                    joined.add(change.project_id)
+                elif change.op == ChangeOp.delete and change.project_id not in visible:
+                    deleted.append({"entity_type": EntityType.project, "id": change.project_id,
+                                    "project_id": change.project_id})
+            elif change.op == ChangeOp.delete:
+                deleted.append({"entity_type": change.entity_type, "id": change.entity_id,
+                                "project_id": change.project_id})
+            else:
+                upserts[change.entity_type].append(change.entity_id)
+
+        project_ids = set(upserts[EntityType.project]) | joined
+        document_ids = upserts[EntityType.document]
+        access_ids = upserts[EntityType.access]
+
+        return {
+            "since": since,
+            "next": changes[-1].seq if changes else since,
+            "has_more": has_more,
+            "projects": self._rows(PROJECT_COLUMNS, Project.id.in_(project_ids)) if project_ids else [],
+            "documents": self._rows(
+                DOCUMENT_COLUMNS, or_(Document.id.in_(document_ids), Document.project_id.in_(joined))
+            ) if document_ids or joined else [],
+            "access": self._rows(ACCESS_COLUMNS, ProjectAccess.id.in_(access_ids)) if access_ids else [],
+            "deleted": deleted,
+        }
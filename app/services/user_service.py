@@ -1,17 +1,42 @@
 from concurrent.interpreters import create
-from datetime import timedelta
+import json
+from datetime import datetime, timedelta, timezone
 from tomllib import TOMLDecodeError
 from typing import Optional
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from fastapi import HTTPException, status
 from app.schemas.token import Token
 
-from app.core.security import create_access_token, get_password_hash, verify_password
-from app.models.audit_log import EntityType
+from app.core.hashing import hash_many
+from app.core.ingest import ParsedRow
+from app.core.security import create_access_token, get_password_hash, password_needs_rehash, verify_password
+from app.models.audit_log import AuditLog, EntityType
 from app.models.user import User, UserRole
-from app.schemas.user import UserCreate, UserLogin
+from app.schemas.user import UserCreate, UserLogin, UserRead
 from app.core.audit import log_action
+from app.core.serialization import fetch_rows, parse_fields, schema_columns, select_fields
 from app.core.config import settings
+from app.db import statements
+
+
+USER_COLUMNS = schema_columns(User, UserRead)
+
+
+def _bulk_result(row: int, data: Optional[dict], outcome: str,
+                 user_id: Optional[int] = None, error: Optional[str] = None) -> dict:
+    email = data.get("email") if data else None
+    return {"row": row, "email": email if isinstance(email, str) else None,
+            "status": outcome, "id": user_id, "error": error}
+
+
+def bulk_report(results: list[dict]) -> dict:
+    results.sort(key=lambda result: result["row"])
+    created = sum(result["status"] == "created" for result in results)
+    return {"created": created, "failed": len(results) - created, "results": results}
+
 
 class UserService:
     def __init__(self, session: Session):
@@ -19,13 +44,14 @@ class UserService:
 
     
     def get_by_email(self, email: str) -> Optional[User]:
-        statement = select(User).where(User.email == email)
-        return self.session.exec(statement).first()
+        return self.session.exec(statements.user_by_email, params={"email": email}).first()
     
     def get_by_id(self, user_id: int) -> Optional[User]:
         return self.session.get(User, user_id)
     
-    def create_user(self, user_data: UserCreate, created_by: User) -> User:
+    def create_user(self, user_data: UserCreate, created_by: User,
+                    password_hash: Optional[str] = None) -> User:
+        """`password_hash` lets async callers hash before entering the session."""
         if self.get_by_email(user_data.email):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -34,7 +60,7 @@ class UserService:
         
         new_user = User(
             email=user_data.email,
-            password_hash= get_password_hash(user_data.password),
+            password_hash=password_hash or get_password_hash(user_data.password),
             role = user_data.role
         )
 
@@ -54,10 +80,108 @@ class UserService:
         return new_user
     
 
+    def bulk_create(self, rows: list[ParsedRow], created_by: User) -> dict:
+        """Create users from parsed CSV/NDJSON rows and report every row's outcome."""
+        results, pending = self.check_bulk_rows(rows)
+        # hashing a large batch takes a while; don't hold a pooled connection meanwhile
+        self.session.rollback()
+        password_hashes = hash_many([user_data.password for _, user_data in pending])
+        results += self.insert_bulk_users(pending, password_hashes, created_by)
+        return bulk_report(results)
+
+    def check_bulk_rows(self, rows: list[ParsedRow]) -> tuple[list[dict], list[tuple[int, UserCreate]]]:
+        """Validate rows and drop duplicate emails; returns the rejected rows and the users to create."""
+        results = []
+        candidates: dict[str, tuple[int, UserCreate]] = {}
+        for row in rows:
+            if row.error is not None:
+                results.append(_bulk_result(row.row, row.data, "invalid", error=row.error))
+                continue
+            try:
+                user_data = UserCreate.model_validate(row.data)
+            except ValidationError as exc:
+                error = "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+                results.append(_bulk_result(row.row, row.data, "invalid", error=error))
+                continue
+            if user_data.email in candidates:
+                results.append(_bulk_result(row.row, row.data, "duplicate", error="Email repeated in upload"))
+                continue
+            candidates[user_data.email] = (row.row, user_data)
+
+        existing = set(self.session.exec(
+            select(User.email).where(User.email.in_(list(candidates)))
+        ).all()) if candidates else set()
+
+        pending = []
+        for email, (row, user_data) in candidates.items():
+            if email in existing:
+                results.append(_bulk_result(row, {"email": email}, "duplicate", error="Email already registered"))
+            else:
+                pending.append((row, user_data))
+        return results, pending
+
+    def insert_bulk_users(self, pending: list[tuple[int, UserCreate]], password_hashes: list[str],
+                          created_by: User) -> list[dict]:
+        """Insert users and their audit rows, one multi-row INSERT and commit per batch."""
+        results = []
+        for start in range(0, len(pending), settings.BULK_INSERT_BATCH):
+            batch = pending[start:start + settings.BULK_INSERT_BATCH]
+            hashes = password_hashes[start:start + settings.BULK_INSERT_BATCH]
+            now = datetime.now(timezone.utc)
+            values = [
+                {"email": user_data.email, "password_hash": password_hash, "role": user_data.role,
+                 "is_active": True, "created_at": now}
+                for (_, user_data), password_hash in zip(batch, hashes)
+            ]
+            try:
+                ids = self.session.exec(
+                    insert(User).returning(User.id, sort_by_parameter_order=True), params=values
+                ).scalars().all()
+            except IntegrityError:
+                # an email was registered since check_bulk_rows; retry the batch row by row
+                self.session.rollback()
+                ids = [self._insert_one(value) for value in values]
+
+            audit_rows = [
+                {"user_id": created_by.id, "action": "register_user", "entity_type": EntityType.user,
+                 "entity_id": user_id, "created_at": now,
+                 "meta": json.dumps({"created_email": value["email"], "role": value["role"].value, "bulk": True})}
+                for user_id, value in zip(ids, values) if user_id is not None
+            ]
+            if audit_rows:
+                self.session.exec(insert(AuditLog), params=audit_rows)
+            self.session.commit()
+
+            for (row, user_data), user_id in zip(batch, ids):
+                if user_id is None:
+                    results.append(_bulk_result(row, {"email": user_data.email}, "duplicate",
+                                                error="Email already registered"))
+                else:
+                    results.append(_bulk_result(row, {"email": user_data.email}, "created", user_id=user_id))
+        return results
+
+    def _insert_one(self, value: dict) -> Optional[int]:
+        try:
+            with self.session.begin_nested():
+                return self.session.exec(insert(User).returning(User.id), params=value).scalar_one()
+        except IntegrityError:
+            return None
+
     def authenticate(self, credentials: UserLogin) -> Token:
         user = self.get_by_email(credentials.email)
+        password_hash = user.password_hash if user else None
+        # hand the connection back while bcrypt runs; the check can queue behind other logins
+        self.session.rollback()
 
-        if not user or not verify_password(credentials.password, user.password_hash):
+        valid = password_hash is not None and verify_password(credentials.password, password_hash)
+        new_hash = None
+        if valid and password_needs_rehash(password_hash):
+            new_hash = get_password_hash(credentials.password)
+        return self.complete_login(user, valid, new_hash)
+
+    def complete_login(self, user: Optional[User], valid: bool, new_hash: Optional[str] = None) -> Token:
+        """Issue a token once the password was checked; `new_hash` replaces an outdated hash."""
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
@@ -70,6 +194,12 @@ class UserService:
                 detail="User account is deactivated"
             )
         
+        if new_hash is not None:
+            user.password_hash = new_hash
+            self.session.add(user)
+            self.session.commit()
+            self.session.refresh(user)
+
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
             data={"user_id": user.id, "role": user.role.value},
@@ -91,16 +221,17 @@ class UserService:
             self, 
             skip: int = 0,
             limit: int = 20,
-            role: Optional[UserRole] = None 
-    ) -> list[User]:
+            role: Optional[UserRole] = None,
+            fields: Optional[str] = None
+    ) -> list[dict]:
         
 
-        statement = select(User)
+        statement = select_fields(USER_COLUMNS, parse_fields(fields, USER_COLUMNS))
         if role:
             statement = statement.where(User.role == role)
 
         statement = statement.offset(skip).limit(limit)
-        return list(self.session.exec(statement).all())
+        return fetch_rows(self.session, statement)
     
     
     # def deactivate_user(self, user_id: int, deactivated_by: User) -> User:
@@ -0,0 +1,108 @@
+"""Concurrency benchmark: sync (threadpool) vs async (aiosqlite/asyncpg) database path.
+
+Each mode runs in its own interpreter because the engine is chosen from
+settings at import time. Requests go through the full ASGI stack in-process
+(httpx.ASGITransport), so the only difference between the runs is
+DATABASE_ASYNC.
+
+    python -m benchmarks.bench_async --requests 2000 --concurrency 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def run_mode(requests: int, concurrency: int) -> dict:
+    import httpx
+    from sqlmodel import Session
+
+    from app.core.security import create_access_token
+    from app.db.session import create_db_and_tables, engine
+    from app.main import app
+    from app.models.document import Document
+    from app.models.project import Project
+    from app.models.user import User, UserRole
+
+    create_db_and_tables()
+    with Session(engine) as session:
+        user = User(email="bench@example.com", password_hash="x", role=UserRole.admin)
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        project = Project(title="Benchmark", owner_id=user.id)
+        session.add(project)
+        session.commit()
+        session.refresh(project)
+        for i in range(50):
+            session.add(Document(project_id=project.id, title=f"Document {i}", content="x" * 2000, created_by=user.id))
+        session.commit()
+        user_id, project_id = user.id, project.id
+
+    headers = {"Authorization": "Bearer " + create_access_token({"user_id": user_id, "role": "admin"})}
+    paths = [f"/documents/{i % 50 + 1}" if i % 2 else f"/projects/{project_id}/documents" for i in range(requests)]
+    latencies = []
+    errors = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(client, path):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+
+    async def main():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(one(client, path) for path in paths))
+            return time.perf_counter() - started
+
+    elapsed = asyncio.run(main())
+    latencies.sort()
+    return {
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+        "errors": len(errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_mode(args.requests, args.concurrency)))
+        return
+
+    print(f"{'mode':<6} {'rps':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for mode in ("sync", "async"):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(
+                os.environ,
+                DATABASE_URL=f"sqlite:///{tmp}/bench.db",
+                DATABASE_ASYNC=str(mode == "async").lower(),
+                DEBUG="false",
+            )
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_async", "--child",
+                 "--requests", str(args.requests), "--concurrency", str(args.concurrency)],
+                env=env, check=True, stdout=subprocess.PIPE, text=True
+            ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:<6} {result['rps']:>9} {result['p50_ms']:>9} {result['p99_ms']:>9} {result['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
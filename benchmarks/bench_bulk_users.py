@@ -0,0 +1,103 @@
+"""Provisioning `--users` accounts: one POST /auth/register each vs one POST /users/bulk.
+
+Each mode runs in a fresh child process with its own temporary SQLite
+database, through the full ASGI stack in-process. Registration calls go
+out back to back, like an onboarding script; the bulk path sends the same
+users as a single NDJSON body. Admission control is off and the hashing
+queue is sized so neither path is throttled.
+
+    python -m benchmarks.bench_bulk_users --users 1000 --rounds 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def run_mode(mode: str, users: int) -> dict:
+    import httpx
+    import orjson
+    from sqlmodel import Session, func, select
+
+    from app.core.security import create_access_token
+    from app.db.session import create_db_and_tables, engine
+    from app.main import app
+    from app.models.user import User, UserRole
+
+    create_db_and_tables()
+    with Session(engine) as session:
+        admin = User(email="bench@example.com", password_hash="x", role=UserRole.admin)
+        session.add(admin)
+        session.commit()
+        session.refresh(admin)
+        admin_id = admin.id
+
+    headers = {"Authorization": "Bearer " + create_access_token({"user_id": admin_id, "role": "admin"})}
+    records = [{"email": f"user{i}@example.com", "password": f"Passw0rd{i}"} for i in range(users)]
+
+    async def main() -> int:
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+            if mode == "register":
+                failed = 0
+                for record in records:
+                    response = await client.post("/auth/register", json=record, headers=headers)
+                    failed += response.status_code != 201
+                return failed
+            body = b"\n".join(orjson.dumps(record) for record in records)
+            response = await client.post(
+                "/users/bulk", content=body,
+                headers=dict(headers, **{"Content-Type": "application/x-ndjson"})
+            )
+            response.raise_for_status()
+            return response.json()["failed"]
+
+    started = time.perf_counter()
+    failed = asyncio.run(main())
+    elapsed = time.perf_counter() - started
+    with Session(engine) as session:
+        created = session.exec(select(func.count()).select_from(User)).one() - 1
+    return {"seconds": round(elapsed, 2), "users_per_s": round(created / elapsed, 1), "created": created, "failed": failed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    parser.add_argument("--processes", type=int, default=0, help="BULK_HASH_PROCESSES, 0 = one per core")
+    parser.add_argument("--modes", nargs="+", default=["register", "bulk"], choices=["register", "bulk"])
+    parser.add_argument("--child", choices=["register", "bulk"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_mode(args.child, args.users)))
+        return
+
+    print(f"{'mode':>8} {'seconds':>8} {'users/s':>8} {'created':>8} {'failed':>7}")
+    for mode in args.modes:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(
+                os.environ,
+                DATABASE_URL=f"sqlite:///{tmp}/bench.db",
+                PASSWORD_BCRYPT_ROUNDS=str(args.rounds),
+                PASSWORD_HASH_QUEUE=str(args.users),
+                BULK_HASH_PROCESSES=str(args.processes),
+                BULK_MAX_ROWS=str(max(args.users, 1)),
+                ADMISSION_ENABLED="false",
+                CACHE_BACKEND="none",
+                DEBUG="false",
+            )
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_bulk_users", "--child", mode, "--users", str(args.users)],
+                env=env, check=True, stdout=subprocess.PIPE, text=True
+            ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:>8} {result['seconds']:>8} {result['users_per_s']:>8} {result['created']:>8} {result['failed']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Read latency during a login storm, per bcrypt worker-pool size.
+
+Runs `--logins` clients that log in back to back next to `--readers`
+clients reading `GET /documents/{id}`, through the full ASGI stack
+in-process, once per `PASSWORD_HASH_WORKERS` value. A pool as large as the
+threadpool behaves like hashing inline in the request thread; a small pool
+caps the CPU that logins can take. Admission control is off so only the
+hashing pool limits the logins.
+
+    python -m benchmarks.bench_logins --hash-workers 40 2 --logins 32 --readers 16
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def run_mode(logins: int, readers: int, seconds: float) -> dict:
+    import bcrypt
+    import httpx
+    from sqlmodel import Session
+
+    from app.core.config import settings
+    from app.core.security import create_access_token
+    from app.db.session import create_db_and_tables, engine
+    from app.main import app
+    from app.models.document import Document
+    from app.models.project import Project
+    from app.models.user import User, UserRole
+
+    create_db_and_tables()
+    password_hash = bcrypt.hashpw(b"Bench12345", bcrypt.gensalt(settings.PASSWORD_BCRYPT_ROUNDS)).decode()
+    with Session(engine) as session:
+        user = User(email="bench@example.com", password_hash=password_hash, role=UserRole.admin)
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        project = Project(title="Benchmark", owner_id=user.id)
+        session.add(project)
+        session.commit()
+        session.refresh(project)
+        for i in range(50):
+            session.add(Document(project_id=project.id, title=f"Document {i}", content="x" * 2000, created_by=user.id))
+        session.commit()
+        user_id = user.id
+
+    headers = {"Authorization": "Bearer " + create_access_token({"user_id": user_id, "role": "admin"})}
+    credentials = {"email": "bench@example.com", "password": "Bench12345"}
+    read_latencies: list[float] = []
+    login_latencies: list[float] = []
+    errors: list[int] = []
+
+    async def loop(client: httpx.AsyncClient, deadline: float, login: bool, offset: int) -> None:
+        i = offset
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            if login:
+                response = await client.post("/auth/login", json=credentials)
+            else:
+                response = await client.get(f"/documents/{i % 50 + 1}", headers=headers)
+            (login_latencies if login else read_latencies).append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+            i += 1
+
+    async def main() -> None:
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            deadline = time.perf_counter() + seconds
+            await asyncio.gather(
+                *(loop(client, deadline, True, n) for n in range(logins)),
+                *(loop(client, deadline, False, n) for n in range(readers)),
+            )
+
+    asyncio.run(main())
+    read_latencies.sort()
+    return {
+        "login_rps": round(len(login_latencies) / seconds, 1),
+        "read_rps": round(len(read_latencies) / seconds, 1),
+        "read_p50_ms": round(statistics.median(read_latencies) * 1000, 2),
+        "read_p99_ms": round(read_latencies[int(len(read_latencies) * 0.99) - 1] * 1000, 2),
+        "errors": len(errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hash-workers", type=int, nargs="+", default=[40, 2])
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_mode(args.logins, args.readers, args.seconds)))
+        return
+
+    print(f"{'hash workers':>12} {'login rps':>10} {'read rps':>9} {'read p50 ms':>12} {'read p99 ms':>12} {'errors':>7}")
+    for workers in args.hash_workers:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(
+                os.environ,
+                DATABASE_URL=f"sqlite:///{tmp}/bench.db",
+                PASSWORD_HASH_WORKERS=str(workers),
+                PASSWORD_HASH_QUEUE=str(args.logins),
+                PASSWORD_BCRYPT_ROUNDS=str(args.rounds),
+                ADMISSION_ENABLED="false",
+                CACHE_BACKEND="none",
+                DEBUG="false",
+            )
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_logins", "--child", "--logins", str(args.logins),
+                 "--readers", str(args.readers), "--seconds", str(args.seconds)],
+                env=env, check=True, stdout=subprocess.PIPE, text=True
+            ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{workers:>12} {result['login_rps']:>10} {result['read_rps']:>9} "
+              f"{result['read_p50_ms']:>12} {result['read_p99_ms']:>12} {result['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Fetch + serialize cost of a document list page, per page size.
+
+Compares the ways a `GET /projects/{id}/documents` page can be turned into
+JSON bytes, against an in-memory SQLite database with documents carrying
+`--content-kb` of text each:
+
+* stdlib        ORM objects -> response_model validation -> jsonable_encoder -> json.dumps
+* pydantic      ORM objects -> response_model validation -> dump_json (FastAPI's own fast path)
+* orjson class  ORM objects -> response_model validation -> dump_python -> orjson
+                (what `default_response_class=ORJSONResponse` does to a response_model route)
+* rows+orjson   column tuples -> dicts -> orjson (app.core.serialization)
+
+    python -m benchmarks.bench_serialization --pages 10 100 500
+"""
+import argparse
+import json
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+import app.main  # noqa: F401  registers every model on the metadata
+from app.core.serialization import ORJSONResponse, fetch_rows, schema_columns, select_fields
+from app.models.document import Document
+from app.models.project import Project
+from app.models.user import User
+from app.schemas.document import DocumentRead
+
+
+def seed(session: Session, documents: int, content_kb: int) -> int:
+    owner = User(email="owner@example.com", password_hash="x")
+    session.add(owner)
+    session.commit()
+    project = Project(title="Benchmark", owner_id=owner.id)
+    session.add(project)
+    session.commit()
+    content = "x" * (content_kb * 1024)
+    session.add_all(
+        Document(project_id=project.id, title=f"Document {i}", content=content, created_by=owner.id)
+        for i in range(documents)
+    )
+    session.commit()
+    return project.id
+
+
+def cases(session: Session, project_id: int, page: int) -> dict:
+    adapter = TypeAdapter(list[DocumentRead])
+    statement = select(Document).where(Document.project_id == project_id).limit(page)
+    columns = schema_columns(Document, DocumentRead)
+    rows_statement = select_fields(columns, columns).where(
+        Document.project_id == project_id
+    ).limit(page)
+
+    def orm_objects():
+        # a fresh identity map per call, as every request gets its own session
+        session.expunge_all()
+        return session.exec(statement).all()
+
+    return {
+        "stdlib": lambda: json.dumps(jsonable_encoder(adapter.validate_python(orm_objects()))).encode(),
+        "pydantic": lambda: adapter.dump_json(adapter.validate_python(orm_objects())),
+        "orjson class": lambda: ORJSONResponse(
+            adapter.dump_python(adapter.validate_python(orm_objects()), mode="json")
+        ).body,
+        "rows+orjson": lambda: ORJSONResponse(fetch_rows(session, rows_statement)).body,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--content-kb", type=int, default=4)
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        project_id = seed(session, max(args.pages), args.content_kb)
+        names = list(cases(session, project_id, 1))
+        print(f"{'page':>5} " + " ".join(f"{name + ' ms':>15}" for name in names))
+        for page in args.pages:
+            timings = []
+            for fn in cases(session, project_id, page).values():
+                fn()
+                timings.append(timeit.timeit(fn, number=args.calls) / args.calls * 1e3)
+            print(f"{page:>5} " + " ".join(f"{ms:>15.2f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Per-call overhead of the hot service queries: inline select() vs app.db.statements.
+
+Runs against an in-memory SQLite database so the numbers are dominated by
+statement construction, cache-key generation and ORM result handling rather
+than I/O.
+
+    python -m benchmarks.bench_statements --calls 20000
+"""
+import argparse
+import timeit
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, func, select
+
+import app.main  # noqa: F401  registers every model on the metadata
+from app.db import statements
+from app.models.document import Document
+from app.models.document_version import DocumentVersion
+from app.models.project import Project
+from app.models.project_access import ProjectAccess
+from app.models.user import User
+
+
+def seed(session: Session) -> None:
+    owner = User(email="owner@example.com", password_hash="x")
+    member = User(email="member@example.com", password_hash="x")
+    session.add_all([owner, member])
+    session.commit()
+    project = Project(title="Benchmark", owner_id=owner.id)
+    session.add(project)
+    session.commit()
+    document = Document(project_id=project.id, title="Document", created_by=owner.id)
+    session.add(document)
+    session.add(ProjectAccess(project_id=project.id, user_id=member.id, granted_by=owner.id))
+    session.commit()
+    for version in range(1, 6):
+        session.add(DocumentVersion(document_id=document.id, version=version, created_by=owner.id))
+    session.commit()
+
+
+def cases(session: Session) -> dict:
+    return {
+        "project access lookup": (
+            lambda: session.exec(select(ProjectAccess).where(
+                ProjectAccess.project_id == 1, ProjectAccess.user_id == 2
+            )).first(),
+            lambda: session.exec(
+                statements.project_access_for_user, params={"project_id": 1, "user_id": 2}
+            ).first(),
+        ),
+        "user by email": (
+            lambda: session.exec(select(User).where(User.email == "member@example.com")).first(),
+            lambda: session.exec(statements.user_by_email, params={"email": "member@example.com"}).first(),
+        ),
+        "max document version": (
+            lambda: session.exec(select(func.max(DocumentVersion.version)).where(
+                DocumentVersion.document_id == 1
+            )).first(),
+            lambda: session.exec(statements.max_document_version, params={"document_id": 1}).first(),
+        ),
+        "document version": (
+            lambda: session.exec(select(DocumentVersion).where(
+                DocumentVersion.document_id == 1, DocumentVersion.version == 3
+            )).first(),
+            lambda: session.exec(
+                statements.document_version, params={"document_id": 1, "version": 3}
+            ).first(),
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        seed(session)
+        print(f"{'query':<24} {'inline us':>10} {'prebuilt us':>12} {'saved':>7}")
+        for name, (inline, prebuilt) in cases(session).items():
+            inline(), prebuilt()  # warm the compiled cache for both forms
+            inline_us = timeit.timeit(inline, number=args.calls) / args.calls * 1e6
+            prebuilt_us = timeit.timeit(prebuilt, number=args.calls) / args.calls * 1e6
+            saved = (inline_us - prebuilt_us) / inline_us * 100
+            print(f"{name:<24} {inline_us:>10.1f} {prebuilt_us:>12.1f} {saved:>6.0f}%")
+
+
+if __name__ == "__main__":
+    main()
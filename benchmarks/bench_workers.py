@@ -0,0 +1,162 @@
+"""Throughput of `python -m app.server` as SERVER_WORKERS grows.
+
+Seeds one temporary SQLite database, then for each worker count starts the
+real server on a local port, drives it with `--clients` load-generator
+processes for `--seconds`, and stops it with SIGTERM (the graceful-drain
+path). Unlike bench_async this goes over TCP, so HTTP parsing, the event
+loop and the worker processes are all part of the measurement.
+
+    python -m benchmarks.bench_workers --workers 1 2 4 --clients 4 --concurrency 32
+
+Load generators share the box with the server: give them enough cores, or
+the numbers measure httpx instead of the app.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def seed() -> tuple[str, int]:
+    from sqlmodel import Session
+
+    import app.main  # noqa: F401  registers every model on the metadata
+    from app.core.security import create_access_token
+    from app.db.session import create_db_and_tables, engine
+    from app.models.document import Document
+    from app.models.project import Project
+    from app.models.user import User, UserRole
+
+    create_db_and_tables()
+    with Session(engine) as session:
+        user = User(email="bench@example.com", password_hash="x", role=UserRole.admin)
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        project = Project(title="Benchmark", owner_id=user.id)
+        session.add(project)
+        session.commit()
+        session.refresh(project)
+        for i in range(50):
+            session.add(Document(project_id=project.id, title=f"Document {i}", content="x" * 2000, created_by=user.id))
+        session.commit()
+        token = create_access_token({"user_id": user.id, "role": "admin"})
+        return token, project.id
+
+
+def generate_load(base_url: str, token: str, project_id: int, seconds: float,
+                  concurrency: int, results: multiprocessing.Queue) -> None:
+    import httpx
+
+    headers = {"Authorization": f"Bearer {token}"}
+    paths = [f"/documents/{i % 50 + 1}" if i % 2 else f"/projects/{project_id}/documents" for i in range(100)]
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(client: httpx.AsyncClient, offset: int, deadline: float) -> None:
+        nonlocal errors
+        i = offset
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.get(paths[i % len(paths)], headers=headers)
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+            i += 1
+
+    async def main() -> None:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            deadline = time.perf_counter() + seconds
+            await asyncio.gather(*(worker(client, n, deadline) for n in range(concurrency)))
+
+    asyncio.run(main())
+    results.put({"latencies": latencies, "errors": errors})
+
+
+def wait_until_up(base_url: str, timeout: float = 30) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def run(workers: int, args, env: dict, token: str, project_id: int) -> dict:
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        env=dict(env, SERVER_WORKERS=str(workers), SERVER_PORT=str(args.port), SERVER_HOST="127.0.0.1"),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_until_up(base_url)
+        results = multiprocessing.Queue()
+        clients = [
+            multiprocessing.Process(
+                target=generate_load,
+                args=(base_url, token, project_id, args.seconds, args.concurrency, results)
+            )
+            for _ in range(args.clients)
+        ]
+        for client in clients:
+            client.start()
+        collected = [results.get() for _ in clients]
+        for client in clients:
+            client.join()
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+    latencies = sorted(latency for result in collected for latency in result["latencies"])
+    return {
+        "rps": round(len(latencies) / args.seconds, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+        "errors": sum(result["errors"] for result in collected),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=4, help="load-generator processes")
+    parser.add_argument("--concurrency", type=int, default=32, help="connections per load generator")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # the server processes and the seeding below must use the same database
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{tmp}/bench.db",
+            CACHE_BACKEND="none",
+            DEBUG="false",
+        )
+        os.environ.update(env)
+        token, project_id = seed()
+
+        print(f"{'workers':>7} {'rps':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+        for workers in args.workers:
+            result = run(workers, args, env, token, project_id)
+            print(f"{workers:>7} {result['rps']:>9} {result['p50_ms']:>9} {result['p99_ms']:>9} {result['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+
+# settings are read at import time, so point the app at a scratch database first
+_tmp = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp}/test.db")
+os.environ.setdefault("ATTACHMENT_DIR", f"{_tmp}/attachments")
+os.environ.setdefault("CACHE_BACKEND", "none")
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+os.environ.setdefault("PASSWORD_BCRYPT_ROUNDS", "4")
+
+import bcrypt
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, select
+
+from app.db.session import engine
+from app.main import app
+from app.models.user import User, UserRole
+
+
+PASSWORD = "passw0rd"
+USERS = {
+    "admin": ("admin@example.com", UserRole.admin),
+    "manager": ("manager@example.com", UserRole.manager),
+    "worker": ("worker@example.com", UserRole.worker),
+    "viewer": ("viewer@example.com", UserRole.worker),
+}
+
+
+@pytest.fixture
+def client():
+    SQLModel.metadata.drop_all(engine)
+    with TestClient(app) as client:
+        with Session(engine) as session:
+            password_hash = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(4)).decode()
+            for email, role in USERS.values():
+                session.add(User(email=email, password_hash=password_hash, role=role))
+            session.commit()
+        yield client
+
+
+@pytest.fixture
+def login(client):
+    def login(name: str) -> dict:
+        response = client.post("/auth/login", json={"email": USERS[name][0], "password": PASSWORD})
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return login
+
+
+@pytest.fixture
+def user_id():
+    def user_id(name: str) -> int:
+        with Session(engine) as session:
+            return session.exec(select(User.id).where(User.email == USERS[name][0])).one()
+    return user_id
@@ -0,0 +1,45 @@
+def access_of(client, headers, project_id) -> dict:
+    response = client.get(f"/projects/{project_id}/access", headers=headers)
+    assert response.status_code == 200, response.text
+    return {item["user_id"]: item["permission"] for item in response.json()}
+
+
+def test_bulk_grant_update_and_revoke(client, login, user_id):
+    manager = login("manager")
+    worker, viewer = user_id("worker"), user_id("viewer")
+    project = client.post("/projects", json={"title": "Team"}, headers=manager).json()
+    bulk = f"/projects/{project['id']}/access/bulk"
+
+    response = client.post(bulk, json={"grant": [{"user_id": worker, "permission": "viewer"},
+                                                 {"user_id": viewer, "permission": "viewer"}]}, headers=manager)
+    assert response.status_code == 200, response.text
+    assert sorted(response.json()["granted"]) == sorted([worker, viewer])
+
+    response = client.post(bulk, json={"grant": [{"user_id": worker, "permission": "editor"},
+                                                 {"user_id": viewer, "permission": "viewer"}]}, headers=manager)
+    result = response.json()
+    assert (result["updated"], result["unchanged"], result["granted"]) == ([worker], [viewer], [])
+    assert access_of(client, manager, project["id"]) == {worker: "editor", viewer: "viewer"}
+
+    response = client.post(bulk, json={"revoke": [viewer]}, headers=manager)
+    assert response.json()["revoked"] == [viewer]
+    assert access_of(client, manager, project["id"]) == {worker: "editor"}
+    # the effective permission follows: the revoked user loses the project
+    assert client.get(f"/projects/{project['id']}", headers=login("viewer")).status_code == 403
+
+
+def test_access_matrix_is_all_or_nothing(client, login, user_id):
+    manager, admin = login("manager"), login("admin")
+    worker = user_id("worker")
+    own = client.post("/projects", json={"title": "Mine"}, headers=manager).json()
+    other = client.post("/projects", json={"title": "Theirs"}, headers=admin).json()
+
+    response = client.post("/access/bulk", json={"project_ids": [own["id"], other["id"]],
+                                                 "grant": [{"user_id": worker, "permission": "viewer"}]}, headers=manager)
+    assert response.status_code == 403
+    assert access_of(client, manager, own["id"]) == {}
+
+    response = client.post("/access/bulk", json={"project_ids": [own["id"], other["id"]],
+                                                 "grant": [{"user_id": worker, "permission": "viewer"}]}, headers=admin)
+    assert response.status_code == 200, response.text
+    assert [item["granted"] for item in response.json()] == [[worker], [worker]]
@@ -0,0 +1,59 @@
+import orjson
+
+from app.services import access_report_service
+
+
+def setup_project(client, login, user_id) -> int:
+    admin, manager = login("admin"), login("manager")
+    project = client.post("/projects", json={"title": "Audited"}, headers=manager).json()
+    client.post(f"/projects/{project['id']}/access/grant",
+                json={"user_id": user_id("worker"), "permission": "editor"}, headers=manager)
+    group = client.post("/groups", json={"name": "Readers"}, headers=admin).json()
+    client.post(f"/projects/{project['id']}/access/groups", json={"group_id": group["id"]}, headers=manager)
+    client.post(f"/groups/{group['id']}/members", json={"user_ids": [user_id("viewer")]}, headers=admin)
+    return project["id"]
+
+
+def all_pages(client, headers, url: str, limit: int) -> list[dict]:
+    rows, after = [], 0
+    while True:
+        response = client.get(url, params={"after": after, "limit": limit}, headers=headers)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page["items"]) <= limit
+        rows += page["items"]
+        after = page["next"]
+        if not page["has_more"]:
+            return rows
+
+
+def test_project_report_pages_and_sources(client, login, user_id):
+    project_id = setup_project(client, login, user_id)
+    manager = login("manager")
+
+    rows = all_pages(client, manager, f"/access/report/projects/{project_id}", limit=1)
+    by_email = {row["email"]: row for row in rows}
+    assert [row["user_id"] for row in rows] == sorted(row["user_id"] for row in rows)
+    assert set(by_email) == {"admin@example.com", "manager@example.com", "worker@example.com", "viewer@example.com"}
+    assert by_email["manager@example.com"]["owner"] is True
+    assert by_email["admin@example.com"]["admin"] is True
+    assert by_email["worker@example.com"]["direct_permission"] == "editor"
+    assert by_email["viewer@example.com"]["group_permission"] == "viewer"
+    assert by_email["viewer@example.com"]["permission"] == "viewer"
+
+    assert client.get(f"/access/report/projects/{project_id}", headers=login("worker")).status_code == 403
+
+
+def test_export_streams_every_page(client, login, user_id, monkeypatch):
+    project_id = setup_project(client, login, user_id)
+    manager = login("manager")
+    monkeypatch.setattr(access_report_service, "EXPORT_PAGE_SIZE", 1)
+
+    response = client.get(f"/access/report/projects/{project_id}/export", headers=manager)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    exported = [orjson.loads(line) for line in response.text.splitlines()]
+    assert exported == all_pages(client, manager, f"/access/report/projects/{project_id}", limit=100)
+
+    response = client.get(f"/access/report/users/{user_id('viewer')}/export", headers=login("viewer"))
+    assert [row["project_id"] for row in map(orjson.loads, response.text.splitlines())] == [project_id]
@@ -0,0 +1,43 @@
+import asyncio
+
+from app.core.admission import AdmissionMiddleware
+
+
+def scope(**extra) -> dict:
+    return {"type": "http", "method": "GET", "path": "/projects/1", "headers": [], **extra}
+
+
+def test_parallel_batch_items_take_their_own_slots():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = AdmissionMiddleware(app, limits={"read": (1, 0)}, queue_timeout=0.1, retry_after=1)
+
+        async def call(**extra) -> int:
+            statuses = []
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            async def receive():
+                return {"type": "http.request", "body": b""}
+
+            await middleware(scope(**extra), receive, send)
+            return statuses[0]
+
+        holder = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        # the only read slot is taken: a parallel item is refused, a sequential one rides on its batch
+        parallel = await asyncio.wait_for(call(batch="parallel"), 1)
+        sequential = asyncio.create_task(call(batch="sequential"))
+        await asyncio.sleep(0)
+        release.set()
+        return parallel, await sequential, await holder
+
+    assert asyncio.run(scenario()) == (503, 200, 200)
@@ -0,0 +1,69 @@
+import anyio
+import httpx
+
+from app.main import app
+
+
+def test_writes_proceed_while_an_upload_streams(client, login):
+    headers = login("manager")
+    project = client.post("/projects", json={"title": "Files"}, headers=headers).json()
+    document = client.post(f"/projects/{project['id']}/documents", json={"title": "Spec"}, headers=headers).json()
+
+    async def scenario():
+        streaming = anyio.Event()
+        release = anyio.Event()
+
+        async def body():
+            yield b"first chunk, "
+            streaming.set()
+            await release.wait()
+            yield b"last chunk"
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+            async with anyio.create_task_group() as tasks:
+                uploads = []
+
+                async def upload():
+                    uploads.append(await http.post(f"/documents/{document['id']}/attachments",
+                                                   params={"filename": "notes.txt"}, content=body(), headers=headers))
+
+                tasks.start_soon(upload)
+                await streaming.wait()
+                with anyio.fail_after(5):
+                    patched = await http.patch(f"/documents/{document['id']}", json={"content": "edited"}, headers=headers)
+                release.set()
+        return patched, uploads[0]
+
+    patched, uploaded = client.portal.call(scenario)
+    assert patched.status_code == 200, patched.text
+    assert uploaded.status_code == 201, uploaded.text
+    assert uploaded.json()["size"] == len(b"first chunk, last chunk")
+
+
+def test_ranged_and_conditional_downloads(client, login):
+    headers = login("manager")
+    project = client.post("/projects", json={"title": "Files"}, headers=headers).json()
+    document = client.post(f"/projects/{project['id']}/documents", json={"title": "Spec"}, headers=headers).json()
+    response = client.post(f"/documents/{document['id']}/attachments", params={"filename": "notes.txt"},
+                           content=b"0123456789", headers=headers)
+    assert response.status_code == 201, response.text
+    url = f"/documents/{document['id']}/attachments/{response.json()['id']}/content"
+
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+    etag = response.headers["etag"]
+
+    response = client.get(url, headers={**headers, "Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.content == b"2345"
+    assert response.headers["content-range"] == "bytes 2-5/10"
+
+    # a stale If-Range validator gets the whole file instead of the slice
+    response = client.get(url, headers={**headers, "Range": "bytes=2-5", "If-Range": '"stale"'})
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
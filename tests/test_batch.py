@@ -0,0 +1,32 @@
+from app.models.project import Project
+from app.services.project_service import ProjectService
+
+
+def test_failed_item_does_not_poison_the_shared_session(client, login, monkeypatch):
+    headers = login("manager")
+    existing = client.post("/projects", json={"title": "Existing"}, headers=headers).json()
+
+    create_project = ProjectService.create_project
+
+    def failing_create_project(self, project_data, owner):
+        if project_data.title == "Boom":
+            # primary key clash: the flush raises IntegrityError mid-transaction
+            self.session.add(Project(id=existing["id"], title="Boom", owner_id=owner.id))
+            self.session.flush()
+        return create_project(self, project_data, owner)
+
+    monkeypatch.setattr(ProjectService, "create_project", failing_create_project)
+
+    response = client.post("/batch", json={"requests": [
+        {"id": "1", "method": "POST", "path": "/projects", "body": {"title": "Boom"}},
+        {"id": "2", "method": "POST", "path": "/projects", "body": {"title": "Second"}},
+    ]}, headers=headers)
+
+    assert response.status_code == 200, response.text
+    first, second = response.json()["responses"]
+    assert first["status"] == 500
+    assert second["status"] == 201, second
+    assert second["body"]["title"] == "Second"
+
+    titles = {project["title"] for project in client.get("/projects/", headers=headers).json()}
+    assert titles == {"Existing", "Second"}
@@ -0,0 +1,54 @@
+def make_source(client, manager, worker_id) -> tuple[dict, dict]:
+    project = client.post("/projects", json={"title": "Template", "description": "Base"}, headers=manager).json()
+    document = client.post(f"/projects/{project['id']}/documents",
+                           json={"title": "Spec", "content": "v1"}, headers=manager).json()
+    client.patch(f"/documents/{document['id']}", json={"content": "v2"}, headers=manager)
+    client.post(f"/documents/{document['id']}/attachments", params={"filename": "a.txt"}, content=b"a", headers=manager)
+    client.post(f"/projects/{project['id']}/access/grant",
+                json={"user_id": worker_id, "permission": "viewer"}, headers=manager)
+    return project, document
+
+
+def cloned_document(client, headers, project_id) -> dict:
+    documents = client.get(f"/projects/{project_id}/documents", headers=headers).json()
+    assert len(documents) == 1
+    return documents[0]
+
+
+def test_clone_without_history_starts_at_version_one(client, login, user_id):
+    manager = login("manager")
+    source, document = make_source(client, manager, user_id("worker"))
+
+    response = client.post(f"/projects/{source['id']}/clone", json={"title": "Copy"}, headers=manager)
+    assert response.status_code == 201, response.text
+    clone = response.json()
+    assert (clone["title"], clone["description"]) == ("Copy", "Base")
+
+    copy = cloned_document(client, manager, clone["id"])
+    assert (copy["title"], copy["content"]) == ("Spec", "v2")
+    versions = client.get(f"/documents/{copy['id']}/versions", headers=manager).json()
+    assert [(version["version"], version["content_snapshot"]) for version in versions] == [(1, "v2")]
+    assert len(client.get(f"/documents/{copy['id']}/attachments", headers=manager).json()) == 1
+    # grants stay behind unless asked for
+    assert client.get(f"/projects/{clone['id']}", headers=login("worker")).status_code == 403
+    # the source is untouched
+    assert len(client.get(f"/documents/{document['id']}/versions", headers=manager).json()) == 2
+
+
+def test_clone_with_history_and_access(client, login, user_id):
+    manager = login("manager")
+    source, _ = make_source(client, manager, user_id("worker"))
+
+    response = client.post(f"/projects/{source['id']}/clone",
+                           json={"title": "Full copy", "include_history": True, "include_access": True}, headers=manager)
+    assert response.status_code == 201, response.text
+    clone = response.json()
+
+    copy = cloned_document(client, manager, clone["id"])
+    versions = client.get(f"/documents/{copy['id']}/versions", headers=manager).json()
+    assert sorted((version["version"], version["content_snapshot"]) for version in versions) == [(1, "v1"), (2, "v2")]
+    assert client.get(f"/projects/{clone['id']}", headers=login("worker")).status_code == 200
+    # copying grants needs manage permission on the source
+    response = client.post(f"/projects/{source['id']}/clone",
+                           json={"title": "Sneaky", "include_access": True}, headers=login("worker"))
+    assert response.status_code == 403
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlmodel import Session
+
+from app.core import deletion
+from app.core.config import settings
+from app.db.session import engine
+from app.models.project import Project
+from app.models.project_deletion import DeletionStatus, ProjectDeletion
+
+
+def add_job(client, login, **fields) -> int:
+    project = client.post("/projects", json={"title": "Doomed"}, headers=login("manager")).json()
+    with Session(engine) as session:
+        job = ProjectDeletion(project_id=project["id"], project_title=project["title"],
+                              requested_by=project["owner_id"], **fields)
+        session.add(job)
+        session.commit()
+        return job.id
+
+
+def test_a_job_is_claimed_once(client, login):
+    job_id = add_job(client, login)
+    with Session(engine) as session:
+        assert deletion._claim(session, job_id)
+        assert not deletion._claim(session, job_id)
+
+
+def test_a_running_job_is_reclaimed_only_after_its_heartbeat_times_out(client, login, monkeypatch):
+    now = datetime.now(timezone.utc)
+    job_id = add_job(client, login, status=DeletionStatus.running, claimed_by="other:1", heartbeat_at=now)
+    monkeypatch.setattr(deletion, "WORKER_ID", "this:2")
+
+    deletion.run_deletion(job_id)
+    with Session(engine) as session:
+        job = session.get(ProjectDeletion, job_id)
+        assert (job.status, job.claimed_by) == (DeletionStatus.running, "other:1")
+        job.heartbeat_at = now - timedelta(seconds=settings.DELETION_HEARTBEAT_TIMEOUT_SECONDS + 1)
+        session.add(job)
+        session.commit()
+
+    deletion.run_deletion(job_id)
+    with Session(engine) as session:
+        job = session.get(ProjectDeletion, job_id)
+        assert (job.status, job.claimed_by) == (DeletionStatus.done, "this:2")
+
+
+def test_documents_of_a_deleting_project_are_gone_for_admins_too(client, login, monkeypatch):
+    admin = login("admin")
+    project = client.post("/projects", json={"title": "Doomed"}, headers=admin).json()
+    document = client.post(f"/projects/{project['id']}/documents", json={"title": "Spec"}, headers=admin).json()
+    # hold the worker back, so the project stays flagged
+    monkeypatch.setattr(deletion.worker, "submit", lambda job_id: None)
+
+    response = client.delete(f"/projects/{project['id']}", headers=admin)
+    assert response.status_code == 202, response.text
+
+    assert client.get(f"/documents/{document['id']}", headers=admin).status_code == 404
+    assert client.get(f"/documents/{document['id']}", params={"details": True}, headers=admin).status_code == 404
+    assert client.get(f"/documents/{document['id']}", params={"fields": "title"}, headers=admin).status_code == 404
+    assert client.patch(f"/documents/{document['id']}", json={"content": "late"}, headers=admin).status_code == 404
+    response = client.post(f"/documents/{document['id']}/attachments", params={"filename": "late.txt"},
+                           content=b"late", headers=admin)
+    assert response.status_code == 404
+
+
+def test_delete_runs_to_done_in_chunks(client, login, user_id, monkeypatch):
+    monkeypatch.setattr(settings, "DELETION_CHUNK_SIZE", 1)
+    monkeypatch.setattr(settings, "DELETION_PAUSE_MS", 0)
+    manager = login("manager")
+    project = client.post("/projects", json={"title": "Doomed"}, headers=manager).json()
+    for title in ("First", "Second"):
+        document = client.post(f"/projects/{project['id']}/documents", json={"title": title}, headers=manager).json()
+        client.patch(f"/documents/{document['id']}", json={"content": "v2"}, headers=manager)
+    client.post(f"/documents/{document['id']}/attachments", params={"filename": "a.txt"}, content=b"a", headers=manager)
+    client.post(f"/projects/{project['id']}/access/grant",
+                json={"user_id": user_id("worker"), "permission": "viewer"}, headers=manager)
+
+    response = client.delete(f"/projects/{project['id']}", headers=manager)
+    assert response.status_code == 202, response.text
+    assert response.headers["location"] == f"/projects/{project['id']}/deletion"
+    assert response.json()["documents_total"] == 2
+    assert client.get(f"/projects/{project['id']}", headers=manager).status_code == 404
+
+    deletion.worker.join()
+    job = client.get(f"/projects/{project['id']}/deletion", headers=manager).json()
+    assert job["status"] == "done", job
+    assert (job["documents_deleted"], job["attachments_deleted"], job["grants_deleted"]) == (2, 1, 1)
+    assert job["versions_deleted"] == 4
+    with Session(engine) as session:
+        assert session.get(Project, project["id"]) is None
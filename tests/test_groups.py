@@ -0,0 +1,45 @@
+def test_group_membership_drives_effective_permission(client, login, user_id):
+    admin, manager, worker = login("admin"), login("manager"), login("worker")
+    project = client.post("/projects", json={"title": "Shared"}, headers=manager).json()
+    document = client.post(f"/projects/{project['id']}/documents", json={"title": "Spec"}, headers=manager).json()
+    group = client.post("/groups", json={"name": "Editors"}, headers=admin).json()
+    response = client.post(f"/projects/{project['id']}/access/groups",
+                           json={"group_id": group["id"], "permission": "editor"}, headers=manager)
+    assert response.status_code == 201, response.text
+    # a direct grant weaker than the group's
+    response = client.post(f"/projects/{project['id']}/access/grant",
+                           json={"user_id": user_id("worker"), "permission": "viewer"}, headers=manager)
+    assert response.status_code == 201, response.text
+
+    def edit() -> int:
+        return client.patch(f"/documents/{document['id']}", json={"content": "edit"}, headers=worker).status_code
+
+    assert edit() == 403
+
+    client.post(f"/groups/{group['id']}/members", json={"user_ids": [user_id("worker")]}, headers=admin)
+    # the strongest source wins
+    assert edit() == 200
+
+    client.delete(f"/groups/{group['id']}/members/{user_id('worker')}", headers=admin)
+    # back to the direct viewer grant
+    assert edit() == 403
+    assert client.get(f"/documents/{document['id']}", headers=worker).status_code == 200
+
+    client.post(f"/groups/{group['id']}/members", json={"user_ids": [user_id("worker")]}, headers=admin)
+    assert edit() == 200
+    response = client.delete(f"/projects/{project['id']}/access/groups/{group['id']}", headers=manager)
+    assert response.status_code == 204, response.text
+    assert edit() == 403
+
+
+def test_deleting_a_group_revokes_its_access(client, login, user_id):
+    admin, manager = login("admin"), login("manager")
+    project = client.post("/projects", json={"title": "Shared"}, headers=manager).json()
+    group = client.post("/groups", json={"name": "Readers"}, headers=admin).json()
+    client.post(f"/projects/{project['id']}/access/groups", json={"group_id": group["id"]}, headers=manager)
+    client.post(f"/groups/{group['id']}/members", json={"user_ids": [user_id("viewer")]}, headers=admin)
+    viewer = login("viewer")
+    assert client.get(f"/projects/{project['id']}", headers=viewer).status_code == 200
+
+    assert client.delete(f"/groups/{group['id']}", headers=admin).status_code == 204
+    assert client.get(f"/projects/{project['id']}", headers=viewer).status_code == 403
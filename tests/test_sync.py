@@ -0,0 +1,51 @@
+def sync(client, headers, since=0):
+    response = client.get("/sync", params={"since": since}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def project_tombstones(changes):
+    return {item["id"] for item in changes["deleted"] if item["entity_type"] == "project"}
+
+
+def test_group_membership_reaches_sync(client, login, user_id):
+    admin, manager, worker = login("admin"), login("manager"), login("worker")
+    project = client.post("/projects", json={"title": "Shared"}, headers=manager).json()
+    document = client.post(f"/projects/{project['id']}/documents", json={"title": "Spec"}, headers=manager).json()
+    group = client.post("/groups", json={"name": "Readers"}, headers=admin).json()
+    response = client.post(f"/projects/{project['id']}/access/groups", json={"group_id": group["id"]}, headers=manager)
+    assert response.status_code == 201, response.text
+
+    cursor = sync(client, worker)["next"]
+
+    # joining the group brings the project and the documents written before the cursor
+    response = client.post(f"/groups/{group['id']}/members", json={"user_ids": [user_id("worker")]}, headers=admin)
+    assert response.status_code == 200, response.text
+    changes = sync(client, worker, cursor)
+    assert [item["id"] for item in changes["projects"]] == [project["id"]]
+    assert [item["id"] for item in changes["documents"]] == [document["id"]]
+    cursor = changes["next"]
+
+    # leaving it removes the project again
+    response = client.delete(f"/groups/{group['id']}/members/{user_id('worker')}", headers=admin)
+    assert response.status_code == 204, response.text
+    changes = sync(client, worker, cursor)
+    assert project_tombstones(changes) == {project["id"]}
+    assert changes["projects"] == [] and changes["documents"] == []
+
+
+def test_project_tombstone_only_reaches_former_members(client, login, user_id):
+    manager, worker, viewer = login("manager"), login("worker"), login("viewer")
+    project = client.post("/projects", json={"title": "Private"}, headers=manager).json()
+    response = client.post(f"/projects/{project['id']}/access/grant",
+                           json={"user_id": user_id("worker"), "permission": "viewer"}, headers=manager)
+    assert response.status_code == 201, response.text
+    cursors = {name: sync(client, headers)["next"] for name, headers in
+               [("manager", manager), ("worker", worker), ("viewer", viewer)]}
+
+    response = client.delete(f"/projects/{project['id']}", headers=manager)
+    assert response.status_code == 202, response.text
+
+    assert project_tombstones(sync(client, manager, cursors["manager"])) == {project["id"]}
+    assert project_tombstones(sync(client, worker, cursors["worker"])) == {project["id"]}
+    assert project_tombstones(sync(client, viewer, cursors["viewer"])) == set()
@@ -0,0 +1,56 @@
+from sqlmodel import Session, SQLModel
+
+from app.db.session import create_db_and_tables, engine
+from app.models.document import Document
+from app.models.project import Project
+
+
+# columns added to tables that existed before them, per table
+LEGACY_COLUMNS = {
+    "documents": ["version_count", "source_document_id"],
+    "projects": ["draft_count", "published_count", "archived_count", "deleting"],
+    "project_deletions": ["claimed_by", "heartbeat_at"],
+}
+
+
+def build_legacy_database():
+    """Today's schema minus the columns an older release did not have, with some rows."""
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for table, columns in LEGACY_COLUMNS.items():
+            for column in columns:
+                connection.exec_driver_sql(f"ALTER TABLE {table} DROP COLUMN {column}")
+        connection.exec_driver_sql(
+            "INSERT INTO users (id, email, password_hash, role, is_active, created_at) "
+            "VALUES (1, 'old@example.com', 'x', 'manager', 1, '2024-01-01 00:00:00')"
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO projects (id, title, owner_id, created_at) VALUES (1, 'Old', 1, '2024-01-01 00:00:00')"
+        )
+        for document_id, status in [(1, "draft"), (2, "published"), (3, "published")]:
+            connection.exec_driver_sql(
+                "INSERT INTO documents (id, title, content, status, project_id, created_by, created_at, updated_at) "
+                f"VALUES ({document_id}, 'Doc {document_id}', '', '{status}', 1, 1, '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+            )
+        for version in (1, 2):
+            connection.exec_driver_sql(
+                "INSERT INTO document_versions (document_id, version, content_snapshot, created_by, created_at) "
+                f"VALUES (1, {version}, '', 1, '2024-01-01 00:00:00')"
+            )
+
+
+def test_startup_upgrades_a_legacy_database():
+    build_legacy_database()
+
+    create_db_and_tables()
+    # a second start finds nothing left to do
+    create_db_and_tables()
+
+    with Session(engine) as session:
+        project = session.get(Project, 1)
+        assert (project.draft_count, project.published_count, project.archived_count) == (1, 2, 0)
+        assert session.get(Document, 1).version_count == 2
+        assert session.get(Document, 2).version_count == 0
+        assert project.deleting is False
+        assert session.get(Document, 1).source_document_id is None